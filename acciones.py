@@ -1,16 +1,12 @@
 import streamlit as st
-import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
-import plotly.express as px
 from io import BytesIO
-from reportlab.lib.pagesizes import letter
-from reportlab.lib import colors
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-from reportlab.lib.units import inch
 from datetime import datetime
 
+from tasas import obtener_periodos_por_año, convertir_tea_a_tasa_periodica
+from src.calculations.retirement_calcs import IMPUESTOS, calcular_saldo_final_aportes
+
 # ==================== CONFIGURACIÓN ====================
 COLORES = {
     'aportes': '#3498db',
@@ -19,31 +15,11 @@ COLORES = {
     'pension': '#f39c12'
 }
 
-IMPUESTOS = {
-    'USD': 0.295,  # 29.5% para extranjera
-    'PEN': 0.05    # 5% para local
-}
-
-# ==================== FUNCIONES DE CONVERSIÓN DE TASAS ====================
-
-def obtener_periodos_por_año(frecuencia):
-    """Retorna el número de periodos por año según la frecuencia"""
-    frecuencias = {
-        "Mensual": 12,
-        "Trimestral": 4,
-        "Semestral": 2,
-        "Anual": 1
-    }
-    return frecuencias.get(frecuencia, 12)
+# Puntos por año del gráfico de depósito único (12 = curva mensual)
+PUNTOS_POR_AÑO_GRAFICO = 12
 
-def convertir_tea_a_tasa_periodica(tea, frecuencia):
-    """
-    Convierte TEA a tasa efectiva periódica usando fórmula de tasas equivalentes:
-    TEP = (1 + TEA)^(1/n) - 1
-    """
-    n = obtener_periodos_por_año(frecuencia)
-    tasa_periodica = (1 + tea) ** (1/n) - 1
-    return tasa_periodica
+# Resolución del eje de TEAs en el mapa de escenarios
+PUNTOS_TEA_ESCENARIOS = 200
 
 # ==================== VALIDACIONES ====================
 
@@ -71,81 +47,67 @@ def validar_edad(edad):
 
 # ==================== MÓDULO A: CRECIMIENTO DE CARTERA ====================
 
-def calcular_crecimiento_deposito_unico(monto_inicial, tea, plazo_años):
+def generar_malla_temporal(plazo_años, puntos_por_año=1):
+    """Retorna los instantes (en años) entre 0 y el plazo con puntos_por_año divisiones por año"""
+    return np.linspace(0, plazo_años, int(round(plazo_años * puntos_por_año)) + 1)
+
+def calcular_crecimiento_deposito_unico(monto_inicial, tea, plazo_años, tiempos=None):
     """
     Calcula el crecimiento con un único depósito inicial
-    VF = VA × (1 + r)^n
+    VF = VA × (1 + r)^t
+    
+    tiempos es una malla arbitraria en años (anual, mensual, diaria...);
+    por defecto se usan los años enteros 0, 1, ..., plazo_años.
     """
-    periodos = list(range(0, int(plazo_años) + 1))
-    saldos = []
-    aportes_acum = []
-    intereses_acum = []
-    
-    for año in periodos:
-        saldo = monto_inicial * ((1 + tea) ** año)
-        interes_ganado = saldo - monto_inicial
-        
-        saldos.append(saldo)
-        aportes_acum.append(monto_inicial)
-        intereses_acum.append(interes_ganado)
+    if tiempos is None:
+        tiempos = np.arange(int(plazo_años) + 1)
+    tiempos = np.asarray(tiempos, dtype=float)
+    
+    saldos = monto_inicial * np.power(1 + tea, tiempos)
+    aportes_acum = np.full(tiempos.shape, monto_inicial, dtype=float)
+    intereses_acum = saldos - monto_inicial
     
     return {
-        'periodos': periodos,
+        'periodos': tiempos,
         'saldos': saldos,
         'aportes_acumulados': aportes_acum,
         'intereses_acumulados': intereses_acum,
-        'saldo_final': saldos[-1],
+        'saldo_final': float(saldos[-1]),
         'total_aportado': monto_inicial,
-        'interes_total': saldos[-1] - monto_inicial
+        'interes_total': float(saldos[-1] - monto_inicial)
     }
 
 def calcular_crecimiento_aportes_periodicos(monto_inicial, aporte_periodico, tea, 
                                             frecuencia, plazo_años):
     """
     Calcula el crecimiento con aportes periódicos
-    Fórmula de anualidad con valor presente
+    Fórmula de anualidad con valor presente, evaluada para todos los periodos a la vez:
+    S_k = VA × (1 + r)^k + A × [(1 + r)^k - 1] / r
     """
     n_periodos_año = obtener_periodos_por_año(frecuencia)
     tasa_periodica = convertir_tea_a_tasa_periodica(tea, frecuencia)
     total_periodos = int(plazo_años * n_periodos_año)
     
-    # Generar tabla detallada
-    periodos = []
-    saldos_iniciales = []
-    aportes = []
-    intereses = []
-    saldos_finales = []
-    aportes_acumulados = []
-    intereses_acumulados = []
-    
-    saldo_actual = monto_inicial
-    total_aportado = monto_inicial
-    total_interes = 0
-    
-    for periodo in range(0, total_periodos + 1):
-        periodos.append(periodo)
-        saldos_iniciales.append(saldo_actual)
-        
-        if periodo == 0:
-            # Periodo 0: solo inversión inicial
-            aportes.append(monto_inicial)
-            intereses.append(0)
-            saldos_finales.append(monto_inicial)
-            aportes_acumulados.append(monto_inicial)
-            intereses_acumulados.append(0)
-        else:
-            # Calcular interés sobre saldo anterior
-            interes_periodo = saldo_actual * tasa_periodica
-            # Agregar aporte periódico
-            saldo_actual = saldo_actual + interes_periodo + aporte_periodico
-            total_aportado += aporte_periodico
-            total_interes += interes_periodo
-            
-            aportes.append(aporte_periodico)
-            intereses.append(interes_periodo)
-            saldos_finales.append(saldo_actual)
-            aportes_acumulados.append(total_aportado)
-            intereses_acumulados.append(total_interes)
+    periodos = np.arange(total_periodos + 1)
+    
+    # (1 + r)^k - 1 con expm1/log1p para no perder precisión con tasas pequeñas
+    crecimiento = np.expm1(periodos * np.log1p(tasa_periodica))
+    if tasa_periodica != 0:
+        factor_anualidad = crecimiento / tasa_periodica
+    else:
+        factor_anualidad = periodos.astype(float)
+    
+    saldos_finales = monto_inicial * (1 + crecimiento) + aporte_periodico * factor_anualidad
+    aportes_acumulados = monto_inicial + aporte_periodico * periodos.astype(float)
+    intereses_acumulados = saldos_finales - aportes_acumulados
+    
+    # Periodo 0: solo inversión inicial
+    saldos_iniciales = np.concatenate(([monto_inicial], saldos_finales[:-1])).astype(float)
+    aportes = np.full(total_periodos + 1, aporte_periodico, dtype=float)
+    aportes[0] = monto_inicial
+    intereses = saldos_iniciales * tasa_periodica
+    intereses[0] = 0.0
+    intereses_acumulados[0] = 0.0
     
     return {
         'periodos': periodos,
@@ -155,14 +117,30 @@ def calcular_crecimiento_aportes_periodicos(monto_inicial, aporte_periodico, tea
         'saldos_finales': saldos_finales,
         'aportes_acumulados': aportes_acumulados,
         'intereses_acumulados': intereses_acumulados,
-        'saldo_final': saldo_actual,
-        'total_aportado': total_aportado,
-        'interes_total': total_interes,
+        'saldo_final': float(saldos_finales[-1]),
+        'total_aportado': float(aportes_acumulados[-1]),
+        'interes_total': float(intereses_acumulados[-1]),
         'tasa_periodica': tasa_periodica,
         'frecuencia': frecuencia,
         'n_periodos_año': n_periodos_año
     }
 
+def calcular_matriz_escenarios(monto_inicial, aporte_periodico, frecuencia, edad_actual,
+                               edades_jubilacion, teas):
+    """
+    Calcula el saldo final para cada combinación edad de jubilación × TEA
+    en un solo broadcast de calcular_saldo_final_aportes
+    
+    Retorna una matriz (edades × TEAs); NaN donde la edad no supera la edad actual
+    """
+    n_periodos_año = obtener_periodos_por_año(frecuencia)
+    plazos = np.asarray(edades_jubilacion, dtype=float)[:, None] - edad_actual
+    total_periodos = np.maximum(plazos, 0) * n_periodos_año
+    tasas = convertir_tea_a_tasa_periodica(np.asarray(teas, dtype=float), frecuencia)[None, :]
+    saldos = calcular_saldo_final_aportes(monto_inicial, aporte_periodico, tasas, total_periodos)
+    
+    return np.where(plazos > 0, saldos, np.nan)
+
 # ==================== MÓDULO B: PROYECCIÓN DE JUBILACIÓN ====================
 
 def calcular_impuestos(capital_final, total_aportado, moneda):
@@ -222,7 +200,7 @@ def crear_grafico_crecimiento(resultados, moneda, tipo_inversion):
         fig.add_trace(go.Scatter(
             x=periodos,
             y=resultados['saldos'],
-            mode='lines+markers',
+            mode='lines+markers' if len(periodos) <= 100 else 'lines',
             name='Saldo Total',
             line=dict(color=COLORES['total'], width=3),
             marker=dict(size=6)
@@ -311,19 +289,99 @@ def crear_grafico_distribucion_final(total_aportado, interes_total, moneda):
     
     return fig
 
+def crear_grafico_bandas_montecarlo(simulacion, edad_actual, moneda, objetivo=None):
+    """Crea gráfico de abanico con las bandas de percentiles de la simulación"""
+    
+    edades = edad_actual + simulacion['años']
+    bandas = simulacion['bandas']
+    fig = go.Figure()
+    
+    # Bandas exteriores (5-95) e interiores (25-75) como áreas entre percentiles
+    for bajo, alto, opacidad in [(5, 95, 0.15), (25, 75, 0.3)]:
+        fig.add_trace(go.Scatter(
+            x=edades, y=bandas[bajo], mode='lines',
+            line=dict(width=0), showlegend=False, hoverinfo='skip'
+        ))
+        fig.add_trace(go.Scatter(
+            x=edades, y=bandas[alto], mode='lines',
+            line=dict(width=0), fill='tonexty',
+            fillcolor=f'rgba(231, 76, 60, {opacidad})',
+            name=f'Percentil {bajo}-{alto}',
+            hovertemplate=f'Edad: %{{x}}<br>P{alto}: {moneda}%{{y:,.2f}}<extra></extra>'
+        ))
+    
+    fig.add_trace(go.Scatter(
+        x=edades, y=bandas[50], mode='lines',
+        name='Mediana',
+        line=dict(color=COLORES['total'], width=3),
+        hovertemplate=f'Edad: %{{x}}<br>Mediana: {moneda}%{{y:,.2f}}<extra></extra>'
+    ))
+    
+    if objetivo:
+        fig.add_hline(y=objetivo, line_dash='dash', line_color=COLORES['pension'],
+                      annotation_text='Objetivo')
+    
+    fig.update_layout(
+        title='<b>Simulación Monte Carlo - Bandas de Saldo</b>',
+        xaxis_title='Edad',
+        yaxis_title=f'Saldo ({moneda})',
+        hovermode='x unified',
+        plot_bgcolor='white',
+        height=500,
+        yaxis=dict(tickformat=',')
+    )
+    fig.update_xaxes(gridcolor='lightgray')
+    fig.update_yaxes(gridcolor='lightgray')
+    
+    return fig
+
+def crear_grafico_supervivencia_retiro(simulacion, moneda):
+    """Crea gráfico con la probabilidad de conservar capital y el saldo mediano por edad"""
+    
+    fig = go.Figure()
+    
+    fig.add_trace(go.Scatter(
+        x=simulacion['edades'],
+        y=simulacion['probabilidad_supervivencia'] * 100,
+        mode='lines',
+        name='Probabilidad de conservar capital',
+        line=dict(color=COLORES['pension'], width=3, shape='hv'),
+        hovertemplate='Edad: %{x}<br>Probabilidad: %{y:.1f}%<extra></extra>'
+    ))
+    
+    fig.add_trace(go.Scatter(
+        x=simulacion['edades'],
+        y=simulacion['bandas'][50],
+        mode='lines',
+        name='Saldo mediano',
+        yaxis='y2',
+        line=dict(color=COLORES['total'], width=2, dash='dot'),
+        hovertemplate=f'Edad: %{{x}}<br>Saldo: {moneda}%{{y:,.2f}}<extra></extra>'
+    ))
+    
+    fig.update_layout(
+        title='<b>Duración del Capital durante el Retiro</b>',
+        xaxis_title='Edad',
+        yaxis=dict(title='Probabilidad (%)', range=[0, 105]),
+        yaxis2=dict(title=f'Saldo ({moneda})', overlaying='y', side='right',
+                    tickformat=',', rangemode='tozero'),
+        hovermode='x unified',
+        plot_bgcolor='white',
+        height=450,
+        legend=dict(orientation='h', y=-0.2)
+    )
+    fig.update_xaxes(gridcolor='lightgray')
+    fig.update_yaxes(gridcolor='lightgray')
+    
+    return fig
+
 def crear_grafico_comparacion_escenarios(capital_actual, edad_actual, tea, moneda):
     """Crea gráfico comparativo de diferentes edades de jubilación"""
     
     edades_jubilacion = [60, 62, 65, 67, 70]
-    saldos_finales = []
-    
-    for edad_jub in edades_jubilacion:
-        if edad_jub > edad_actual:
-            plazo = edad_jub - edad_actual
-            saldo = capital_actual * ((1 + tea) ** plazo)
-            saldos_finales.append(saldo)
-        else:
-            saldos_finales.append(0)
+    saldos_finales = np.nan_to_num(calcular_matriz_escenarios(
+        capital_actual, 0, "Anual", edad_actual, edades_jubilacion, [tea]
+    )[:, 0]).tolist()
     
     fig = go.Figure(data=[
         go.Bar(
@@ -352,10 +410,49 @@ def crear_grafico_comparacion_escenarios(capital_actual, edad_actual, tea, moned
     
     return fig
 
+def crear_mapa_calor_escenarios(edades_jubilacion, teas, saldos, moneda, escenario_actual=None):
+    """Crea mapa de calor del saldo final por edad de jubilación (filas) y TEA (columnas)"""
+    
+    fig = go.Figure(data=[go.Heatmap(
+        x=np.asarray(teas) * 100,
+        y=edades_jubilacion,
+        z=saldos,
+        colorscale='Viridis',
+        colorbar=dict(title=f"Saldo<br>({moneda})", tickformat=','),
+        hovertemplate=f'Edad: %{{y}}<br>TEA: %{{x:.2f}}%<br>Saldo: {moneda}%{{z:,.2f}}<extra></extra>'
+    )])
+    
+    if escenario_actual is not None:
+        edad, tea = escenario_actual
+        fig.add_trace(go.Scatter(
+            x=[tea * 100], y=[edad],
+            mode='markers',
+            marker=dict(color='white', size=12, symbol='x', line=dict(color='black', width=1)),
+            name='Tu escenario',
+            hovertemplate='Tu escenario<extra></extra>'
+        ))
+    
+    fig.update_layout(
+        title='<b>Saldo Final según Edad de Jubilación y TEA</b>',
+        xaxis_title='Tasa Efectiva Anual (%)',
+        yaxis_title='Edad de Jubilación',
+        height=550,
+        showlegend=False
+    )
+    
+    return fig
+
 # ==================== EXPORTACIÓN A PDF ====================
 
 def generar_pdf_completo(modulo_a_data, modulo_b_data, moneda, tipo_inversion_nombre="Inversión Nacional"):
     """Genera un reporte PDF completo con ambos módulos"""
+    # ReportLab solo se carga al exportar
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib import colors
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+    from reportlab.lib.units import inch
+    
     output = BytesIO()
     doc = SimpleDocTemplate(output, pagesize=letter, topMargin=0.5*inch)
     elements = []
@@ -474,10 +571,51 @@ def generar_pdf_completo(modulo_a_data, modulo_b_data, moneda, tipo_inversion_no
     output.seek(0)
     return output
 
+# ==================== SIMULACIÓN MONTE CARLO ====================
+
+@st.cache_data(max_entries=16)
+def obtener_simulacion_montecarlo(monto_inicial, aporte_periodico, tea, volatilidad,
+                                  frecuencia, plazo_años, num_simulaciones, objetivo, semilla,
+                                  _pool=None):
+    """
+    Simulación Monte Carlo cacheada por parámetros
+
+    _pool no forma parte de la clave: el resultado es el mismo con o sin él.
+    """
+    from simulacion_acciones import simular_aportes_montecarlo
+    
+    return simular_aportes_montecarlo(
+        monto_inicial, aporte_periodico, tea, volatilidad, frecuencia, plazo_años,
+        num_simulaciones=num_simulaciones, objetivo=objetivo, semilla=semilla, pool=_pool
+    )
+
+@st.cache_resource
+def obtener_pool_montecarlo():
+    """
+    Pool de procesos de la simulación Monte Carlo, creado una sola vez por
+    servidor y compartido entre sesiones y reruns
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from simulacion_acciones import NUM_PROCESOS
+    
+    return ProcessPoolExecutor(max_workers=NUM_PROCESOS)
+
+@st.cache_data(max_entries=64)
+def obtener_simulacion_retiro(capital_inicial, pension_mensual, tea, edad_jubilacion,
+                              volatilidad, inflacion, semilla):
+    """Simulación del retiro cacheada por parámetros"""
+    from simulacion_acciones import simular_retiro
+    
+    return simular_retiro(
+        capital_inicial, pension_mensual, tea, edad_jubilacion,
+        volatilidad=volatilidad, inflacion=inflacion, semilla=semilla
+    )
+
 # ==================== INTERFAZ PRINCIPAL ====================
 
 def mostrar_calculadora_acciones():
     """Interfaz principal de la calculadora de inversión en acciones"""
+    import pandas as pd
     
     st.header("📈 Calculadora de Inversión en Acciones para Jubilación")
     st.markdown("**Sistema de Planificación Financiera Integral**")
@@ -653,7 +791,10 @@ def mostrar_calculadora_acciones():
             else:
                 # Realizar cálculos
                 if tipo_inversion == "Depósito único":
-                    resultados = calcular_crecimiento_deposito_unico(monto_inicial, tea, plazo_años)
+                    resultados = calcular_crecimiento_deposito_unico(
+                        monto_inicial, tea, plazo_años,
+                        tiempos=generar_malla_temporal(plazo_años, PUNTOS_POR_AÑO_GRAFICO)
+                    )
                 else:
                     resultados = calcular_crecimiento_aportes_periodicos(
                         monto_inicial, aporte_periodico, tea, frecuencia, plazo_años
@@ -809,6 +950,63 @@ def mostrar_calculadora_acciones():
                 )
                 
                 st.info(f"📊 **Total de periodos:** {total_periodos} ({params['frecuencia'].lower()})")
+            
+            # Simulación Monte Carlo
+            st.markdown("---")
+            st.subheader("🎲 Simulación Monte Carlo")
+            st.markdown("En lugar de una TEA fija, simula miles de trayectorias con retornos anuales aleatorios.")
+            
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                volatilidad_pct = st.number_input(
+                    "Volatilidad Anual (%) ❓",
+                    min_value=0.0,
+                    max_value=60.0,
+                    value=15.0,
+                    step=1.0,
+                    help="Desviación estándar anual de los retornos (log)"
+                )
+            with col2:
+                num_simulaciones = st.select_slider(
+                    "Simulaciones",
+                    options=[1_000, 10_000, 100_000],
+                    value=10_000
+                )
+            with col3:
+                objetivo = st.number_input(
+                    f"Capital Objetivo ({moneda})",
+                    min_value=0.0,
+                    value=float(round(resultados['saldo_final'], -3)),
+                    step=1000.0
+                )
+            with col4:
+                semilla = st.number_input("Semilla", min_value=0, value=42, step=1)
+            
+            usar_procesos = st.checkbox(
+                "Repartir la simulación en varios procesos",
+                value=False,
+                help="Acelera las simulaciones grandes en servidores con varios núcleos"
+            )
+            simulacion = obtener_simulacion_montecarlo(
+                params['monto_inicial'], params['aporte_periodico'], params['tea'],
+                volatilidad_pct / 100, params['frecuencia'], params['plazo'],
+                num_simulaciones, objetivo, int(semilla),
+                _pool=obtener_pool_montecarlo() if usar_procesos else None
+            )
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Mediana Final", f"{moneda}{simulacion['bandas'][50][-1]:,.2f}")
+            with col2:
+                st.metric("Escenario Pesimista (P5)", f"{moneda}{simulacion['bandas'][5][-1]:,.2f}")
+            with col3:
+                st.metric("Probabilidad de Alcanzar el Objetivo",
+                          f"{simulacion['probabilidad_objetivo'] * 100:.1f}%")
+            
+            fig_montecarlo = crear_grafico_bandas_montecarlo(
+                simulacion, params['edad_actual'], moneda, objetivo
+            )
+            st.plotly_chart(fig_montecarlo, use_container_width=True)
     
     # ==================== MÓDULO B ====================
     with tab_modulo_b:
@@ -975,6 +1173,57 @@ def mostrar_calculadora_acciones():
                 - El capital principal se mantiene intacto
                 """)
             
+            # Simulación mes a mes del retiro
+            st.markdown("---")
+            st.subheader("📉 Simulación del Retiro")
+            st.markdown("Proyecta mes a mes cómo se consume el capital con retiros indexados a la inflación y retornos variables.")
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                inflacion_pct = st.slider(
+                    "Inflación Anual (%) ❓",
+                    min_value=0.0,
+                    max_value=10.0,
+                    value=0.0,
+                    step=0.25,
+                    help="La pensión se reajusta cada mes según esta inflación"
+                )
+            with col2:
+                volatilidad_retiro_pct = st.slider(
+                    "Volatilidad Anual (%) ❓",
+                    min_value=0.0,
+                    max_value=40.0,
+                    value=0.0,
+                    step=1.0,
+                    help="Con 0% el retorno es exactamente la TEA de retiro"
+                )
+            
+            simulacion_retiro = obtener_simulacion_retiro(
+                capital_neto, pension_mensual, tea_retiro, params_a['edad_jubilacion'],
+                volatilidad_retiro_pct / 100, inflacion_pct / 100, 42
+            )
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                edad_agotamiento = simulacion_retiro['edad_agotamiento_mediana']
+                st.metric(
+                    "Edad de Agotamiento (mediana)",
+                    f"{edad_agotamiento:.1f} años" if edad_agotamiento is not None else "No se agota"
+                )
+            with col2:
+                st.metric(
+                    "Probabilidad de Agotar el Capital",
+                    f"{simulacion_retiro['probabilidad_agotamiento'] * 100:.1f}%"
+                )
+            with col3:
+                st.metric(
+                    f"Saldo Mediano a los {simulacion_retiro['edades'][-1]} años",
+                    f"{moneda}{simulacion_retiro['bandas'][50][-1]:,.2f}"
+                )
+            
+            fig_retiro = crear_grafico_supervivencia_retiro(simulacion_retiro, moneda)
+            st.plotly_chart(fig_retiro, use_container_width=True)
+            
             # Guardar datos del módulo B
             st.session_state['resultados_modulo_b'] = {
                 'opcion_retiro': 'Pensión mensual',
@@ -1198,21 +1447,47 @@ def mostrar_calculadora_acciones():
         params_a = st.session_state['params_modulo_a']
         resultados_a = st.session_state['resultados_modulo_a']
         
-        st.markdown("### 🎯 Comparación por Edad de Jubilación")
+        st.markdown("### 🎯 Mapa de Escenarios: Edad de Jubilación × TEA")
         
-        fig_comparacion = crear_grafico_comparacion_escenarios(
-            resultados_a['saldo_final'],
-            params_a['edad_actual'],
-            params_a['tea'],
-            moneda
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            rango_edades = st.slider(
+                "Edades de jubilación",
+                min_value=params_a['edad_actual'] + 1,
+                max_value=max(100, params_a['edad_actual'] + 2),
+                value=(params_a['edad_actual'] + 1,
+                       min(params_a['edad_actual'] + 50, max(100, params_a['edad_actual'] + 2)))
+            )
+        
+        with col2:
+            rango_teas = st.slider(
+                "Rango de TEA (%)",
+                min_value=0.0,
+                max_value=50.0,
+                value=(1.0, 20.0),
+                step=0.5
+            )
+        
+        edades_escenarios = np.arange(rango_edades[0], rango_edades[1] + 1)
+        teas_escenarios = np.linspace(rango_teas[0], rango_teas[1], PUNTOS_TEA_ESCENARIOS) / 100
+        saldos_escenarios = calcular_matriz_escenarios(
+            params_a['monto_inicial'], params_a['aporte_periodico'], params_a['frecuencia'],
+            params_a['edad_actual'], edades_escenarios, teas_escenarios
+        )
+        
+        fig_comparacion = crear_mapa_calor_escenarios(
+            edades_escenarios, teas_escenarios, saldos_escenarios, moneda,
+            escenario_actual=(params_a['edad_jubilacion'], params_a['tea'])
         )
         st.plotly_chart(fig_comparacion, use_container_width=True)
         
         # Interpretación del gráfico
         st.info("""
-        **📖 Interpretación:** Este gráfico muestra cómo crece tu capital si sigues invirtiendo hasta diferentes edades de jubilación. 
-        Mientras más años mantengas tu inversión, mayor será el monto acumulado debido al interés compuesto. 
-        Por ejemplo, jubilarse a los 70 años en lugar de los 60 puede significar tener el doble o más de capital disponible.
+        **📖 Interpretación:** Cada celda muestra el capital acumulado al jubilarte a la edad indicada (eje vertical) 
+        con la TEA indicada (eje horizontal), manteniendo tu monto inicial y tus aportes. Los colores más claros 
+        indican mayor capital: avanzar hacia arriba (más años) o hacia la derecha (mejor tasa) lo incrementa, 
+        y la marca ✕ señala tu escenario actual.
         """, icon="💡")
         
         st.markdown("---")
@@ -1236,34 +1511,16 @@ def mostrar_calculadora_acciones():
             )
         
         if tea_comparar:
-            comparacion_data = []
-            
-            for tea_pct in tea_comparar:
-                tea = tea_pct / 100
-                
-                if params_a['tipo_inversion'] == "Depósito único":
-                    saldo = params_a['monto_inicial'] * ((1 + tea) ** años_comparar)
-                else:
-                    # Simplificación para aportes periódicos
-                    tasa_periodica = convertir_tea_a_tasa_periodica(tea, params_a['frecuencia'])
-                    n = obtener_periodos_por_año(params_a['frecuencia'])
-                    total_periodos = años_comparar * n
-                    
-                    # Valor futuro de anualidad
-                    if tasa_periodica > 0:
-                        vf_aportes = params_a['aporte_periodico'] * \
-                                    (((1 + tasa_periodica) ** total_periodos - 1) / tasa_periodica)
-                        vf_inicial = params_a['monto_inicial'] * ((1 + tasa_periodica) ** total_periodos)
-                        saldo = vf_inicial + vf_aportes
-                    else:
-                        saldo = params_a['monto_inicial'] + (params_a['aporte_periodico'] * total_periodos)
-                
-                comparacion_data.append({
-                    'TEA': f"{tea_pct}%",
-                    'Saldo Final': saldo
-                })
+            saldos_tea = calcular_matriz_escenarios(
+                params_a['monto_inicial'], params_a['aporte_periodico'], params_a['frecuencia'],
+                params_a['edad_actual'], [params_a['edad_actual'] + años_comparar],
+                np.array(tea_comparar) / 100
+            )[0]
             
-            df_comparacion = pd.DataFrame(comparacion_data)
+            df_comparacion = pd.DataFrame({
+                'TEA': [f"{tea_pct}%" for tea_pct in tea_comparar],
+                'Saldo Final': saldos_tea
+            })
             
             fig_tea = go.Figure(data=[
                 go.Bar(
@@ -1,6 +1,28 @@
+import os
+from io import BytesIO
+
 import streamlit as st
-from bono import mostrar_calculadora_bonos
-from acciones import mostrar_calculadora_acciones
+
+# Las calculadoras se importan al abrir su página: la portada no carga
+# pandas, Plotly ni las dependencias de exportación
+
+# ==================== RECURSOS ESTÁTICOS ====================
+
+RUTA_CODIGO_QR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "CodigoQR.jpeg")
+
+@st.cache_resource
+def cargar_codigo_qr(ruta=RUTA_CODIGO_QR):
+    """
+    Carga el código QR una sola vez por proceso (compartido entre sesiones):
+    la imagen decodificada y los bytes originales del archivo
+    """
+    from PIL import Image
+    
+    with open(ruta, "rb") as archivo:
+        contenido = archivo.read()
+    imagen = Image.open(BytesIO(contenido))
+    imagen.load()
+    return {'imagen': imagen, 'bytes': contenido}
 
 # Configuración de la página
 st.set_page_config(
@@ -29,21 +51,20 @@ st.sidebar.markdown("---")
 # Sección del código QR
 st.sidebar.markdown("### 📱 Acceda a nuestra aplicación")
 
-# Cargar y mostrar el código QR
+# Mostrar el código QR desde la caché (sin leer el disco en cada rerun)
 try:
-    from PIL import Image
-    qr_image = Image.open("CodigoQR.jpeg")
-    st.sidebar.image(qr_image, use_container_width=True)
+    codigo_qr = cargar_codigo_qr()
+    # Los bytes JPEG originales se sirven tal cual, sin recodificar la imagen
+    st.sidebar.image(codigo_qr['bytes'], use_container_width=True)
     
     # Botón para descargar el QR
-    with open("CodigoQR.jpeg", "rb") as file:
-        st.sidebar.download_button(
-            label="⬇️ Descargar Código QR",
-            data=file,
-            file_name="CodigoQR_FinanzasApp.jpeg",
-            mime="image/jpeg",
-            use_container_width=True
-        )
+    st.sidebar.download_button(
+        label="⬇️ Descargar Código QR",
+        data=codigo_qr['bytes'],
+        file_name="CodigoQR_FinanzasApp.jpeg",
+        mime="image/jpeg",
+        use_container_width=True
+    )
 except Exception as e:
     st.sidebar.error("No se pudo cargar el código QR")
 
@@ -139,9 +160,11 @@ if opcion == "🏠 Inicio":
         """)
 
 elif opcion == "📊 Bonos":
+    from bono import mostrar_calculadora_bonos
     mostrar_calculadora_bonos()
 
 elif opcion == "📈 Acciones":
+    from acciones import mostrar_calculadora_acciones
     mostrar_calculadora_acciones()
 
 # Footer
@@ -0,0 +1,305 @@
+"""
+Suite de benchmarks de las rutas críticas de bonos y jubilación
+
+Cada benchmark mide una función con entradas fijas (y semillas fijas) y se
+compara contra la referencia guardada en benchmarks_referencia.json: se
+considera regresión cuando el mejor tiempo de las repeticiones (el menos
+afectado por el ruido de la máquina) supera el de la referencia en más de la
+tolerancia (por defecto 50%).
+
+Uso:
+    python benchmarks.py                     # medir y comparar con la referencia
+    python benchmarks.py -k bono pdf         # solo los benchmarks cuyo nombre contiene 'bono' o 'pdf'
+    python benchmarks.py --guardar           # medir y guardar como nueva referencia
+    python benchmarks.py --tolerancia 0.25   # umbral de regresión más estricto
+
+La referencia depende de la máquina: regenérela con --guardar en el equipo
+donde se vaya a comparar (CI o estación de trabajo) antes de usarla.
+Retorna código 1 si algún benchmark presenta regresión.
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import timeit
+
+import numpy as np
+
+RUTA_REFERENCIA = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmarks_referencia.json')
+
+# Regresión: mínimo > mínimo de referencia × (1 + TOLERANCIA_REGRESION)
+TOLERANCIA_REGRESION = 0.5
+
+# Benchmarks más ruidosos (render completo de Streamlit) con umbral propio
+TOLERANCIAS_BENCHMARK = {
+    'pagina_bonos': 1.0,
+    'pagina_acciones_modulo_a': 1.0
+}
+
+# Repeticiones por benchmark (se comparan los mínimos) y duración mínima de cada una
+REPETICIONES = 5
+TIEMPO_MINIMO_REPETICION_S = 0.2
+
+BENCHMARKS = {}
+
+
+def benchmark(funcion):
+    """Registra un benchmark: funcion() prepara los datos y retorna el callable a medir"""
+    BENCHMARKS[funcion.__name__] = funcion
+    return funcion
+
+# ==================== BONOS ====================
+
+@benchmark
+def bono_completo_mensual_50_años():
+    from src.calculations.bond_calcs import calcular_valor_presente_bono_completo
+    return lambda: calcular_valor_presente_bono_completo(20000.0, 0.10, "Mensual", 50, 0.12)
+
+
+@benchmark
+def precio_bono_cerrado():
+    from src.calculations.bond_calcs import calcular_precio_bono
+    return lambda: calcular_precio_bono(20000.0, 0.10, "Semestral", 10, 0.12)
+
+
+@benchmark
+def barrido_sensibilidad_500_tasas():
+    from src.calculations.bond_calcs import calcular_precio_bono
+    tasas = np.linspace(0.07, 0.17, 500)
+    return lambda: calcular_precio_bono(20000.0, 0.10, "Mensual", 50, tasas)
+
+
+@benchmark
+def grafico_sensibilidad_500_tasas():
+    """La misma llamada que obtener_grafico_sensibilidad (con la valoración de la página)"""
+    from bono import calcular_valor_presente_bono_completo, crear_grafico_sensibilidad_tasa
+    resultado = calcular_valor_presente_bono_completo(20000.0, 0.10, "Mensual", 50, 0.12)
+    return lambda: crear_grafico_sensibilidad_tasa(
+        20000.0, 0.10, "Mensual", 50, 0.12, num_puntos=500, resultados=resultado
+    )
+
+
+@benchmark
+def cartera_100k_bonos():
+    from src.calculations.bond_calcs import calcular_valor_presente_bonos_lote
+    rng = np.random.default_rng(2024)
+    bonos = {
+        'valor_nominal': rng.choice([1000.0, 10000.0, 20000.0], 100_000),
+        'tasa_cupon_anual': rng.uniform(0.0, 0.15, 100_000),
+        'frecuencia': rng.choice(["Mensual", "Trimestral", "Semestral", "Anual"], 100_000),
+        'plazo_años': rng.integers(1, 31, 100_000).astype(float),
+        'tasa_descuento_anual': rng.uniform(0.01, 0.20, 100_000)
+    }
+    return lambda: calcular_valor_presente_bonos_lote(bonos)
+
+# ==================== EXPORTACIONES ====================
+
+def preparar_detalle_bono():
+    from bono import calcular_valor_presente_bono_completo, crear_tabla_detalle_bono
+    resultado = calcular_valor_presente_bono_completo(20000.0, 0.10, "Mensual", 50, 0.12)
+    return resultado, crear_tabla_detalle_bono(resultado)
+
+
+@benchmark
+def excel_pagos_600_filas():
+    from bono import generar_excel_pagos
+    resultado, df_detalle = preparar_detalle_bono()
+    return lambda: generar_excel_pagos(
+        df_detalle, 20000.0, 0.10, 0.12, resultado['valor_presente_total'], "Mensual"
+    )
+
+
+@benchmark
+def pdf_pagos_600_filas():
+    from bono import generar_pdf_pagos
+    resultado, df_detalle = preparar_detalle_bono()
+    return lambda: generar_pdf_pagos(
+        df_detalle, 20000.0, 0.10, 0.12, resultado['valor_presente_total'],
+        "Mensual", resultado['cupon_periodico']
+    )
+
+# ==================== JUBILACIÓN ====================
+
+@benchmark
+def aportes_periodicos_mensual_40_años():
+    from acciones import calcular_crecimiento_aportes_periodicos
+    return lambda: calcular_crecimiento_aportes_periodicos(3000.0, 150.0, 0.12, "Mensual", 40)
+
+
+@benchmark
+def planes_jubilacion_100k():
+    from src.calculations.retirement_calcs import calcular_planes_jubilacion_lote
+    rng = np.random.default_rng(2024)
+    edad_actual = rng.integers(18, 60, 100_000)
+    planes = {
+        'edad_actual': edad_actual,
+        'edad_jubilacion': edad_actual + rng.integers(1, 40, 100_000),
+        'monto_inicial': rng.uniform(0, 50000, 100_000),
+        'aporte_periodico': rng.uniform(0, 2000, 100_000),
+        'frecuencia': rng.choice(["Mensual", "Trimestral", "Semestral", "Anual"], 100_000),
+        'tea': rng.uniform(0.0, 0.50, 100_000),
+        'moneda': rng.choice(["PEN", "USD"], 100_000),
+        'opcion_retiro': rng.choice(["Retiro único", "Pensión mensual"], 100_000)
+    }
+    return lambda: calcular_planes_jubilacion_lote(planes)
+
+# ==================== PÁGINAS COMPLETAS ====================
+
+def silenciar_streamlit():
+    """Streamlit sin servidor advierte en cada caché y rerun; no aporta a la medición"""
+    import streamlit  # noqa: F401  (crea sus loggers)
+    for nombre in list(logging.root.manager.loggerDict):
+        if nombre.startswith('streamlit'):
+            logging.getLogger(nombre).setLevel(logging.ERROR)
+
+
+def crear_app_test(codigo, session_state=None):
+    """AppTest de la página ya ejecutada una vez (la primera ejecución carga la configuración)"""
+    from streamlit.testing.v1 import AppTest
+    app = AppTest.from_string(codigo, default_timeout=120)
+    for clave, valor in (session_state or {}).items():
+        app.session_state[clave] = valor
+    app.run()
+    silenciar_streamlit()
+    return app
+
+
+@benchmark
+def pagina_bonos():
+    app = crear_app_test("from bono import mostrar_calculadora_bonos\nmostrar_calculadora_bonos()")
+    return app.run
+
+
+@benchmark
+def pagina_acciones_modulo_a():
+    app = crear_app_test(
+        "from acciones import mostrar_calculadora_acciones\nmostrar_calculadora_acciones()",
+        {'moneda_seleccionada': 'PEN', 'simbolo_moneda': '$'}
+    )
+
+    def calcular():
+        boton = next(b for b in app.button if b.label.endswith("Calcular Crecimiento"))
+        boton.click().run()
+
+    return calcular
+
+# ==================== MEDICIÓN Y COMPARACIÓN ====================
+
+def medir(funcion, repeticiones=REPETICIONES, tiempo_minimo=TIEMPO_MINIMO_REPETICION_S):
+    """
+    Mide una función sin argumentos
+
+    Cada repetición ejecuta la función tantas veces como haga falta para
+    durar al menos tiempo_minimo (calibrado una vez, tras una ejecución de
+    calentamiento).
+
+    Returns:
+        dict: 'mediana_s' y 'minimo_s' por llamada, 'llamadas' por repetición
+    """
+    funcion()
+    temporizador = timeit.Timer(funcion)
+    llamadas = 1
+    while temporizador.timeit(llamadas) < tiempo_minimo and llamadas < 1_000_000:
+        llamadas *= 10
+    tiempos = [t / llamadas for t in temporizador.repeat(repeticiones, llamadas)]
+    return {'mediana_s': statistics.median(tiempos), 'minimo_s': min(tiempos), 'llamadas': llamadas}
+
+
+def comparar_con_referencia(resultados, referencia, tolerancia=TOLERANCIA_REGRESION):
+    """
+    Compara los mejores tiempos medidos con los de la referencia
+
+    Args:
+        resultados (dict): nombre → resultado de medir
+        referencia (dict): nombre → resultado de medir guardado
+        tolerancia (float): Fracción de aumento permitida (salvo los de TOLERANCIAS_BENCHMARK)
+
+    Returns:
+        dict: nombre → (razón medido/referencia o None si no hay referencia, es_regresion)
+    """
+    comparacion = {}
+    for nombre, resultado in resultados.items():
+        if nombre not in referencia:
+            comparacion[nombre] = (None, False)
+            continue
+        razon = resultado['minimo_s'] / referencia[nombre]['minimo_s']
+        comparacion[nombre] = (razon, razon > 1 + TOLERANCIAS_BENCHMARK.get(nombre, tolerancia))
+    return comparacion
+
+
+def cargar_referencia(ruta=RUTA_REFERENCIA):
+    if not os.path.exists(ruta):
+        return {}
+    with open(ruta, encoding='utf-8') as archivo:
+        return json.load(archivo)['benchmarks']
+
+
+def guardar_referencia(resultados, ruta=RUTA_REFERENCIA):
+    """Guarda (fusionando con la existente) la referencia y la máquina donde se midió"""
+    benchmarks = {**cargar_referencia(ruta), **resultados}
+    with open(ruta, 'w', encoding='utf-8') as archivo:
+        json.dump({
+            'maquina': {
+                'python': platform.python_version(),
+                'numpy': np.__version__,
+                'procesador': platform.processor() or platform.machine(),
+                'cpus': os.cpu_count()
+            },
+            'benchmarks': dict(sorted(benchmarks.items()))
+        }, archivo, indent=2, ensure_ascii=False)
+        archivo.write('\n')
+
+
+def formatear_tiempo(segundos):
+    if segundos < 1e-3:
+        return f"{segundos * 1e6:9.1f} µs"
+    if segundos < 1:
+        return f"{segundos * 1e3:9.2f} ms"
+    return f"{segundos:9.3f} s "
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks de bonos y jubilación")
+    parser.add_argument('-k', dest='filtros', nargs='*', default=[],
+                        help="Solo benchmarks cuyo nombre contenga alguno de estos textos")
+    parser.add_argument('--guardar', action='store_true', help="Guardar los tiempos como referencia")
+    parser.add_argument('--tolerancia', type=float, default=TOLERANCIA_REGRESION,
+                        help="Aumento permitido sobre la referencia (default: %(default)s)")
+    parser.add_argument('--repeticiones', type=int, default=REPETICIONES,
+                        help="Repeticiones por benchmark (default: %(default)s)")
+    args = parser.parse_args(argv)
+    silenciar_streamlit()
+
+    nombres = [n for n in BENCHMARKS if not args.filtros or any(f in n for f in args.filtros)]
+    if not nombres:
+        parser.error("Ningún benchmark coincide con los filtros")
+
+    referencia = cargar_referencia()
+    resultados = {}
+    for nombre in nombres:
+        resultados[nombre] = medir(BENCHMARKS[nombre](), args.repeticiones)
+        razon, es_regresion = comparar_con_referencia(
+            {nombre: resultados[nombre]}, referencia, args.tolerancia
+        )[nombre]
+        estado = "sin referencia" if razon is None else f"{razon:5.2f}× ref"
+        marca = "  <-- REGRESIÓN" if es_regresion else ""
+        print(f"{nombre:<36} {formatear_tiempo(resultados[nombre]['minimo_s'])} "
+              f"(mediana {formatear_tiempo(resultados[nombre]['mediana_s']).strip()})  {estado}{marca}")
+
+    if args.guardar:
+        guardar_referencia(resultados)
+        print(f"Referencia guardada en {RUTA_REFERENCIA}")
+        return 0
+
+    regresiones = [n for n, (_, r) in comparar_con_referencia(resultados, referencia, args.tolerancia).items() if r]
+    if regresiones:
+        print(f"\n{len(regresiones)} regresiones: {', '.join(regresiones)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
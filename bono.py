@@ -1,17 +1,38 @@
+import logging
+import time
 import streamlit as st
-import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
 from io import BytesIO
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.lib import colors
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Image
-from reportlab.lib.units import inch
 from datetime import datetime, timedelta
+from functools import partial
 import plotly.graph_objects as go
-import plotly.express as px
+
+# pandas, matplotlib, openpyxl y ReportLab se importan dentro de las funciones
+# que los usan: solo se cargan al valorar un bono, al dibujar el diagrama
+# estático o al exportar
+
+# Conversión de tasas compartida (se reexporta para los módulos que la importan desde bono)
+from tasas import obtener_periodos_por_año, convertir_tea_a_tasa_periodica
+
+# Núcleo numérico (sin dependencias de interfaz), reexportado para los importadores de bono
+from src.calculations.bond_calcs import (
+    calcular_cupon_periodico,
+    generar_flujos_de_caja,
+    calcular_valor_presente_flujos,
+    calcular_arreglos_bono,
+    calcular_medidas_riesgo_bono,
+    aproximar_precio_bono,
+    calcular_valor_presente_bono_completo,
+    calcular_factor_anualidad,
+    calcular_factor_anualidad_creciente,
+    calcular_vp_bono_cerrado,
+    calcular_precio_bono,
+    preparar_especificaciones_bonos,
+    calcular_valor_presente_bonos_lote,
+    COLUMNAS_LOTE_BONOS,
+    MAX_CELDAS_BLOQUE
+)
+from rendimiento_bono import calcular_tea_desde_precio
 
 # ==================== CONFIGURACIÓN DE ESTILOS ====================
 COLORES = {
@@ -26,41 +47,16 @@ COLORES = {
     'valor_nominal': '#3498db'
 }
 
-# ==================== FUNCIONES DE CONVERSIÓN DE TASAS ====================
+# Resolución por defecto del barrido de sensibilidad (número de tasas evaluadas)
+PUNTOS_SENSIBILIDAD = 500
 
-def obtener_periodos_por_año(frecuencia):
-    """
-    Retorna el número de periodos por año según la frecuencia de pago
-    """
-    frecuencias = {
-        "Mensual": 12,
-        "Bimestral": 6,
-        "Trimestral": 4,
-        "Cuatrimestral": 3,
-        "Semestral": 2,
-        "Anual": 1
-    }
-    return frecuencias.get(frecuencia, 1)
+# Banda de TEA (± alrededor de la tasa base) donde se dibuja la aproximación
+# de duración y convexidad
+BANDA_APROXIMACION_SENSIBILIDAD = 0.01
 
-def convertir_tea_a_tasa_periodica(tea, frecuencia):
-    """
-    Convierte una Tasa Efectiva Anual (TEA) a tasa efectiva periódica
-    usando la fórmula de tasas equivalentes:
-    
-    TEP = (1 + TEA)^(1/n) - 1
-    
-    donde n es el número de periodos por año
-    
-    Args:
-        tea (float): Tasa Efectiva Anual en decimal (ej: 0.10 para 10%)
-        frecuencia (str): Frecuencia de pago del cupón
-    
-    Returns:
-        float: Tasa efectiva periódica en decimal
-    """
-    n = obtener_periodos_por_año(frecuencia)
-    tasa_periodica = (1 + tea) ** (1/n) - 1
-    return tasa_periodica
+logger = logging.getLogger(__name__)
+
+# ==================== VALIDACIONES ====================
 
 def validar_tasa(tasa, nombre_tasa):
     """
@@ -109,122 +105,6 @@ def validar_valor_positivo(valor, nombre_campo):
         return False, f"❌ {nombre_campo} debe ser mayor a cero"
     return True, ""
 
-# ==================== FUNCIONES DE CÁLCULO DEL BONO ====================
-
-def calcular_cupon_periodico(valor_nominal, tasa_cupon_anual, frecuencia):
-    """
-    Calcula el cupón periódico del bono
-    
-    Args:
-        valor_nominal (float): Valor nominal del bono
-        tasa_cupon_anual (float): TEA del cupón en decimal
-        frecuencia (str): Frecuencia de pago del cupón
-    
-    Returns:
-        float: Cupón periódico
-    """
-    tasa_cupon_periodica = convertir_tea_a_tasa_periodica(tasa_cupon_anual, frecuencia)
-    cupon_periodico = valor_nominal * tasa_cupon_periodica
-    return cupon_periodico
-
-def generar_flujos_de_caja(valor_nominal, cupon_periodico, num_periodos):
-    """
-    Genera todos los flujos de caja del bono
-    
-    Args:
-        valor_nominal (float): Valor nominal del bono
-        cupon_periodico (float): Cupón periódico
-        num_periodos (int): Número total de periodos
-    
-    Returns:
-        list: Lista de flujos de caja por periodo
-    """
-    flujos = []
-    
-    for periodo in range(1, num_periodos + 1):
-        if periodo < num_periodos:
-            # Periodos intermedios: solo cupón
-            flujos.append(cupon_periodico)
-        else:
-            # Último periodo: cupón + valor nominal
-            flujos.append(cupon_periodico + valor_nominal)
-    
-    return flujos
-
-def calcular_valor_presente_flujos(flujos, tasa_descuento_periodica):
-    """
-    Calcula el valor presente de cada flujo de caja
-    
-    Args:
-        flujos (list): Lista de flujos de caja
-        tasa_descuento_periodica (float): Tasa de descuento periódica en decimal
-    
-    Returns:
-        list: Lista de valores presentes de cada flujo
-    """
-    valores_presentes = []
-    
-    for periodo, flujo in enumerate(flujos, start=1):
-        vp = flujo / ((1 + tasa_descuento_periodica) ** periodo)
-        valores_presentes.append(vp)
-    
-    return valores_presentes
-
-def calcular_valor_presente_bono_completo(valor_nominal, tasa_cupon_anual, frecuencia, 
-                                          plazo_años, tasa_descuento_anual):
-    """
-    Calcula el valor presente total del bono y genera desglose completo
-    
-    Args:
-        valor_nominal (float): Valor nominal del bono en USD
-        tasa_cupon_anual (float): TEA del cupón en decimal
-        frecuencia (str): Frecuencia de pago
-        plazo_años (float): Plazo al vencimiento en años
-        tasa_descuento_anual (float): TEA de descuento en decimal
-    
-    Returns:
-        dict: Diccionario con todos los cálculos y resultados
-    """
-    # Calcular número de periodos
-    periodos_por_año = obtener_periodos_por_año(frecuencia)
-    num_periodos = int(plazo_años * periodos_por_año)
-    
-    # Convertir tasas anuales a periódicas
-    tasa_cupon_periodica = convertir_tea_a_tasa_periodica(tasa_cupon_anual, frecuencia)
-    tasa_descuento_periodica = convertir_tea_a_tasa_periodica(tasa_descuento_anual, frecuencia)
-    
-    # Calcular cupón periódico
-    cupon_periodico = calcular_cupon_periodico(valor_nominal, tasa_cupon_anual, frecuencia)
-    
-    # Generar flujos de caja
-    flujos = generar_flujos_de_caja(valor_nominal, cupon_periodico, num_periodos)
-    
-    # Calcular valores presentes
-    valores_presentes = calcular_valor_presente_flujos(flujos, tasa_descuento_periodica)
-    
-    # Valor presente total del bono
-    valor_presente_total = sum(valores_presentes)
-    
-    # Calcular VP acumulado
-    vp_acumulado = []
-    suma = 0
-    for vp in valores_presentes:
-        suma += vp
-        vp_acumulado.append(suma)
-    
-    # Retornar diccionario con todos los resultados
-    return {
-        'valor_presente_total': valor_presente_total,
-        'cupon_periodico': cupon_periodico,
-        'tasa_cupon_periodica': tasa_cupon_periodica,
-        'tasa_descuento_periodica': tasa_descuento_periodica,
-        'num_periodos': num_periodos,
-        'periodos_por_año': periodos_por_año,
-        'flujos': flujos,
-        'valores_presentes': valores_presentes,
-        'vp_acumulado': vp_acumulado
-    }
-
 # ==================== FUNCIONES DE VISUALIZACIÓN ====================
 
 def crear_diagrama_flujo_interactivo(resultados, valor_nominal, frecuencia):
@@ -238,7 +118,7 @@ def crear_diagrama_flujo_interactivo(resultados, valor_nominal, frecuencia):
     
     # Preparar datos
     periodos = list(range(0, num_periodos + 1))
-    valores_flujo = [-vp_total] + flujos
+    valores_flujo = np.concatenate(([-vp_total], flujos))
     
     # Crear figura
     fig = go.Figure()
@@ -381,7 +261,7 @@ def crear_grafico_composicion_flujos(resultados, valor_nominal):
     valores_presentes = resultados['valores_presentes']
     
     # Calcular VP de cupones y VP del principal
-    vp_cupones = sum(valores_presentes[:-1])
+    vp_cupones = valores_presentes[:-1].sum()
     vp_principal = valores_presentes[-1] - (cupon / ((1 + resultados['tasa_descuento_periodica']) ** num_periodos))
     vp_ultimo_cupon = cupon / ((1 + resultados['tasa_descuento_periodica']) ** num_periodos)
     
@@ -406,21 +286,29 @@ def crear_grafico_composicion_flujos(resultados, valor_nominal):
     return fig
 
 def crear_grafico_sensibilidad_tasa(valor_nominal, tasa_cupon_anual, frecuencia, 
-                                     plazo_años, tasa_descuento_base):
+                                     plazo_años, tasa_descuento_base, num_puntos=PUNTOS_SENSIBILIDAD,
+                                     resultados=None):
     """
     Crea un gráfico de sensibilidad del precio del bono ante cambios en la tasa de descuento
+    
+    Todas las tasas del barrido (y la tasa base) se valoran en una sola
+    llamada vectorizada con la fórmula cerrada, por lo que la resolución
+    (num_puntos) puede ser alta sin costo apreciable. Si se pasan los
+    resultados de calcular_valor_presente_bono_completo, se agrega como
+    referencia la aproximación de duración y convexidad, solo en la banda de
+    ±BANDA_APROXIMACION_SENSIBILIDAD alrededor de la tasa base (lejos de ella
+    la parábola se aparta del precio real).
     """
     # Rango de tasas de descuento (+/- 5% de la tasa base)
     tasas = np.linspace(max(0.01, tasa_descuento_base - 0.05), 
-                       min(0.50, tasa_descuento_base + 0.05), 50)
-    
-    valores_bono = []
+                       min(0.50, tasa_descuento_base + 0.05), num_puntos)
     
-    for tasa in tasas:
-        resultado = calcular_valor_presente_bono_completo(
-            valor_nominal, tasa_cupon_anual, frecuencia, plazo_años, tasa
-        )
-        valores_bono.append(resultado['valor_presente_total'])
+    # Barrido completo + punto actual en una sola evaluación
+    valores = calcular_precio_bono(
+        valor_nominal, tasa_cupon_anual, frecuencia, plazo_años,
+        np.append(tasas, tasa_descuento_base)
+    )
+    valores_bono, valor_actual = valores[:-1], valores[-1]
     
     fig = go.Figure()
     
@@ -435,19 +323,27 @@ def crear_grafico_sensibilidad_tasa(valor_nominal, tasa_cupon_anual, frecuencia,
     ))
     
     # Punto actual
-    resultado_actual = calcular_valor_presente_bono_completo(
-        valor_nominal, tasa_cupon_anual, frecuencia, plazo_años, tasa_descuento_base
-    )
-    
     fig.add_trace(go.Scatter(
         x=[tasa_descuento_base * 100],
-        y=[resultado_actual['valor_presente_total']],
+        y=[valor_actual],
         mode='markers',
         name='Tasa Actual',
         marker=dict(size=15, color='red', symbol='star'),
         hovertemplate='<b>Tasa Actual</b><br>TEA: %{x:.2f}%<br>Valor: $%{y:,.2f}<extra></extra>'
     ))
     
+    if resultados is not None:
+        # Aproximación de segundo orden, solo cerca de la tasa base
+        tasas_banda = tasas[np.abs(tasas - tasa_descuento_base) <= BANDA_APROXIMACION_SENSIBILIDAD]
+        fig.add_trace(go.Scatter(
+            x=tasas_banda * 100,
+            y=aproximar_precio_bono(resultados, tasas_banda),
+            mode='lines',
+            name='Aproximación (duración + convexidad)',
+            line=dict(color=COLORES['inversion'], width=2, dash='dot'),
+            hovertemplate='<b>TEA: %{x:.2f}%</b><br>Aproximación: $%{y:,.2f}<extra></extra>'
+        ))
+    
     # Línea de referencia del valor nominal
     fig.add_hline(
         y=valor_nominal,
@@ -469,16 +365,14 @@ def crear_grafico_sensibilidad_tasa(valor_nominal, tasa_cupon_anual, frecuencia,
     )
     
     return fig
-    
-    # Valor presente total
-    vp_total = vp_cupones + vp_nominal
-    
-    return vp_total, cupon
 
 def crear_diagrama_flujo_efectivo(tiempo, cupon, valor_nominal, vp_bono, periodo):
     """
     Crea un diagrama visual de flujo de efectivo similar a la imagen proporcionada
     """
+    import matplotlib.pyplot as plt
+    import matplotlib.patches as mpatches
+    
     fig, ax = plt.subplots(figsize=(14, 6))
     
     # Configurar límites y estilo
@@ -558,60 +452,114 @@ def crear_diagrama_flujo_efectivo(tiempo, cupon, valor_nominal, vp_bono, periodo
     plt.tight_layout()
     return fig
 
-def generar_excel_pagos(df_detalle, valor_nominal, tasa_cupon, tea, vp_bono, periodo):
+def calcular_anchos_columnas_excel(df):
+    """
+    Calcula el ancho de cada columna a partir de los metadatos de la tabla
+    (tipo de dato, extremos numéricos y valores distintos), sin recorrer
+    celda por celda
+    
+    Returns:
+        list: Ancho de cada columna en caracteres
+    """
+    import pandas as pd
+    anchos = []
+    for columna in df.columns:
+        serie = df[columna]
+        if len(serie) == 0:
+            largo_valores = 0
+        elif pd.api.types.is_numeric_dtype(serie):
+            # El texto más largo corresponde al valor de mayor magnitud (con signo)
+            extremo = max(abs(serie.max()), abs(serie.min()))
+            formato = '{:.0f}' if pd.api.types.is_integer_dtype(serie) else '{:.2f}'
+            largo_valores = len(formato.format(extremo)) + int(serie.min() < 0)
+        else:
+            largo_valores = max(len(str(valor)) for valor in serie.unique())
+        anchos.append(max(len(str(columna)), largo_valores) + 2)
+    return anchos
+
+def escribir_hoja_excel(libro, nombre_hoja, df):
+    """
+    Escribe un DataFrame en una hoja de un libro openpyxl en modo solo
+    escritura: las filas se envían en streaming sin mantener celdas en memoria
+    """
+    from openpyxl.utils import get_column_letter
+    
+    hoja = libro.create_sheet(nombre_hoja)
+    
+    # Los anchos deben fijarse antes de escribir la primera fila
+    for indice, ancho in enumerate(calcular_anchos_columnas_excel(df), start=1):
+        hoja.column_dimensions[get_column_letter(indice)].width = ancho
+    
+    hoja.append(list(df.columns))
+    for fila in df.itertuples(index=False, name=None):
+        hoja.append(fila)
+
+def generar_excel_pagos(df_detalle, valor_nominal, tasa_cupon, tea, vp_bono, periodo, destino=None):
     """
     Genera un archivo Excel con los detalles de los pagos periódicos
+    
+    Usa un libro openpyxl en modo solo escritura (streaming), por lo que
+    cronogramas de cientos de miles de filas se escriben con memoria acotada.
+    
+    Args:
+        destino (str | file-like, opcional): Ruta o archivo donde escribir;
+            por defecto se genera en memoria
+    
+    Returns:
+        BytesIO | str | file-like: El destino con el libro ya escrito
     """
-    output = BytesIO()
+    import pandas as pd
+    from openpyxl import Workbook
+    
+    output = BytesIO() if destino is None else destino
+    libro = Workbook(write_only=True)
+    
+    # Hoja 1: Resumen
+    resumen_data = {
+        'Parámetro': [
+            'Valor Nominal',
+            'Tasa Cupón Anual',
+            'Periodo de Pago',
+            'TEA (Tasa Requerida)',
+            'Valor Presente del Bono',
+            'Fecha de Generación'
+        ],
+        'Valor': [
+            f'${valor_nominal:,.2f}',
+            f'{tasa_cupon*100:.2f}%',
+            periodo,
+            f'{tea*100:.2f}%',
+            f'${vp_bono:,.2f}',
+            datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        ]
+    }
+    escribir_hoja_excel(libro, 'Resumen', pd.DataFrame(resumen_data))
     
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-        # Hoja 1: Resumen
-        resumen_data = {
-            'Parámetro': [
-                'Valor Nominal',
-                'Tasa Cupón Anual',
-                'Periodo de Pago',
-                'TEA (Tasa Requerida)',
-                'Valor Presente del Bono',
-                'Fecha de Generación'
-            ],
-            'Valor': [
-                f'${valor_nominal:,.2f}',
-                f'{tasa_cupon*100:.2f}%',
-                periodo,
-                f'{tea*100:.2f}%',
-                f'${vp_bono:,.2f}',
-                datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            ]
-        }
-        df_resumen = pd.DataFrame(resumen_data)
-        df_resumen.to_excel(writer, sheet_name='Resumen', index=False)
-        
-        # Hoja 2: Detalle de Pagos
-        df_detalle.to_excel(writer, sheet_name='Detalle de Pagos', index=False)
-        
-        # Ajustar anchos de columna
-        for sheet_name in writer.sheets:
-            worksheet = writer.sheets[sheet_name]
-            for column in worksheet.columns:
-                max_length = 0
-                column = [cell for cell in column]
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(cell.value)
-                    except:
-                        pass
-                adjusted_width = (max_length + 2)
-                worksheet.column_dimensions[column[0].column_letter].width = adjusted_width
+    # Hoja 2: Detalle de Pagos
+    escribir_hoja_excel(libro, 'Detalle de Pagos', df_detalle)
     
-    output.seek(0)
+    libro.save(output)
+    if destino is None:
+        output.seek(0)
     return output
 
 def generar_pdf_pagos(df_detalle, valor_nominal, tasa_cupon, tea, vp_bono, periodo, cupon):
     """
     Genera un archivo PDF con los detalles de los pagos periódicos
+    
+    El detalle se divide con crear_tablas_paginadas (src.utils.pdf_generator)
+    en tablas de una página con encabezado repetido. El tiempo de generación
+    se registra en el log.
     """
+    import pandas as pd
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib import colors
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+    from reportlab.lib.units import inch
+    from src.utils.pdf_generator import crear_tablas_paginadas
+    
+    inicio_render = time.perf_counter()
     output = BytesIO()
     doc = SimpleDocTemplate(output, pagesize=letter)
     elements = []
@@ -685,17 +633,16 @@ def generar_pdf_pagos(df_detalle, valor_nominal, tasa_cupon, tea, vp_bono, perio
     detalle_heading = Paragraph("Detalle de Pagos Periódicos", heading_style)
     elements.append(detalle_heading)
     
-    # Preparar datos de la tabla
-    table_data = [df_detalle.columns.tolist()] + df_detalle.values.tolist()
-    
-    # Formatear los valores numéricos
-    for i in range(1, len(table_data)):
-        for j in range(1, len(table_data[i])):
-            if isinstance(table_data[i][j], (int, float)):
-                table_data[i][j] = f'${table_data[i][j]:,.2f}'
+    # Formatear columnas numéricas (excepto Periodo) de una vez por columna
+    df_texto = df_detalle.copy()
+    for columna in df_detalle.columns[1:]:
+        if pd.api.types.is_numeric_dtype(df_detalle[columna]):
+            df_texto[columna] = df_detalle[columna].map('${:,.2f}'.format)
+    encabezado = df_detalle.columns.tolist()
+    filas = df_texto.values.tolist()
     
-    detalle_table = Table(table_data, colWidths=[0.8*inch, 1.3*inch, 1.3*inch, 1.3*inch, 1.5*inch])
-    detalle_table.setStyle(TableStyle([
+    # Tablas del tamaño de una página, cada una con su encabezado
+    estilo_detalle = TableStyle([
         ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2e5c8a')),
         ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
         ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
@@ -708,15 +655,116 @@ def generar_pdf_pagos(df_detalle, valor_nominal, tasa_cupon, tea, vp_bono, perio
         ('TOPPADDING', (0, 1), (-1, -1), 6),
         ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
         ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
-    ]))
+    ])
     
-    elements.append(detalle_table)
+    tablas_detalle = crear_tablas_paginadas(
+        encabezado, filas, estilo_detalle,
+        anchos_columnas=[0.8*inch, 1.3*inch, 1.3*inch, 1.3*inch, 1.5*inch]
+    )
+    elements += tablas_detalle
     
     # Construir PDF
     doc.build(elements)
     output.seek(0)
+    
+    logger.info(
+        "PDF de pagos generado: %d filas en %d tablas, %d bytes, %.3f s",
+        len(filas), len(tablas_detalle), output.getbuffer().nbytes,
+        time.perf_counter() - inicio_render
+    )
     return output
 
+# ==================== CACHÉ DE VALORACIONES ====================
+
+# Combinaciones de entrada que se conservan en memoria; al llenarse se
+# descarta la usada hace más tiempo (LRU)
+MAX_VALORACIONES_CACHE = 32
+
+def crear_tabla_detalle_bono(resultados):
+    """
+    Crea el DataFrame de detalle de pagos a partir de los arreglos del resultado
+    """
+    import pandas as pd
+    return pd.DataFrame({
+        'Periodo': resultados['periodos'],
+        'Flujo (USD)': resultados['flujos'],
+        'Valor Presente (USD)': resultados['valores_presentes'],
+        'Tipo': np.where(
+            resultados['periodos'] == resultados['num_periodos'], "Cupón + Principal", "Cupón"
+        )
+    })
+
+@st.cache_data(max_entries=MAX_VALORACIONES_CACHE, show_spinner=False)
+def obtener_valoracion_bono(valor_nominal, tasa_cupon, periodo, tiempo, tea):
+    """
+    Valoración completa del bono para un juego de entradas de la página:
+    resultados, tabla de detalle, figura de flujos y CSV.
+    
+    Se memoriza por (valor_nominal, tasa_cupon, periodo, tiempo, tea), de modo
+    que volver a una combinación ya vista no recalcula nada.
+    
+    Returns:
+        dict: 'plazo_años', 'resultados', 'df_detalle', 'fig_flujos' y 'csv'.
+        Los reportes Excel/PDF se generan aparte con generar_exportacion_bono.
+    """
+    # Convertir tiempo (en periodos) a años
+    plazo_años = tiempo / obtener_periodos_por_año(periodo)
+    
+    resultados = calcular_valor_presente_bono_completo(
+        valor_nominal, tasa_cupon, periodo, plazo_años, tea
+    )
+    df_detalle = crear_tabla_detalle_bono(resultados)
+    
+    return {
+        'plazo_años': plazo_años,
+        'resultados': resultados,
+        'df_detalle': df_detalle,
+        'fig_flujos': crear_diagrama_flujo_interactivo(resultados, valor_nominal, periodo),
+        'csv': df_detalle.to_csv(index=False, encoding='utf-8-sig')
+    }
+
+@st.cache_data(max_entries=MAX_VALORACIONES_CACHE, show_spinner=False)
+def generar_exportacion_bono(formato, valor_nominal, tasa_cupon, periodo, tiempo, tea):
+    """
+    Genera bajo demanda el reporte 'excel' o 'pdf' de una valoración
+    
+    Se pasa como callable a st.download_button: Streamlit lo ejecuta en un
+    hilo aparte solo cuando el usuario pulsa el botón, y el resultado queda
+    memorizado por formato y entradas.
+    
+    Returns:
+        bytes: Contenido del archivo
+    """
+    valoracion = obtener_valoracion_bono(valor_nominal, tasa_cupon, periodo, tiempo, tea)
+    resultados = valoracion['resultados']
+    vp_bono = resultados['valor_presente_total']
+    
+    if formato == 'excel':
+        archivo = generar_excel_pagos(valoracion['df_detalle'], valor_nominal, tasa_cupon, tea, vp_bono, periodo)
+    elif formato == 'pdf':
+        archivo = generar_pdf_pagos(
+            valoracion['df_detalle'], valor_nominal, tasa_cupon, tea, vp_bono, periodo,
+            resultados['cupon_periodico']
+        )
+    else:
+        raise ValueError(f"Formato de exportación desconocido: {formato}")
+    
+    return archivo.getvalue()
+
+@st.cache_data(max_entries=MAX_VALORACIONES_CACHE, show_spinner=False)
+def obtener_grafico_sensibilidad(valor_nominal, tasa_cupon, periodo, tiempo, tea, num_puntos):
+    """
+    Gráfico de sensibilidad memorizado por entradas y resolución
+    
+    Usa la duración y convexidad de la valoración memorizada para dibujar la
+    aproximación junto al precio exacto.
+    """
+    valoracion = obtener_valoracion_bono(valor_nominal, tasa_cupon, periodo, tiempo, tea)
+    return crear_grafico_sensibilidad_tasa(
+        valor_nominal, tasa_cupon, periodo, valoracion['plazo_años'], tea,
+        num_puntos=num_puntos, resultados=valoracion['resultados']
+    )
+
 def mostrar_calculadora_bonos():
     st.header("Calculadora de Bonos")
     st.markdown("**Moneda: Dólares (USD)**")
@@ -767,18 +815,8 @@ def mostrar_calculadora_bonos():
     
     # Calcular cupón periódico usando fórmula de tasas equivalentes
     # TEP = (1 + TEA)^(1/n) - 1
-    if periodo == "Anual":
-        tasa_cupon_periodica = tasa_cupon  # n = 1
-        cupon_periodico = valor_nominal * tasa_cupon_periodica
-    elif periodo == "Semestral":
-        tasa_cupon_periodica = (1 + tasa_cupon) ** (1/2) - 1  # n = 2
-        cupon_periodico = valor_nominal * tasa_cupon_periodica
-    elif periodo == "Trimestral":
-        tasa_cupon_periodica = (1 + tasa_cupon) ** (1/4) - 1  # n = 4
-        cupon_periodico = valor_nominal * tasa_cupon_periodica
-    elif periodo == "Mensual":
-        tasa_cupon_periodica = (1 + tasa_cupon) ** (1/12) - 1  # n = 12
-        cupon_periodico = valor_nominal * tasa_cupon_periodica
+    tasa_cupon_periodica = convertir_tea_a_tasa_periodica(tasa_cupon, periodo)
+    cupon_periodico = valor_nominal * tasa_cupon_periodica
     
     st.markdown(f"### Cupón Periódico: **${cupon_periodico:,.2f}**")
     
@@ -807,20 +845,10 @@ def mostrar_calculadora_bonos():
     
     st.markdown("---")
     
-    # Convertir tiempo a años según el periodo seleccionado
-    if periodo == "Mensual":
-        plazo_años = tiempo / 12
-    elif periodo == "Trimestral":
-        plazo_años = tiempo / 4
-    elif periodo == "Semestral":
-        plazo_años = tiempo / 2
-    else:  # Anual
-        plazo_años = tiempo
-    
-    # Calcular valor presente usando la función correcta
-    resultados = calcular_valor_presente_bono_completo(
-        valor_nominal, tasa_cupon, periodo, plazo_años, tea
-    )
+    # Valoración completa (memorizada por combinación de entradas)
+    valoracion = obtener_valoracion_bono(valor_nominal, tasa_cupon, periodo, tiempo, tea)
+    plazo_años = valoracion['plazo_años']
+    resultados = valoracion['resultados']
     vp_bono = resultados['valor_presente_total']
     cupon_calc = resultados['cupon_periodico']
     
@@ -861,6 +889,74 @@ def mostrar_calculadora_bonos():
             help="Suma de todos los cupones"
         )
     
+    st.markdown("---")
+    
+    # ==================== PRECIO → TEA ====================
+    st.subheader("🔁 Precio → TEA")
+    st.markdown("Ingresa el precio de mercado del bono para obtener la TEA implícita (rendimiento al vencimiento).")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        precio_mercado = st.number_input(
+            "Precio de Mercado ($)",
+            min_value=0.0,
+            value=round(vp_bono, 2),
+            step=100.0,
+            format="%.2f",
+            help="Precio al que se negocia el bono hoy"
+        )
+    
+    with col2:
+        tea_implicita = calcular_tea_desde_precio(
+            precio_mercado, valor_nominal, tasa_cupon, periodo, plazo_años
+        )
+        if np.isnan(tea_implicita):
+            st.warning("⚠️ No existe una TEA que produzca ese precio para este bono")
+        else:
+            st.metric(
+                label="TEA Implícita",
+                value=f"{tea_implicita*100:.4f}%",
+                delta=f"{(tea_implicita - tea)*100:+.4f} pp vs TEA requerida",
+                delta_color="off",
+                help="Tasa efectiva anual a la que el VP del bono es igual al precio de mercado"
+            )
+    
+    st.markdown("---")
+    
+    # ==================== MEDIDAS DE RIESGO ====================
+    st.subheader("📐 Medidas de Riesgo de Tasa")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric(
+            label="Duración de Macaulay",
+            value=f"{resultados['duracion_macaulay']:.4f} años",
+            help="Plazo promedio ponderado de los flujos por su valor presente"
+        )
+    
+    with col2:
+        st.metric(
+            label="Duración Modificada",
+            value=f"{resultados['duracion_modificada']:.4f}",
+            help="Variación porcentual aproximada del precio ante 1 punto (1%) de cambio en la TEA"
+        )
+    
+    with col3:
+        st.metric(
+            label="Convexidad",
+            value=f"{resultados['convexidad']:.4f}",
+            help="Corrección de segundo orden de la variación del precio ante la TEA"
+        )
+    
+    with col4:
+        st.metric(
+            label="DV01",
+            value=f"USD {resultados['dv01']:,.2f}",
+            help="Cambio del precio del bono ante un aumento de 1 punto básico (0.01%) en la TEA"
+        )
+    
     # st.markdown("---")
     
     # # Información adicional e interpretación
@@ -907,8 +1003,7 @@ def mostrar_calculadora_bonos():
     
     # Diagrama de flujo de efectivo interactivo
     st.subheader("Flujos de Caja Periódicos")
-    fig_interactivo = crear_diagrama_flujo_interactivo(resultados, valor_nominal, periodo)
-    st.plotly_chart(fig_interactivo, use_container_width=True)
+    st.plotly_chart(valoracion['fig_flujos'], use_container_width=True)
     
     # Interpretación del diagrama de flujo
     st.info(
@@ -919,6 +1014,19 @@ En total recibirás **USD {total_cupones + valor_nominal:,.2f}** durante la vida
 """, icon="💡"
     )
     
+    # Sensibilidad del precio ante la tasa de descuento
+    st.subheader("Sensibilidad del Precio ante la TEA")
+    puntos_sensibilidad = st.select_slider(
+        "Resolución del análisis (puntos)",
+        options=[50, 500, 5000],
+        value=PUNTOS_SENSIBILIDAD,
+        help="Número de tasas evaluadas en el barrido de sensibilidad"
+    )
+    fig_sensibilidad = obtener_grafico_sensibilidad(
+        valor_nominal, tasa_cupon, periodo, tiempo, tea, puntos_sensibilidad
+    )
+    st.plotly_chart(fig_sensibilidad, use_container_width=True)
+    
     st.markdown("---")
     
     # ==================== TABLA DETALLADA ====================
@@ -926,27 +1034,7 @@ En total recibirás **USD {total_cupones + valor_nominal:,.2f}** durante la vida
     # ==================== TABLA DETALLADA ====================
     st.header("📋 Tabla Detallada de Flujos")
     
-    # Crear DataFrame con los flujos del resultado
-    periodos_list = list(range(1, tiempo + 1))
-    flujos_data = []
-    tipos_flujo = []
-    
-    for i, periodo_num in enumerate(periodos_list):
-        if periodo_num == tiempo:
-            flujo = resultados['flujos'][i]
-            tipo = "Cupón + Principal"
-        else:
-            flujo = resultados['flujos'][i]
-            tipo = "Cupón"
-        
-        flujos_data.append({
-            'Periodo': periodo_num,
-            'Flujo (USD)': flujo,
-            'Valor Presente (USD)': resultados['valores_presentes'][i],
-            'Tipo': tipo
-        })
-    
-    df_detalle = pd.DataFrame(flujos_data)
+    df_detalle = valoracion['df_detalle']
     
     # Mostrar tabla con formato
     st.dataframe(
@@ -963,7 +1051,7 @@ En total recibirás **USD {total_cupones + valor_nominal:,.2f}** durante la vida
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        total_flujos = sum(resultados['flujos'])
+        total_flujos = resultados['flujos'].sum()
         st.metric(
             label="Total Flujos Nominales",
             value=f"USD {total_flujos:,.2f}"
@@ -1002,33 +1090,30 @@ El descuento temporal de {diferencia:,.2f} USD ({(diferencia/total_flujos*100):.
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        # Generar Excel
-        excel_file = generar_excel_pagos(df_detalle, valor_nominal, tasa_cupon, tea, vp_bono, periodo)
+        # Excel y PDF se generan solo al pulsar el botón, en segundo plano
         st.download_button(
             label="📊 Descargar Excel",
-            data=excel_file,
+            data=partial(generar_exportacion_bono, 'excel', valor_nominal, tasa_cupon, periodo, tiempo, tea),
+            on_click="ignore",
             file_name=f"reporte_bono_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
             mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             use_container_width=True
         )
     
     with col2:
-        # Generar PDF
-        pdf_file = generar_pdf_pagos(df_detalle, valor_nominal, tasa_cupon, tea, vp_bono, periodo, cupon_periodico)
         st.download_button(
             label="📄 Descargar PDF",
-            data=pdf_file,
+            data=partial(generar_exportacion_bono, 'pdf', valor_nominal, tasa_cupon, periodo, tiempo, tea),
+            on_click="ignore",
             file_name=f"reporte_bono_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf",
             mime="application/pdf",
             use_container_width=True
         )
     
     with col3:
-        # Generar CSV
-        csv_data = df_detalle.to_csv(index=False, encoding='utf-8-sig')
         st.download_button(
             label="📋 Descargar CSV",
-            data=csv_data,
+            data=valoracion['csv'],
             file_name=f"reporte_bono_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
             mime="text/csv",
             use_container_width=True
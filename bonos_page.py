@@ -1,13 +1,6 @@
 import streamlit as st
 from config.constants import FRECUENCIAS_BONOS, MONEDA
 from src.calculations.bond_calcs import calcular_valor_presente_bono
-from src.visualization.bond_charts import (
-    crear_grafico_flujos_bono,
-    crear_grafico_valor_presente,
-    crear_tabla_flujos,
-    crear_grafico_composicion_bono
-)
-from src.utils.pdf_generator import crear_pdf_bonos
 
 
 def render_bonos_page():
@@ -178,7 +171,14 @@ def render_bonos_page():
         
         st.divider()
         
-        # Gráficos
+        # Gráficos (Plotly se carga solo cuando hay resultados que mostrar)
+        from src.visualization.bond_charts import (
+            crear_grafico_flujos_bono,
+            crear_grafico_valor_presente,
+            crear_tabla_flujos,
+            crear_grafico_composicion_bono
+        )
+        
         st.header("📈 Visualización de Flujos")
         
         tab1, tab2, tab3 = st.tabs(["📊 Flujos de Caja", "💵 Comparativa VP", "🥧 Composición"])
@@ -283,7 +283,9 @@ def render_bonos_page():
                 'tea_descuento_pct': tea_descuento_pct
             }
             
-            # Generar PDF
+            # Generar PDF (ReportLab se carga solo al exportar)
+            from src.utils.pdf_generator import crear_pdf_bonos
+            
             pdf_buffer = crear_pdf_bonos(
                 datos_entrada=datos_entrada_pdf,
                 resultados=resultado,
@@ -0,0 +1 @@
+"""Configuración compartida de la aplicación"""
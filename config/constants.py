@@ -0,0 +1,19 @@
+"""
+Constantes de la interfaz de bonos
+"""
+from tasas import FRECUENCIAS
+
+# Frecuencias de pago ofrecidas (nombre → pagos por año), de mayor a menor frecuencia
+FRECUENCIAS_BONOS = dict(FRECUENCIAS)
+
+MONEDA = "USD"
+
+# Paleta de los gráficos de bonos (la misma de bono.py)
+COLORES_BONOS = {
+    'principal': '#1f4788',
+    'secundario': '#2e5c8a',
+    'cupon': '#2ecc71',
+    'valor_nominal': '#3498db',
+    'ultimo_flujo': '#e74c3c',
+    'valor_presente': '#f39c12'
+}
@@ -1,36 +1,8 @@
 """
 Script para encontrar la TEA que produciría VP = $9,295.74
 """
-
-def obtener_periodos_por_año(frecuencia):
-    frecuencias = {"Semestral": 2}
-    return frecuencias.get(frecuencia, 1)
-
-def convertir_tea_a_tasa_periodica(tea, frecuencia):
-    n = obtener_periodos_por_año(frecuencia)
-    return (1 + tea) ** (1/n) - 1
-
-def calcular_vp_bono(valor_nominal, tasa_cupon, frecuencia, plazo_años, tea_descuento):
-    periodos_por_año = obtener_periodos_por_año(frecuencia)
-    num_periodos = int(plazo_años * periodos_por_año)
-    
-    tasa_cupon_periodica = convertir_tea_a_tasa_periodica(tasa_cupon, frecuencia)
-    tasa_descuento_periodica = convertir_tea_a_tasa_periodica(tea_descuento, frecuencia)
-    
-    cupon_periodico = valor_nominal * tasa_cupon_periodica
-    
-    # Calcular VP
-    vp_total = 0
-    for periodo in range(1, num_periodos + 1):
-        if periodo < num_periodos:
-            flujo = cupon_periodico
-        else:
-            flujo = cupon_periodico + valor_nominal
-        
-        vp = flujo / ((1 + tasa_descuento_periodica) ** periodo)
-        vp_total += vp
-    
-    return vp_total
+from src.calculations.bond_calcs import calcular_precio_bono
+from rendimiento_bono import calcular_tea_desde_precio
 
 # Parámetros conocidos
 valor_nominal = 10000.0
@@ -50,42 +22,17 @@ print(f"  Frecuencia: {frecuencia}")
 print(f"  Plazo: {plazo_años} años")
 print(f"  VP Objetivo: ${vp_objetivo:,.2f}")
 
-print(f"\n\nProbando diferentes TEAs:")
-print(f"{'TEA':<10} {'VP Calculado':<20} {'Diferencia':<15} {'Status'}")
-print("-" * 65)
+# Precio → TEA con Newton (derivada analítica) y bisección de respaldo
+tea_encontrada = calcular_tea_desde_precio(vp_objetivo, valor_nominal, tasa_cupon, frecuencia, plazo_años)
+vp_calc = calcular_precio_bono(valor_nominal, tasa_cupon, frecuencia, plazo_años, tea_encontrada)
 
-for tea_test in [0.06, 0.08, 0.10, 0.12, 0.14, 0.15, 0.16, 0.17, 0.18]:
-    vp_calc = calcular_vp_bono(valor_nominal, tasa_cupon, frecuencia, plazo_años, tea_test)
-    diferencia = vp_calc - vp_objetivo
-    
-    status = ""
-    if abs(diferencia) < 10:
-        status = "✓ COINCIDE"
-    elif diferencia > 0:
-        status = "↑ Mayor"
-    else:
-        status = "↓ Menor"
-    
-    print(f"{tea_test*100:.2f}%     ${vp_calc:>12,.2f}    ${diferencia:>12,.2f}    {status}")
-
-# Búsqueda más precisa
-print(f"\n\nBúsqueda precisa entre 16% y 18%:")
-print(f"{'TEA':<10} {'VP Calculado':<20} {'Diferencia'}")
+print(f"\n\nResultado del solver:")
+print(f"{'TEA':<14} {'VP Calculado':<20} {'Diferencia'}")
 print("-" * 50)
-
-for tea_pct in range(160, 181, 1):
-    tea_test = tea_pct / 1000
-    vp_calc = calcular_vp_bono(valor_nominal, tasa_cupon, frecuencia, plazo_años, tea_test)
-    diferencia = vp_calc - vp_objetivo
-    
-    if abs(diferencia) < 50:
-        print(f"{tea_test*100:.2f}%     ${vp_calc:>12,.2f}    ${diferencia:>12,.2f}")
+print(f"{tea_encontrada*100:.6f}%   ${vp_calc:>12,.2f}    ${vp_calc - vp_objetivo:>12,.2e}")
 
 print("\n" + "="*80)
 print("CONCLUSIÓN:")
 print("="*80)
-print("\nLa imagen probablemente está usando una TEA de descuento cercana a 17%")
-print("(no 6% como inicialmente supuse). Esto explicaría el VP de $9,295.74.")
-print("\nOTRA POSIBILIDAD: La imagen podría estar mostrando el precio DESPUÉS")
-print("de una compra con descuento o algún ajuste adicional.")
+print(f"\nLa TEA de descuento que produce VP = ${vp_objetivo:,.2f} es {tea_encontrada*100:.4f}%")
 print("="*80 + "\n")
@@ -0,0 +1,91 @@
+"""
+Proyección por lotes de planes de jubilación desde la línea de comandos
+
+Calcula los Módulos A (crecimiento) y B (impuestos y pensión) de la
+calculadora de acciones para cada plan de un archivo CSV o Parquet, por
+lotes vectorizados, y escribe los resultados a medida que se calculan.
+
+Uso:
+    python proyectar_jubilacion.py planes.csv proyecciones.parquet
+
+Columnas requeridas: edad_actual, edad_jubilacion, monto_inicial,
+aporte_periodico, frecuencia, tea, moneda ("PEN"/"USD") y opcion_retiro
+("Retiro único"/"Pensión mensual"). Opcionales: tea_retiro y años_retiro
+(vacío = pensión perpetua). Tasas en decimal.
+"""
+import argparse
+import sys
+
+from src.calculations.retirement_calcs import COLUMNAS_PLANES, calcular_planes_jubilacion_lote
+from src.utils.batch_io import TAMANO_LOTE_POR_DEFECTO, formatear_avance, procesar_archivo
+
+# ==================== PROYECCIÓN ====================
+
+def proyectar_lote(planes):
+    """
+    Agrega a un lote de planes los resultados de los Módulos A y B
+
+    Args:
+        planes (pd.DataFrame): Columnas de COLUMNAS_PLANES (puede tener más)
+
+    Returns:
+        pd.DataFrame: Las columnas de entrada más las de calcular_planes_jubilacion_lote
+    """
+    return planes.assign(**calcular_planes_jubilacion_lote(planes))
+
+
+def proyectar_archivo(ruta_entrada, ruta_salida, tamano_lote=TAMANO_LOTE_POR_DEFECTO, reportar=None):
+    """
+    Proyecta todos los planes de un archivo
+
+    Args:
+        ruta_entrada (str): CSV o Parquet con los planes
+        ruta_salida (str): CSV o Parquet de resultados
+        tamano_lote (int): Planes por lote
+        reportar (callable, opcional): Recibe (planes_acumulados, segundos) tras cada lote
+
+    Returns:
+        dict: 'planes', 'lotes', 'segundos' y 'planes_por_segundo'
+    """
+    resumen = procesar_archivo(ruta_entrada, ruta_salida, proyectar_lote, tamano_lote, reportar)
+    return {
+        'planes': resumen['filas'],
+        'lotes': resumen['lotes'],
+        'segundos': resumen['segundos'],
+        'planes_por_segundo': resumen['filas_por_segundo']
+    }
+
+
+# ==================== LÍNEA DE COMANDOS ====================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Proyección por lotes de planes de jubilación (CSV/Parquet)"
+    )
+    parser.add_argument('entrada', help="Planes: " + ", ".join(COLUMNAS_PLANES))
+    parser.add_argument('salida', help="Archivo de resultados (.csv o .parquet)")
+    parser.add_argument('--tamano-lote', type=int, default=TAMANO_LOTE_POR_DEFECTO,
+                        help="Planes por lote (default: %(default)s)")
+    parser.add_argument('--silencioso', action='store_true', help="No reportar avance por lote")
+    args = parser.parse_args(argv)
+
+    if args.tamano_lote < 1:
+        parser.error("--tamano-lote debe ser mayor a 0")
+
+    def reportar(planes, segundos):
+        print(formatear_avance(planes, segundos, 'planes'), file=sys.stderr)
+
+    try:
+        resumen = proyectar_archivo(args.entrada, args.salida, args.tamano_lote,
+                                    reportar=None if args.silencioso else reportar)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    print(f"Total: {formatear_avance(resumen['planes'], resumen['segundos'], 'planes')} "
+          f"en {resumen['lotes']} lotes -> {args.salida}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+"""
+Rendimiento al vencimiento (TEA implícita) de un bono a partir de su precio
+
+Resuelve P(i) = precio con el método de Newton usando la derivada analítica
+del precio (vía la duración) y un intervalo de bisección como respaldo
+cuando el paso de Newton sale del intervalo. Todo está vectorizado: se
+pueden resolver muchos precios (o bonos) a la vez.
+"""
+import numpy as np
+
+from src.calculations.bond_calcs import calcular_vp_bono_cerrado, calcular_factor_anualidad_creciente
+from tasas import (
+    obtener_periodos_por_año,
+    obtener_periodos_por_año_arreglo,
+    calcular_tasa_periodica,
+    convertir_tea_a_tasa_periodica,
+    calcular_tea_desde_tasa_periodica
+)
+
+# Tolerancia relativa sobre la tasa periódica (precisión de máquina)
+TOLERANCIA_TASA = 4 * np.finfo(float).eps
+MAX_ITERACIONES = 100
+
+# Límite inferior de la tasa periódica buscada (-99%)
+TASA_MINIMA = -0.99
+
+COLUMNAS_LOTE_RENDIMIENTO = ['precio', 'valor_nominal', 'tasa_cupon_anual', 'frecuencia', 'plazo_años']
+
+
+def calcular_derivada_precio_bono(valor_nominal, cupon_periodico, num_periodos, tasa_periodica):
+    """
+    Derivada analítica del precio respecto a la tasa periódica:
+    
+    dP/di = -[C × Σ t/(1+i)^t + VN × n/(1+i)^n] / (1 + i) = -D × P / (1 + i)
+    
+    donde D es la duración de Macaulay en periodos.
+    
+    Returns:
+        float | np.ndarray: dP/di (negativa para flujos positivos)
+    """
+    tasa = np.asarray(tasa_periodica, dtype=float)
+    n = np.asarray(num_periodos, dtype=float)
+    suma_ponderada = (cupon_periodico * calcular_factor_anualidad_creciente(tasa, n)
+                      + valor_nominal * n * (1 + tasa) ** -n)
+    return (-suma_ponderada / (1 + tasa))[()]
+
+
+def calcular_tasa_periodica_desde_precio(precio, valor_nominal, cupon_periodico, num_periodos,
+                                         tolerancia=TOLERANCIA_TASA, max_iteraciones=MAX_ITERACIONES):
+    """
+    Encuentra la tasa periódica i tal que el VP del bono sea igual al precio
+    
+    Newton con salvaguarda: cada iteración mantiene un intervalo [bajo, alto]
+    que contiene la raíz; si el paso de Newton cae fuera, se biseca.
+    
+    Args:
+        precio (float | np.ndarray): Precio(s) observado(s) del bono
+        valor_nominal, cupon_periodico, num_periodos: Características del
+            bono (escalares o arreglos compatibles con precio)
+        tolerancia (float): Tolerancia relativa sobre la tasa
+        max_iteraciones (int): Máximo de iteraciones
+    
+    Returns:
+        tuple: (tasa_periodica, iteraciones) - la tasa es NaN cuando el precio
+        no tiene solución (precio <= 0, bono sin periodos o fuera de rango)
+    """
+    precio, valor_nominal, cupon_periodico, num_periodos = np.broadcast_arrays(
+        np.asarray(precio, dtype=float),
+        np.asarray(valor_nominal, dtype=float),
+        np.asarray(cupon_periodico, dtype=float),
+        np.asarray(num_periodos, dtype=float)
+    )
+    
+    def error_precio(tasa):
+        return calcular_vp_bono_cerrado(valor_nominal, cupon_periodico, num_periodos, tasa) - precio
+    
+    with np.errstate(over='ignore', divide='ignore', invalid='ignore'):
+        # Intervalo inicial: P es decreciente en i, así que f(bajo) > 0 > f(alto)
+        bajo = np.full(precio.shape, TASA_MINIMA)
+        alto = np.ones(precio.shape)
+        for _ in range(60):
+            sin_cambio_signo = error_precio(alto) > 0
+            if not sin_cambio_signo.any():
+                break
+            alto = np.where(sin_cambio_signo, alto * 2, alto)
+        
+        # En i = -99% el precio desborda a +inf; sin cupón queda 0 × inf = NaN
+        error_bajo = np.nan_to_num(error_precio(bajo), nan=np.inf)
+        valido = ((precio > 0) & (num_periodos > 0)
+                  & (error_bajo > 0) & (error_precio(alto) <= 0))
+        
+        # Punto de partida: aproximación clásica del rendimiento al vencimiento
+        n_seguro = np.where(num_periodos > 0, num_periodos, 1)
+        tasa = (cupon_periodico + (valor_nominal - precio) / n_seguro) / ((valor_nominal + precio) / 2)
+        tasa = np.clip(np.nan_to_num(tasa), bajo, alto)
+        
+        activo = valido.copy()
+        iteraciones = 0
+        while activo.any() and iteraciones < max_iteraciones:
+            iteraciones += 1
+            f = error_precio(tasa)
+            derivada = calcular_derivada_precio_bono(valor_nominal, cupon_periodico, num_periodos, tasa)
+            
+            # Actualizar el intervalo con el signo del error
+            bajo = np.where(activo & (f > 0), tasa, bajo)
+            alto = np.where(activo & (f <= 0), tasa, alto)
+            
+            # Paso de Newton; si sale del intervalo se usa bisección
+            nueva_tasa = np.where(f == 0, tasa, tasa - f / derivada)
+            fuera = ~np.isfinite(nueva_tasa) | (nueva_tasa < bajo) | (nueva_tasa > alto)
+            nueva_tasa = np.where(fuera, (bajo + alto) / 2, nueva_tasa)
+            
+            paso = np.abs(nueva_tasa - tasa)
+            tasa = np.where(activo, nueva_tasa, tasa)
+            activo &= (paso > tolerancia * (1 + np.abs(tasa))) & (f != 0)
+    
+    return np.where(valido, tasa, np.nan)[()], iteraciones
+
+
+def calcular_tea_desde_precio(precio, valor_nominal, tasa_cupon_anual, frecuencia, plazo_años,
+                              tolerancia=TOLERANCIA_TASA, max_iteraciones=MAX_ITERACIONES):
+    """
+    Precio → TEA: rendimiento efectivo anual implícito en el precio del bono
+    
+    Args:
+        precio (float | np.ndarray): Precio(s) de mercado del bono
+        valor_nominal (float): Valor nominal del bono
+        tasa_cupon_anual (float): TEA del cupón en decimal
+        frecuencia (str): Frecuencia de pago
+        plazo_años (float): Plazo al vencimiento en años
+    
+    Returns:
+        float | np.ndarray: TEA de descuento en decimal (NaN si no hay solución)
+    """
+    n = obtener_periodos_por_año(frecuencia)
+    num_periodos = int(plazo_años * n)
+    cupon_periodico = valor_nominal * convertir_tea_a_tasa_periodica(tasa_cupon_anual, frecuencia)
+    
+    tasa_periodica, _ = calcular_tasa_periodica_desde_precio(
+        precio, valor_nominal, cupon_periodico, num_periodos,
+        tolerancia=tolerancia, max_iteraciones=max_iteraciones
+    )
+    return calcular_tea_desde_tasa_periodica(tasa_periodica, n)
+
+
+def calcular_tea_desde_precio_lote(bonos, tolerancia=TOLERANCIA_TASA, max_iteraciones=MAX_ITERACIONES):
+    """
+    Precio → TEA para una cartera completa (cada bono con su propia frecuencia)
+    
+    Args:
+        bonos (pd.DataFrame | dict): Columnas de COLUMNAS_LOTE_RENDIMIENTO
+    
+    Returns:
+        np.ndarray: TEA implícita de cada bono (NaN si no hay solución)
+    """
+    faltantes = [col for col in COLUMNAS_LOTE_RENDIMIENTO if col not in bonos]
+    if faltantes:
+        raise ValueError(f"Faltan columnas en la cartera de bonos: {', '.join(faltantes)}")
+    
+    valor_nominal = np.asarray(bonos['valor_nominal'], dtype=float)
+    periodos_por_año = obtener_periodos_por_año_arreglo(
+        bonos['frecuencia'], getattr(bonos, 'index', None)
+    )
+    num_periodos = (np.asarray(bonos['plazo_años'], dtype=float) * periodos_por_año).astype(int)
+    cupon_periodico = valor_nominal * calcular_tasa_periodica(
+        np.asarray(bonos['tasa_cupon_anual'], dtype=float), periodos_por_año
+    )
+    
+    tasa_periodica, _ = calcular_tasa_periodica_desde_precio(
+        np.asarray(bonos['precio'], dtype=float), valor_nominal, cupon_periodico, num_periodos,
+        tolerancia=tolerancia, max_iteraciones=max_iteraciones
+    )
+    return np.atleast_1d(calcular_tea_desde_tasa_periodica(tasa_periodica, periodos_por_año))
@@ -0,0 +1,288 @@
+"""
+Servicio HTTP local (JSON) con los cálculos de bonos y de jubilación
+
+Expone el núcleo numérico sin Streamlit para que otros sistemas lo reutilicen:
+
+    GET  /salud                    Estado del servicio y endpoints disponibles
+    POST /bonos/valoracion         VP, duración de Macaulay, duración modificada y DV01
+    POST /bonos/rendimiento        TEA implícita en el precio (YTM) y duración a esa TEA
+    POST /jubilacion/proyeccion    Módulos A y B de la calculadora de acciones
+
+El cuerpo es un objeto JSON (un bono o plan → un objeto de respuesta) o una
+lista de objetos (lote → lista de respuestas en el mismo orden), con los
+campos de COLUMNAS_LOTE_BONOS, COLUMNAS_LOTE_RENDIMIENTO o COLUMNAS_PLANES.
+Los valores sin solución se devuelven como null.
+
+Solo usa la biblioteca estándar (asyncio): conexiones HTTP/1.1 persistentes
+(keep-alive) y un pool de procesos para los lotes grandes, de modo que un
+lote pesado no bloquea al resto de conexiones.
+
+Uso:
+    python servicio_calculos.py --puerto 8080 --procesos 4
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import suppress
+from functools import partial
+
+import numpy as np
+import pandas as pd
+
+from rendimiento_bono import calcular_tea_desde_precio_lote
+from src.calculations.bond_calcs import calcular_medidas_riesgo_bonos_lote
+from src.calculations.retirement_calcs import calcular_planes_jubilacion_lote
+
+logger = logging.getLogger(__name__)
+
+# ==================== CONFIGURACIÓN ====================
+
+HOST_POR_DEFECTO = '127.0.0.1'
+PUERTO_POR_DEFECTO = 8080
+
+# Procesos del pool (0 = calcular todo en el proceso del servidor)
+NUM_PROCESOS = int(os.environ.get('FINANZAS_PROCESOS_SERVICIO', os.cpu_count() or 1))
+
+# Cuerpos a partir de este tamaño se calculan en el pool; los pequeños se
+# atienden en el propio bucle, donde el viaje al otro proceso costaría más
+MIN_BYTES_POOL = 256 * 1024
+
+MAX_BYTES_CUERPO = 64 * 1024 * 1024
+MAX_ENCABEZADOS = 100
+
+# Segundos que una conexión persistente puede estar inactiva antes de cerrarse
+TIEMPO_INACTIVIDAD_S = 15
+
+MOTIVOS_HTTP = {
+    200: 'OK',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    411: 'Length Required',
+    413: 'Payload Too Large',
+    500: 'Internal Server Error'
+}
+
+# ==================== CÁLCULOS (SIN HTTP) ====================
+
+def valorar_bonos(bonos):
+    """VP y medidas de riesgo de cada bono (tasa_descuento_anual conocida)"""
+    return calcular_medidas_riesgo_bonos_lote(bonos)
+
+
+def calcular_rendimiento_bonos(bonos):
+    """TEA implícita en el precio de cada bono y sus medidas de riesgo a esa TEA"""
+    tea = calcular_tea_desde_precio_lote(bonos)
+    return {'tea': tea, **calcular_medidas_riesgo_bonos_lote(bonos.assign(tasa_descuento_anual=tea))}
+
+
+def proyectar_planes(planes):
+    """Módulos A y B de cada plan de jubilación"""
+    return calcular_planes_jubilacion_lote(planes)
+
+
+ENDPOINTS = {
+    '/bonos/valoracion': valorar_bonos,
+    '/bonos/rendimiento': calcular_rendimiento_bonos,
+    '/jubilacion/proyeccion': proyectar_planes
+}
+
+
+def a_registros(columnas):
+    """Arreglos por columna → lista de dicts serializables (NaN e infinitos → None)"""
+    tabla = pd.DataFrame(columnas).replace([np.inf, -np.inf], np.nan)
+    return tabla.astype(object).where(tabla.notna(), None).to_dict('records')
+
+
+def ejecutar_endpoint(ruta, cuerpo):
+    """
+    Atiende un POST de punta a punta: JSON de entrada → cálculo → JSON de salida
+
+    Recibe y retorna bytes para que el viaje al pool de procesos sea barato.
+
+    Args:
+        ruta (str): Una clave de ENDPOINTS
+        cuerpo (bytes): Objeto JSON o lista de objetos
+
+    Returns:
+        tuple: (código HTTP, cuerpo JSON en bytes)
+    """
+    try:
+        datos = json.loads(cuerpo)
+        es_lote = isinstance(datos, list)
+        registros = datos if es_lote else [datos]
+        if not all(isinstance(registro, dict) for registro in registros):
+            raise ValueError("El cuerpo debe ser un objeto JSON o una lista de objetos")
+
+        resultados = a_registros(ENDPOINTS[ruta](pd.DataFrame(registros))) if registros else []
+    except (ValueError, TypeError) as e:
+        return 400, serializar({'error': str(e)})
+
+    return 200, serializar(resultados if es_lote else resultados[0])
+
+
+def serializar(objeto):
+    return json.dumps(objeto, ensure_ascii=False).encode('utf-8')
+
+# ==================== SERVIDOR HTTP ====================
+
+async def atender_solicitud(metodo, ruta, cuerpo, pool, min_bytes_pool):
+    """Enruta una solicitud y retorna (código HTTP, cuerpo JSON en bytes)"""
+    ruta = ruta.split('?', 1)[0]
+
+    if ruta == '/salud':
+        if metodo != 'GET':
+            return 405, serializar({'error': "Use GET"})
+        return 200, serializar({'estado': 'ok', 'endpoints': sorted(ENDPOINTS)})
+
+    if ruta not in ENDPOINTS:
+        return 404, serializar({'error': f"Ruta desconocida: {ruta}"})
+    if metodo != 'POST':
+        return 405, serializar({'error': "Use POST"})
+
+    try:
+        if pool is not None and len(cuerpo) >= min_bytes_pool:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(pool, ejecutar_endpoint, ruta, cuerpo)
+        return ejecutar_endpoint(ruta, cuerpo)
+    except Exception:
+        logger.exception("Error al atender %s", ruta)
+        return 500, serializar({'error': "Error interno del servidor"})
+
+
+async def leer_encabezados(reader):
+    """Lee los encabezados hasta la línea vacía (nombres en minúsculas)"""
+    encabezados = {}
+    for _ in range(MAX_ENCABEZADOS):
+        linea = await reader.readline()
+        if linea in (b'\r\n', b'\n', b''):
+            return encabezados
+        nombre, _, valor = linea.decode('latin-1').partition(':')
+        encabezados[nombre.strip().lower()] = valor.strip()
+    raise ValueError("Demasiados encabezados")
+
+
+def escribir_respuesta(writer, estado, cuerpo, mantener_conexion):
+    encabezados = [
+        f"HTTP/1.1 {estado} {MOTIVOS_HTTP[estado]}",
+        "Content-Type: application/json; charset=utf-8",
+        f"Content-Length: {len(cuerpo)}",
+        f"Connection: {'keep-alive' if mantener_conexion else 'close'}"
+    ]
+    if mantener_conexion:
+        encabezados.append(f"Keep-Alive: timeout={TIEMPO_INACTIVIDAD_S}")
+    writer.write(("\r\n".join(encabezados) + "\r\n\r\n").encode('latin-1') + cuerpo)
+
+
+async def manejar_conexion(reader, writer, pool=None, min_bytes_pool=MIN_BYTES_POOL):
+    """
+    Atiende una conexión HTTP/1.1 de principio a fin
+
+    La conexión se mantiene abierta entre solicitudes (keep-alive) salvo que
+    el cliente pida 'Connection: close', use HTTP/1.0 sin keep-alive o quede
+    inactiva más de TIEMPO_INACTIVIDAD_S (esperando una solicitud o el resto
+    de su cuerpo).
+    """
+    try:
+        while True:
+            try:
+                linea = await asyncio.wait_for(reader.readline(), TIEMPO_INACTIVIDAD_S)
+            except asyncio.TimeoutError:
+                break
+            if not linea.strip():
+                break
+
+            try:
+                metodo, ruta, version = linea.decode('latin-1').split()
+                encabezados = await leer_encabezados(reader)
+                largo = int(encabezados.get('content-length', 0))
+                if largo < 0:
+                    raise ValueError("Content-Length negativo")
+            except ValueError:
+                escribir_respuesta(writer, 400, serializar({'error': "Solicitud HTTP inválida"}), False)
+                break
+
+            if 'chunked' in encabezados.get('transfer-encoding', ''):
+                escribir_respuesta(writer, 411, serializar({'error': "Se requiere Content-Length"}), False)
+                break
+            if largo > MAX_BYTES_CUERPO:
+                escribir_respuesta(writer, 413, serializar({'error': "Cuerpo demasiado grande"}), False)
+                break
+
+            try:
+                cuerpo = await asyncio.wait_for(reader.readexactly(largo), TIEMPO_INACTIVIDAD_S)
+            except asyncio.TimeoutError:
+                break
+            conexion = encabezados.get('connection', '').lower()
+            mantener_conexion = (conexion == 'keep-alive'
+                                 or (version == 'HTTP/1.1' and conexion != 'close'))
+
+            estado, respuesta = await atender_solicitud(metodo, ruta, cuerpo, pool, min_bytes_pool)
+            escribir_respuesta(writer, estado, respuesta, mantener_conexion)
+            await writer.drain()
+            if not mantener_conexion:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        with suppress(ConnectionError):
+            await writer.drain()
+        writer.close()
+        with suppress(ConnectionError):
+            await writer.wait_closed()
+
+
+async def iniciar_servidor(host=HOST_POR_DEFECTO, puerto=PUERTO_POR_DEFECTO,
+                           num_procesos=NUM_PROCESOS, min_bytes_pool=MIN_BYTES_POOL):
+    """
+    Crea el pool de procesos y abre el socket del servicio
+
+    Args:
+        host (str): Interfaz de escucha (por defecto solo local)
+        puerto (int): Puerto (0 = elegir uno libre)
+        num_procesos (int): Procesos del pool (0 = sin pool)
+        min_bytes_pool (int): Tamaño de cuerpo desde el que se usa el pool
+
+    Returns:
+        tuple: (asyncio.Server, ProcessPoolExecutor | None); quien llama
+        debe cerrar ambos
+    """
+    pool = ProcessPoolExecutor(max_workers=num_procesos) if num_procesos > 0 else None
+    servidor = await asyncio.start_server(
+        partial(manejar_conexion, pool=pool, min_bytes_pool=min_bytes_pool), host, puerto
+    )
+    return servidor, pool
+
+
+async def servir(host, puerto, num_procesos):
+    servidor, pool = await iniciar_servidor(host, puerto, num_procesos)
+    try:
+        direccion = servidor.sockets[0].getsockname()
+        print(f"Servicio de cálculos en http://{direccion[0]}:{direccion[1]} "
+              f"({num_procesos} procesos)")
+        async with servidor:
+            await servidor.serve_forever()
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Servicio HTTP local de cálculos de bonos y jubilación")
+    parser.add_argument('--host', default=HOST_POR_DEFECTO, help="Interfaz (default: %(default)s)")
+    parser.add_argument('--puerto', type=int, default=PUERTO_POR_DEFECTO, help="Puerto (default: %(default)s)")
+    parser.add_argument('--procesos', type=int, default=NUM_PROCESOS,
+                        help="Procesos del pool, 0 = sin pool (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    with suppress(KeyboardInterrupt):
+        asyncio.run(servir(args.host, args.puerto, args.procesos))
+    return 0
+
+
+if __name__ == "__main__":
+    main()
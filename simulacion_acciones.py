@@ -0,0 +1,281 @@
+"""
+Simulación Monte Carlo del crecimiento de cartera (Módulo A de acciones)
+y del consumo del capital durante el retiro (Módulo B)
+
+Sustituye la TEA determinística por retornos aleatorios: lognormales con
+media TEA y volatilidad dada, o remuestreo (bootstrap) de retornos anuales
+históricos. El calendario de aportes es el mismo de
+calcular_crecimiento_aportes_periodicos:
+
+S_0 = VA,   S_k = S_{k-1} × (1 + r_k) + A
+
+Las trayectorias se procesan por bloques de tamaño acotado; cada bloque
+tiene su propia semilla derivada de la semilla principal, de modo que el
+resultado es reproducible. Cada bloque se reduce a percentiles por año antes
+de combinarse, y los bloques pueden repartirse en un pool de procesos; como
+la semilla es por bloque y no por proceso, el resultado no depende del
+número de procesos.
+
+En el retiro el saldo evoluciona como B_m = B_{m-1} × (1 + r_m) - W_m, con
+retiros mensuales W_m opcionalmente indexados a la inflación.
+"""
+import os
+
+import numpy as np
+
+from tasas import obtener_periodos_por_año
+
+NUM_SIMULACIONES = 100_000
+PERCENTILES_BANDAS = (5, 25, 50, 75, 95)
+
+# Máximo de celdas (trayectorias × periodos) por bloque: ~16 MB por arreglo
+MAX_CELDAS_BLOQUE = 2_000_000
+
+# Procesos del pool de la página (variable de entorno o todos los núcleos)
+NUM_PROCESOS = int(os.environ.get('FINANZAS_PROCESOS_MONTECARLO', os.cpu_count() or 1))
+
+
+def generar_log_retornos(generador, num_trayectorias, plazo_años, periodos_por_año,
+                         tea, volatilidad, retornos_historicos=None):
+    """
+    Genera log-retornos periódicos ln(1 + r_k) de forma (trayectorias, periodos)
+
+    - Lognormal: ln(1 + R_anual) ~ N(ln(1 + TEA) - σ²/2, σ²), repartido en
+      periodos independientes con media y varianza divididas entre periodos_por_año
+    - Bootstrap: cada año toma un retorno anual histórico al azar y lo
+      reparte en tasas periódicas equivalentes
+    """
+    total_periodos = plazo_años * periodos_por_año
+
+    if retornos_historicos is not None:
+        historicos = np.log1p(np.asarray(retornos_historicos, dtype=float))
+        anuales = generador.choice(historicos, size=(num_trayectorias, plazo_años))
+        return np.repeat(anuales / periodos_por_año, periodos_por_año, axis=1)
+
+    media = (np.log1p(tea) - volatilidad ** 2 / 2) / periodos_por_año
+    desviacion = volatilidad / np.sqrt(periodos_por_año)
+    return generador.normal(media, desviacion, size=(num_trayectorias, total_periodos))
+
+
+def simular_bloque_aportes(semilla, num_trayectorias, monto_inicial, aporte_periodico, tea,
+                           volatilidad, frecuencia, plazo_años, retornos_historicos=None):
+    """
+    Simula un bloque de trayectorias y retorna los saldos al cierre de cada año
+
+    Con G_k = Π(1 + r_j) el saldo tiene forma cerrada
+    S_k = G_k × (VA + A × Σ_{j≤k} 1/G_j), que se evalúa con cumsum.
+
+    Returns:
+        np.ndarray: Saldos de forma (num_trayectorias, plazo_años + 1)
+    """
+    generador = np.random.default_rng(semilla)
+    periodos_por_año = obtener_periodos_por_año(frecuencia)
+    plazo_años = int(plazo_años)
+
+    log_retornos = generar_log_retornos(
+        generador, num_trayectorias, plazo_años, periodos_por_año,
+        tea, volatilidad, retornos_historicos
+    )
+    descuento = np.exp(-np.cumsum(log_retornos, axis=1))
+    aportes_descontados = np.cumsum(descuento, axis=1)
+
+    # Solo se necesitan los saldos al cierre de cada año
+    cierres = slice(periodos_por_año - 1, None, periodos_por_año)
+    saldos_anuales = np.empty((num_trayectorias, plazo_años + 1))
+    saldos_anuales[:, 0] = monto_inicial
+    saldos_anuales[:, 1:] = ((monto_inicial + aporte_periodico * aportes_descontados[:, cierres])
+                             / descuento[:, cierres])
+    return saldos_anuales
+
+
+def dividir_en_bloques(num_simulaciones, total_periodos, max_celdas_bloque=MAX_CELDAS_BLOQUE):
+    """Retorna los tamaños de bloque que cubren num_simulaciones trayectorias"""
+    por_bloque = max(1, max_celdas_bloque // max(total_periodos, 1))
+    tamaños = [por_bloque] * (num_simulaciones // por_bloque)
+    if num_simulaciones % por_bloque:
+        tamaños.append(num_simulaciones % por_bloque)
+    return tamaños
+
+
+def resumir_bloque_aportes(semilla, num_trayectorias, parametros, percentiles, objetivo):
+    """
+    Tarea de un bloque: simula sus trayectorias y las reduce a lo que se combina
+
+    Returns:
+        tuple: (percentiles por año (len(percentiles) × años + 1), suma de los
+                saldos finales, trayectorias que alcanzan el objetivo)
+    """
+    saldos_anuales = simular_bloque_aportes(semilla, num_trayectorias, *parametros)
+    saldos_finales = saldos_anuales[:, -1]
+    alcanzan = int(np.count_nonzero(saldos_finales >= objetivo)) if objetivo is not None else 0
+    return np.percentile(saldos_anuales, percentiles, axis=0), float(saldos_finales.sum()), alcanzan
+
+
+def simular_aportes_montecarlo(monto_inicial, aporte_periodico, tea, volatilidad,
+                               frecuencia, plazo_años, num_simulaciones=NUM_SIMULACIONES,
+                               objetivo=None, semilla=None, retornos_historicos=None,
+                               percentiles=PERCENTILES_BANDAS,
+                               max_celdas_bloque=MAX_CELDAS_BLOQUE, pool=None):
+    """
+    Simulación Monte Carlo del crecimiento con aportes periódicos
+
+    Cada bloque se reduce a sus percentiles por año en cuanto se simula, así
+    que la memoria no crece con num_simulaciones. Las bandas son la media de
+    los percentiles de los bloques ponderada por su tamaño (exactas si hay un
+    solo bloque); la media final y la probabilidad del objetivo son exactas.
+
+    Args:
+        monto_inicial (float): Capital inicial
+        aporte_periodico (float): Aporte de cada periodo
+        tea (float): Rendimiento anual esperado (media de 1 + R = 1 + TEA)
+        volatilidad (float): Desviación estándar anual de los log-retornos
+        frecuencia (str): Frecuencia de aportes
+        plazo_años (int): Años de inversión
+        num_simulaciones (int): Número de trayectorias
+        objetivo (float): Capital meta para calcular la probabilidad de alcanzarlo
+        semilla (int): Semilla para reproducibilidad
+        retornos_historicos (array): Retornos anuales para bootstrap (ignora
+            tea y volatilidad)
+        percentiles (tuple): Percentiles de las bandas
+        max_celdas_bloque (int): Límite de memoria por bloque
+        pool (Executor): Pool (de larga vida) donde repartir los bloques;
+            None = simular en el proceso actual
+
+    Returns:
+        dict: años, bandas {percentil: saldos por año}, media_final,
+              probabilidad_objetivo (None si no hay objetivo) y num_simulaciones
+    """
+    total_periodos = int(plazo_años) * obtener_periodos_por_año(frecuencia)
+    tamaños = dividir_en_bloques(num_simulaciones, total_periodos, max_celdas_bloque)
+    semillas = np.random.SeedSequence(semilla).spawn(len(tamaños))
+
+    parametros = (monto_inicial, aporte_periodico, tea, volatilidad, frecuencia,
+                  plazo_años, retornos_historicos)
+    argumentos = ([parametros] * len(tamaños), [percentiles] * len(tamaños),
+                  [objetivo] * len(tamaños))
+
+    if pool is not None and len(tamaños) > 1:
+        resumenes = list(pool.map(resumir_bloque_aportes, semillas, tamaños, *argumentos))
+    else:
+        resumenes = list(map(resumir_bloque_aportes, semillas, tamaños, *argumentos))
+
+    pesos = np.asarray(tamaños, dtype=float)[:, None, None] / num_simulaciones
+    valores_bandas = np.sum(np.asarray([r[0] for r in resumenes]) * pesos, axis=0)
+
+    return {
+        'años': np.arange(int(plazo_años) + 1),
+        'bandas': dict(zip(percentiles, valores_bandas)),
+        'media_final': sum(r[1] for r in resumenes) / num_simulaciones,
+        'probabilidad_objetivo': (sum(r[2] for r in resumenes) / num_simulaciones
+                                  if objetivo is not None else None),
+        'num_simulaciones': num_simulaciones
+    }
+
+
+# ==================== RETIRO (DESACUMULACIÓN) ====================
+
+EDAD_MAXIMA_RETIRO = 100
+NUM_ESCENARIOS_RETIRO = 5_000
+
+# Tolerancia relativa para considerar el capital agotado (evita falsos
+# "no agotado" por redondeo cuando la pensión consume el capital exacto)
+TOLERANCIA_AGOTAMIENTO = 1e-9
+
+
+def simular_bloque_retiro(semilla, num_escenarios, capital_inicial, pension_mensual, tea,
+                          volatilidad, inflacion, años_maximos):
+    """
+    Simula un bloque de escenarios de retiro mes a mes
+
+    Con G_m = Π(1 + r_j) el saldo es B_m = G_m × (C - Σ_{j≤m} W_j / G_j), y el
+    capital se agota en el primer mes en que la suma de retiros descontados
+    alcanza al capital inicial.
+
+    Returns:
+        tuple: (saldos al cierre de cada año (escenarios × años + 1),
+                mes de agotamiento por escenario; NaN si no se agota)
+    """
+    generador = np.random.default_rng(semilla)
+    total_meses = años_maximos * 12
+
+    log_retornos = generar_log_retornos(generador, num_escenarios, años_maximos, 12,
+                                        tea, volatilidad)
+    descuento = np.exp(-np.cumsum(log_retornos, axis=1))
+
+    # Retiros indexados: W_m = P × (1 + π)^((m - 1) / 12)
+    retiros = pension_mensual * np.power(1 + inflacion, np.arange(total_meses) / 12)
+    retiros_descontados = np.cumsum(retiros * descuento, axis=1)
+
+    agotado = retiros_descontados >= capital_inicial * (1 - TOLERANCIA_AGOTAMIENTO)
+    mes_agotamiento = np.where(agotado.any(axis=1), agotado.argmax(axis=1) + 1, np.nan)
+
+    cierres = slice(11, None, 12)
+    saldos_anuales = np.empty((num_escenarios, años_maximos + 1))
+    saldos_anuales[:, 0] = capital_inicial
+    saldos_anuales[:, 1:] = np.maximum(
+        (capital_inicial - retiros_descontados[:, cierres]) / descuento[:, cierres], 0
+    )
+    saldos_anuales[:, 1:][agotado[:, cierres]] = 0
+    return saldos_anuales, mes_agotamiento
+
+
+def simular_retiro(capital_inicial, pension_mensual, tea, edad_jubilacion, volatilidad=0.0,
+                   inflacion=0.0, edad_maxima=EDAD_MAXIMA_RETIRO,
+                   num_escenarios=NUM_ESCENARIOS_RETIRO, semilla=None,
+                   percentiles=PERCENTILES_BANDAS, max_celdas_bloque=MAX_CELDAS_BLOQUE):
+    """
+    Simulación del consumo del capital durante el retiro
+
+    Args:
+        capital_inicial (float): Capital neto al jubilarse
+        pension_mensual (float): Retiro del primer mes
+        tea (float): Rendimiento anual esperado durante el retiro
+        edad_jubilacion (int): Edad al inicio del retiro
+        volatilidad (float): Volatilidad anual; con 0 basta un escenario
+        inflacion (float): Inflación anual a la que se indexan los retiros
+        edad_maxima (int): Edad hasta la que se proyecta
+        num_escenarios (int): Número de escenarios
+        semilla (int): Semilla para reproducibilidad
+        percentiles (tuple): Percentiles de las bandas de saldo
+        max_celdas_bloque (int): Límite de memoria por bloque
+
+    Returns:
+        dict: edades, bandas de saldo por año, probabilidad_supervivencia
+              (fracción de escenarios con capital al cierre de cada año),
+              edades_agotamiento (NaN si no se agota), edad_agotamiento_mediana
+              (None si no se agota más de la mitad de los escenarios)
+              y probabilidad_agotamiento
+    """
+    años_maximos = max(int(edad_maxima - edad_jubilacion), 1)
+    if volatilidad == 0:
+        num_escenarios = 1
+    tamaños = dividir_en_bloques(num_escenarios, años_maximos * 12, max_celdas_bloque)
+    semillas = np.random.SeedSequence(semilla).spawn(len(tamaños))
+
+    saldos_anuales = np.empty((num_escenarios, años_maximos + 1))
+    meses_agotamiento = np.empty(num_escenarios)
+    inicio = 0
+    for semilla_bloque, tamaño in zip(semillas, tamaños):
+        bloque = slice(inicio, inicio + tamaño)
+        saldos_anuales[bloque], meses_agotamiento[bloque] = simular_bloque_retiro(
+            semilla_bloque, tamaño, capital_inicial, pension_mensual, tea,
+            volatilidad, inflacion, años_maximos
+        )
+        inicio += tamaño
+
+    años = np.arange(años_maximos + 1)
+    meses_ordenados = np.sort(np.nan_to_num(meses_agotamiento, nan=np.inf))
+    sobreviven = num_escenarios - np.searchsorted(meses_ordenados, años * 12, side='right')
+    edades_agotamiento = edad_jubilacion + meses_agotamiento / 12
+    probabilidad_agotamiento = float(np.mean(~np.isnan(meses_agotamiento)))
+
+    return {
+        'edades': edad_jubilacion + años,
+        'bandas': dict(zip(percentiles, np.percentile(saldos_anuales, percentiles, axis=0))),
+        'probabilidad_supervivencia': sobreviven / num_escenarios,
+        'edades_agotamiento': edades_agotamiento,
+        'edad_agotamiento_mediana': (float(edad_jubilacion + meses_ordenados[num_escenarios // 2] / 12)
+                                     if probabilidad_agotamiento > 0.5 else None),
+        'probabilidad_agotamiento': probabilidad_agotamiento,
+        'num_escenarios': num_escenarios
+    }
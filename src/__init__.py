@@ -0,0 +1,9 @@
+"""
+Paquetes de la aplicación
+
+- calculations: núcleo numérico (solo NumPy), importable sin interfaz
+- visualization: gráficos Plotly y tablas
+- utils: exportaciones (ReportLab) y archivos por lotes (CSV/Parquet)
+
+Los subpaquetes no se importan aquí: cada consumidor carga solo lo que usa.
+"""
@@ -0,0 +1 @@
+"""Núcleo numérico de bonos y de proyección de jubilación (sin Streamlit, Plotly ni ReportLab)"""
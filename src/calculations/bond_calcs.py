@@ -0,0 +1,512 @@
+"""
+Núcleo numérico de la valoración de bonos
+
+Solo depende de NumPy y de la conversión de tasas compartida (tasas.py): sin
+Streamlit, Plotly ni ReportLab, para que las calculadoras, los scripts y los
+consumidores sin interfaz puedan importarlo sin arrastrar la capa visual.
+"""
+import numpy as np
+
+from tasas import (
+    obtener_periodos_por_año,
+    obtener_periodos_por_año_arreglo,
+    calcular_tasa_periodica,
+    convertir_tea_a_tasa_periodica
+)
+
+# ==================== FUNCIONES DE CÁLCULO DEL BONO ====================
+
+def calcular_cupon_periodico(valor_nominal, tasa_cupon_anual, frecuencia):
+    """
+    Calcula el cupón periódico del bono
+    
+    Args:
+        valor_nominal (float): Valor nominal del bono
+        tasa_cupon_anual (float): TEA del cupón en decimal
+        frecuencia (str): Frecuencia de pago del cupón
+    
+    Returns:
+        float: Cupón periódico
+    """
+    tasa_cupon_periodica = convertir_tea_a_tasa_periodica(tasa_cupon_anual, frecuencia)
+    cupon_periodico = valor_nominal * tasa_cupon_periodica
+    return cupon_periodico
+
+def generar_flujos_de_caja(valor_nominal, cupon_periodico, num_periodos):
+    """
+    Genera todos los flujos de caja del bono
+    
+    Args:
+        valor_nominal (float): Valor nominal del bono
+        cupon_periodico (float): Cupón periódico
+        num_periodos (int): Número total de periodos
+    
+    Returns:
+        np.ndarray: Flujos de caja por periodo (cupón en cada periodo,
+        cupón + valor nominal en el último)
+    """
+    flujos = np.full(num_periodos, cupon_periodico, dtype=float)
+    
+    if num_periodos > 0:
+        # Último periodo: cupón + valor nominal
+        flujos[-1] += valor_nominal
+    
+    return flujos
+
+def calcular_valor_presente_flujos(flujos, tasa_descuento_periodica):
+    """
+    Calcula el valor presente de cada flujo de caja
+    
+    Args:
+        flujos (array-like): Flujos de caja desde el periodo 1
+        tasa_descuento_periodica (float): Tasa de descuento periódica en decimal
+    
+    Returns:
+        np.ndarray: Valor presente de cada flujo
+    """
+    flujos = np.asarray(flujos, dtype=float)
+    periodos = np.arange(1, len(flujos) + 1)
+    return flujos / (1 + tasa_descuento_periodica) ** periodos
+
+def calcular_arreglos_bono(valor_nominal, cupon_periodico, num_periodos, tasa_descuento_periodica):
+    """
+    Motor vectorizado del bono: calcula en una sola pasada con NumPy los
+    flujos, factores de descuento, valores presentes y VP acumulado.
+    
+    Args:
+        valor_nominal (float): Valor nominal del bono
+        cupon_periodico (float): Cupón periódico
+        num_periodos (int): Número total de periodos
+        tasa_descuento_periodica (float): Tasa de descuento periódica en decimal
+    
+    Returns:
+        dict: Arreglos 'periodos', 'flujos', 'factores_descuento',
+        'valores_presentes' y 'vp_acumulado' (np.ndarray de largo num_periodos)
+    """
+    periodos = np.arange(1, num_periodos + 1)
+    flujos = generar_flujos_de_caja(valor_nominal, cupon_periodico, num_periodos)
+    
+    # (1 + i)^t para todos los periodos a la vez
+    capitalizacion = (1 + tasa_descuento_periodica) ** periodos
+    factores_descuento = 1 / capitalizacion
+    valores_presentes = flujos / capitalizacion
+    vp_acumulado = np.cumsum(valores_presentes)
+    
+    return {
+        'periodos': periodos,
+        'flujos': flujos,
+        'factores_descuento': factores_descuento,
+        'valores_presentes': valores_presentes,
+        'vp_acumulado': vp_acumulado
+    }
+
+def calcular_medidas_riesgo_bono(valores_presentes, periodos, periodos_por_año, tasa_descuento_anual):
+    """
+    Calcula duración, duración modificada, convexidad y DV01 a partir de los
+    valores presentes ya calculados (sin revalorar el bono)
+    
+    Las medidas se expresan respecto a la TEA de descuento y en años:
+    
+    - Duración de Macaulay: D = Σ (t/m) × VP_t / P
+    - Duración modificada: D* = D / (1 + TEA)
+    - Convexidad: C = Σ (t/m)(t/m + 1) × VP_t / [P × (1 + TEA)²]
+    - DV01: cambio del precio ante +1 punto básico de TEA = D* × P × 0.0001
+    
+    Args:
+        valores_presentes (np.ndarray): VP de cada flujo
+        periodos (np.ndarray): Número de periodo de cada flujo (1..n)
+        periodos_por_año (int): Periodos por año (m)
+        tasa_descuento_anual (float): TEA de descuento en decimal
+    
+    Returns:
+        dict: 'duracion_macaulay', 'duracion_modificada', 'convexidad', 'dv01'
+    """
+    valor_presente_total = valores_presentes.sum()
+    if valor_presente_total == 0:
+        return {'duracion_macaulay': 0.0, 'duracion_modificada': 0.0, 'convexidad': 0.0, 'dv01': 0.0}
+    
+    tiempos = periodos / periodos_por_año
+    duracion_macaulay = float(np.dot(tiempos, valores_presentes) / valor_presente_total)
+    duracion_modificada = duracion_macaulay / (1 + tasa_descuento_anual)
+    convexidad = float(np.dot(tiempos * (tiempos + 1), valores_presentes)
+                       / (valor_presente_total * (1 + tasa_descuento_anual) ** 2))
+    
+    return {
+        'duracion_macaulay': duracion_macaulay,
+        'duracion_modificada': duracion_modificada,
+        'convexidad': convexidad,
+        'dv01': float(duracion_modificada * valor_presente_total * 0.0001)
+    }
+
+def aproximar_precio_bono(resultados, tasas_descuento_anual, orden=2):
+    """
+    Aproxima el precio del bono ante otras TEAs de descuento usando la
+    duración modificada (orden 1) y la convexidad (orden 2), sin revalorar:
+    
+    P(y) ≈ P₀ × [1 - D* × Δy + ½ × C × Δy²]
+    
+    Args:
+        resultados (dict): Resultado de calcular_valor_presente_bono_completo
+        tasas_descuento_anual (float | np.ndarray): TEAs a evaluar
+        orden (int): 1 (solo duración) o 2 (duración + convexidad)
+    
+    Returns:
+        float | np.ndarray: Precios aproximados
+    """
+    delta = np.asarray(tasas_descuento_anual, dtype=float) - resultados['tasa_descuento_anual']
+    variacion = -resultados['duracion_modificada'] * delta
+    if orden >= 2:
+        variacion = variacion + 0.5 * resultados['convexidad'] * delta ** 2
+    return (resultados['valor_presente_total'] * (1 + variacion))[()]
+
+def calcular_valor_presente_bono_completo(valor_nominal, tasa_cupon_anual, frecuencia, 
+                                          plazo_años, tasa_descuento_anual):
+    """
+    Calcula el valor presente total del bono y genera desglose completo
+    
+    Args:
+        valor_nominal (float): Valor nominal del bono en USD
+        tasa_cupon_anual (float): TEA del cupón en decimal
+        frecuencia (str): Frecuencia de pago
+        plazo_años (float): Plazo al vencimiento en años
+        tasa_descuento_anual (float): TEA de descuento en decimal
+    
+    Returns:
+        dict: Diccionario con todos los cálculos y resultados, incluidas las
+        medidas de riesgo de calcular_medidas_riesgo_bono. Los desgloses
+        por periodo ('flujos', 'valores_presentes', 'vp_acumulado',
+        'factores_descuento', 'periodos') son np.ndarray.
+    """
+    # Calcular número de periodos
+    periodos_por_año = obtener_periodos_por_año(frecuencia)
+    num_periodos = int(plazo_años * periodos_por_año)
+    
+    # Convertir tasas anuales a periódicas
+    tasa_cupon_periodica = convertir_tea_a_tasa_periodica(tasa_cupon_anual, frecuencia)
+    tasa_descuento_periodica = convertir_tea_a_tasa_periodica(tasa_descuento_anual, frecuencia)
+    
+    # Calcular cupón periódico
+    cupon_periodico = valor_nominal * tasa_cupon_periodica
+    
+    # Flujos, descuentos y VP acumulado en una sola pasada vectorizada
+    arreglos = calcular_arreglos_bono(
+        valor_nominal, cupon_periodico, num_periodos, tasa_descuento_periodica
+    )
+    vp_acumulado = arreglos['vp_acumulado']
+    
+    # Valor presente total del bono (último VP acumulado)
+    valor_presente_total = float(vp_acumulado[-1]) if num_periodos > 0 else 0.0
+    
+    # Duración, convexidad y DV01 sobre los mismos arreglos
+    medidas_riesgo = calcular_medidas_riesgo_bono(
+        arreglos['valores_presentes'], arreglos['periodos'], periodos_por_año, tasa_descuento_anual
+    )
+    
+    # Retornar diccionario con todos los resultados
+    return {
+        'valor_presente_total': valor_presente_total,
+        'tasa_descuento_anual': tasa_descuento_anual,
+        'cupon_periodico': cupon_periodico,
+        'tasa_cupon_periodica': tasa_cupon_periodica,
+        'tasa_descuento_periodica': tasa_descuento_periodica,
+        'num_periodos': num_periodos,
+        'periodos_por_año': periodos_por_año,
+        'periodos': arreglos['periodos'],
+        'flujos': arreglos['flujos'],
+        'factores_descuento': arreglos['factores_descuento'],
+        'valores_presentes': arreglos['valores_presentes'],
+        'vp_acumulado': vp_acumulado,
+        **medidas_riesgo
+    }
+
+# ==================== FÓRMULA CERRADA (VÍA RÁPIDA) ====================
+
+def calcular_factor_anualidad(tasa_periodica, num_periodos):
+    """
+    Factor de valor presente de una anualidad vencida:
+    
+    a(n, i) = [1 - (1 + i)^-n] / i      (a = n cuando i = 0)
+    
+    Args:
+        tasa_periodica (float | np.ndarray): Tasa periódica en decimal
+        num_periodos (int | np.ndarray): Número de periodos
+    
+    Returns:
+        float | np.ndarray: Factor de anualidad (se admite broadcasting)
+    """
+    tasa = np.asarray(tasa_periodica, dtype=float)
+    n = np.asarray(num_periodos, dtype=float)
+    
+    # 1 - (1 + i)^-n con expm1/log1p para no perder precisión con tasas pequeñas
+    descuento_total = -np.expm1(-n * np.log1p(tasa))
+    tasa_segura = np.where(tasa == 0, 1.0, tasa)
+    factor = np.where(tasa == 0, n, descuento_total / tasa_segura)
+    return factor[()]
+
+def calcular_factor_anualidad_creciente(tasa_periodica, num_periodos):
+    """
+    Suma de los factores de descuento ponderados por el tiempo:
+    
+    Σ t / (1 + i)^t = [a(n, i) × (1 + i) - n / (1 + i)^n] / i      (= n(n+1)/2 cuando i = 0)
+    
+    Es la base de la derivada del precio y de la duración en fórmula cerrada.
+    
+    Args:
+        tasa_periodica (float | np.ndarray): Tasa periódica en decimal
+        num_periodos (int | np.ndarray): Número de periodos
+    
+    Returns:
+        float | np.ndarray: Factor de anualidad creciente
+    """
+    tasa = np.asarray(tasa_periodica, dtype=float)
+    n = np.asarray(num_periodos, dtype=float)
+    
+    # Cerca de i = 0 la resta pierde precisión: se usa el límite n(n+1)/2
+    casi_cero = np.abs(tasa) < 1e-9
+    tasa_segura = np.where(casi_cero, 1.0, tasa)
+    factor = (calcular_factor_anualidad(tasa_segura, n) * (1 + tasa_segura)
+              - n * (1 + tasa_segura) ** -n) / tasa_segura
+    return np.where(casi_cero, n * (n + 1) / 2, factor)[()]
+
+def calcular_vp_bono_cerrado(valor_nominal, cupon_periodico, num_periodos, tasa_descuento_periodica):
+    """
+    Valor presente de un bono de cupón constante con pago del principal al
+    vencimiento, en O(1) usando la fórmula de anualidad:
+    
+    VP = C × a(n, i) + VN / (1 + i)^n
+    
+    Todos los argumentos admiten arreglos NumPy con broadcasting.
+    
+    Args:
+        valor_nominal (float | np.ndarray): Valor nominal del bono
+        cupon_periodico (float | np.ndarray): Cupón periódico
+        num_periodos (int | np.ndarray): Número total de periodos
+        tasa_descuento_periodica (float | np.ndarray): Tasa de descuento periódica
+    
+    Returns:
+        float | np.ndarray: Valor presente (0 si el bono no tiene periodos)
+    """
+    n = np.asarray(num_periodos)
+    vp = (cupon_periodico * calcular_factor_anualidad(tasa_descuento_periodica, n)
+          + valor_nominal * (1 + np.asarray(tasa_descuento_periodica, dtype=float)) ** -n.astype(float))
+    return np.where(n > 0, vp, 0.0)[()]
+
+def calcular_precio_bono(valor_nominal, tasa_cupon_anual, frecuencia, plazo_años, tasa_descuento_anual):
+    """
+    Vía rápida de calcular_valor_presente_bono_completo: retorna solo el
+    valor presente, sin generar el cronograma de flujos.
+    
+    Args:
+        valor_nominal (float): Valor nominal del bono
+        tasa_cupon_anual (float): TEA del cupón en decimal
+        frecuencia (str): Frecuencia de pago
+        plazo_años (float): Plazo al vencimiento en años
+        tasa_descuento_anual (float | np.ndarray): TEA de descuento en decimal;
+            con un arreglo se valoran todas las tasas a la vez
+    
+    Returns:
+        float | np.ndarray: Valor presente del bono
+    """
+    n = obtener_periodos_por_año(frecuencia)
+    num_periodos = int(plazo_años * n)
+    cupon_periodico = valor_nominal * convertir_tea_a_tasa_periodica(tasa_cupon_anual, frecuencia)
+    tasa_descuento_periodica = calcular_tasa_periodica(tasa_descuento_anual, n)
+    return calcular_vp_bono_cerrado(valor_nominal, cupon_periodico, num_periodos, tasa_descuento_periodica)
+
+# ==================== VALORACIÓN DE CARTERAS (LOTE) ====================
+
+COLUMNAS_LOTE_BONOS = ['valor_nominal', 'tasa_cupon_anual', 'frecuencia', 'plazo_años', 'tasa_descuento_anual']
+
+# Máximo de celdas (bonos × periodos) por bloque de la matriz rellenada
+MAX_CELDAS_BLOQUE = 2_000_000
+
+def preparar_especificaciones_bonos(bonos):
+    """
+    Convierte las especificaciones de una cartera de bonos en arreglos NumPy
+    
+    Args:
+        bonos (pd.DataFrame | dict): Columnas de COLUMNAS_LOTE_BONOS, una fila
+            (o posición) por bono. La frecuencia puede ser el nombre
+            ("Mensual", "Semestral", ...) de cada bono.
+    
+    Returns:
+        dict: 'valor_nominal', 'periodos_por_año', 'num_periodos',
+        'tasa_cupon_periodica', 'tasa_descuento_periodica' y 'cupon_periodico'
+        como np.ndarray de largo igual al número de bonos
+    
+    Raises:
+        ValueError: Si faltan columnas o alguna frecuencia no está en FRECUENCIAS
+    """
+    faltantes = [col for col in COLUMNAS_LOTE_BONOS if col not in bonos]
+    if faltantes:
+        raise ValueError(f"Faltan columnas en la cartera de bonos: {', '.join(faltantes)}")
+    
+    valor_nominal = np.asarray(bonos['valor_nominal'], dtype=float)
+    tasa_cupon_anual = np.asarray(bonos['tasa_cupon_anual'], dtype=float)
+    plazo_años = np.asarray(bonos['plazo_años'], dtype=float)
+    tasa_descuento_anual = np.asarray(bonos['tasa_descuento_anual'], dtype=float)
+    
+    # Solo se resuelve cada frecuencia distinta una vez (desconocida = ValueError)
+    periodos_por_año = obtener_periodos_por_año_arreglo(
+        bonos['frecuencia'], getattr(bonos, 'index', None)
+    )
+    
+    num_periodos = (plazo_años * periodos_por_año).astype(int)
+    tasa_cupon_periodica = calcular_tasa_periodica(tasa_cupon_anual, periodos_por_año)
+    tasa_descuento_periodica = calcular_tasa_periodica(tasa_descuento_anual, periodos_por_año)
+    
+    return {
+        'valor_nominal': valor_nominal,
+        'periodos_por_año': periodos_por_año,
+        'num_periodos': num_periodos,
+        'tasa_cupon_periodica': tasa_cupon_periodica,
+        'tasa_descuento_periodica': tasa_descuento_periodica,
+        'cupon_periodico': valor_nominal * tasa_cupon_periodica
+    }
+
+def calcular_valor_presente_bonos_lote(bonos, metodo='cerrado', max_celdas_bloque=MAX_CELDAS_BLOQUE):
+    """
+    Calcula el valor presente de toda una cartera de bonos en una sola llamada
+    
+    Con metodo='cerrado' (por defecto) cada bono se valora en O(1) con la
+    fórmula de anualidad. Con metodo='matriz' los bonos se ordenan por número
+    de periodos y se valoran por bloques como una matriz rellenada
+    (bonos × periodos) con máscara, de modo que cada bloque solo se rellena
+    hasta el plazo más largo que contiene.
+    
+    Args:
+        bonos (pd.DataFrame | dict): Especificaciones de la cartera
+            (ver preparar_especificaciones_bonos)
+        metodo (str): 'cerrado' o 'matriz'
+        max_celdas_bloque (int): Límite de celdas de la matriz por bloque,
+            acota la memoria usada en carteras grandes (solo metodo='matriz')
+    
+    Returns:
+        np.ndarray: Valor presente de cada bono, en el orden de entrada
+    """
+    specs = preparar_especificaciones_bonos(bonos)
+    num_periodos = specs['num_periodos']
+    
+    if metodo == 'cerrado':
+        return np.atleast_1d(calcular_vp_bono_cerrado(
+            specs['valor_nominal'], specs['cupon_periodico'],
+            num_periodos, specs['tasa_descuento_periodica']
+        ))
+    if metodo != 'matriz':
+        raise ValueError(f"Método de valoración desconocido: {metodo}")
+    
+    valores_presentes = np.zeros(len(num_periodos))
+    
+    orden = np.argsort(num_periodos, kind='stable')
+    n_ordenado = np.maximum(num_periodos[orden], 1)
+    inicio = 0
+    while inicio < len(orden):
+        # Filas del bloque: la más larga define el ancho (orden ascendente)
+        costo_celdas = np.arange(1, len(orden) - inicio + 1) * n_ordenado[inicio:]
+        fin = inicio + max(1, int(np.searchsorted(costo_celdas, max_celdas_bloque, side='right')))
+        
+        idx = orden[inicio:fin]
+        n = num_periodos[idx]
+        periodos = np.arange(1, n.max(initial=0) + 1)
+        
+        # Matriz rellenada: la máscara anula los periodos posteriores al vencimiento
+        mascara = periodos[np.newaxis, :] <= n[:, np.newaxis]
+        capitalizacion = (1 + specs['tasa_descuento_periodica'][idx, np.newaxis]) ** periodos
+        vp_cupones = (mascara * specs['cupon_periodico'][idx, np.newaxis] / capitalizacion).sum(axis=1)
+        vp_nominal = specs['valor_nominal'][idx] / (1 + specs['tasa_descuento_periodica'][idx]) ** n
+        
+        valores_presentes[idx] = np.where(n > 0, vp_cupones + vp_nominal, 0.0)
+        inicio = fin
+    
+    return valores_presentes
+
+def calcular_medidas_riesgo_cerradas(valor_nominal, cupon_periodico, num_periodos,
+                                     tasa_descuento_periodica, periodos_por_año, tasa_descuento_anual):
+    """
+    Valor presente, duración y DV01 en fórmula cerrada (sin cronograma),
+    con las mismas definiciones que calcular_medidas_riesgo_bono:
+    
+    D = [C × Σ t/(1+i)^t + VN × n/(1+i)^n] / (P × m)
+    
+    Todos los argumentos admiten arreglos NumPy con broadcasting.
+    
+    Returns:
+        dict: 'valor_presente', 'duracion_macaulay', 'duracion_modificada' y 'dv01'
+        (medidas en 0 para bonos sin periodos o con VP nulo)
+    """
+    tasa = np.asarray(tasa_descuento_periodica, dtype=float)
+    n = np.asarray(num_periodos, dtype=float)
+    valor_presente = np.asarray(calcular_vp_bono_cerrado(valor_nominal, cupon_periodico, num_periodos, tasa))
+    suma_ponderada = (cupon_periodico * calcular_factor_anualidad_creciente(tasa, n)
+                      + valor_nominal * n * (1 + tasa) ** -n)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        duracion_macaulay = np.where(valor_presente != 0,
+                                     suma_ponderada / (valor_presente * periodos_por_año), 0.0)
+    duracion_modificada = duracion_macaulay / (1 + np.asarray(tasa_descuento_anual, dtype=float))
+    
+    return {
+        'valor_presente': valor_presente[()],
+        'duracion_macaulay': duracion_macaulay[()],
+        'duracion_modificada': duracion_modificada[()],
+        'dv01': (duracion_modificada * valor_presente * 0.0001)[()]
+    }
+
+def calcular_medidas_riesgo_bonos_lote(bonos):
+    """
+    Valor presente, duración de Macaulay, duración modificada y DV01 de cada
+    bono de una cartera (ver preparar_especificaciones_bonos)
+    
+    Returns:
+        dict: Claves de calcular_medidas_riesgo_cerradas, como np.ndarray
+    """
+    specs = preparar_especificaciones_bonos(bonos)
+    medidas = calcular_medidas_riesgo_cerradas(
+        specs['valor_nominal'], specs['cupon_periodico'], specs['num_periodos'],
+        specs['tasa_descuento_periodica'], specs['periodos_por_año'],
+        np.asarray(bonos['tasa_descuento_anual'], dtype=float)
+    )
+    return {clave: np.atleast_1d(valor) for clave, valor in medidas.items()}
+
+# ==================== API DE LA PÁGINA DE BONOS ====================
+
+def calcular_valor_presente_bono(valor_nominal, tasa_cupon_anual, frecuencia_anual, años,
+                                 tea_descuento):
+    """
+    Valor presente del bono con el desglose por flujo que usa bonos_page.py
+    
+    Args:
+        valor_nominal (float): Valor nominal del bono
+        tasa_cupon_anual (float): TEA del cupón en decimal
+        frecuencia_anual (int): Pagos por año
+        años (float): Plazo al vencimiento en años
+        tea_descuento (float): TEA de descuento en decimal
+    
+    Returns:
+        dict: valor_presente_total, cupon_periodico, num_periodos,
+        tasa_cupon_periodo, tasa_descuento_periodo y flujos (lista de dicts
+        con periodo, flujo, factor_descuento y vp_flujo)
+    """
+    num_periodos = int(años * frecuencia_anual)
+    tasa_cupon_periodo = calcular_tasa_periodica(tasa_cupon_anual, frecuencia_anual)
+    tasa_descuento_periodo = calcular_tasa_periodica(tea_descuento, frecuencia_anual)
+    cupon_periodico = valor_nominal * tasa_cupon_periodo
+    
+    arreglos = calcular_arreglos_bono(valor_nominal, cupon_periodico, num_periodos,
+                                      tasa_descuento_periodo)
+    flujos = [
+        {'periodo': periodo, 'flujo': flujo, 'factor_descuento': factor, 'vp_flujo': vp}
+        for periodo, flujo, factor, vp in zip(
+            arreglos['periodos'].tolist(), arreglos['flujos'].tolist(),
+            arreglos['factores_descuento'].tolist(), arreglos['valores_presentes'].tolist()
+        )
+    ]
+    
+    return {
+        'valor_presente_total': float(arreglos['vp_acumulado'][-1]) if num_periodos > 0 else 0.0,
+        'cupon_periodico': cupon_periodico,
+        'num_periodos': num_periodos,
+        'tasa_cupon_periodo': tasa_cupon_periodo,
+        'tasa_descuento_periodo': tasa_descuento_periodo,
+        'flujos': flujos
+    }
@@ -0,0 +1,160 @@
+"""
+Núcleo numérico de la proyección de jubilación (Módulos A y B de acciones.py)
+
+Versiones por lotes de calcular_crecimiento_aportes_periodicos,
+calcular_impuestos y calcular_pension_mensual: cada plan es una posición de
+los arreglos y todo se evalúa con fórmulas cerradas, sin bucles por plan.
+Solo depende de NumPy y de tasas.py.
+"""
+import numpy as np
+
+from tasas import obtener_periodos_por_año_arreglo, calcular_tasa_periodica, validar_categorias_lote
+
+# Impuesto sobre las ganancias de capital según el tipo de inversión
+IMPUESTOS = {
+    'USD': 0.295,  # 29.5% para extranjera
+    'PEN': 0.05    # 5% para local
+}
+
+OPCIONES_RETIRO = ["Retiro único", "Pensión mensual"]
+
+# Años de retiro a partir de los cuales la pensión se trata como perpetua
+AÑOS_RETIRO_PERPETUO = 100
+
+COLUMNAS_PLANES = ['edad_actual', 'edad_jubilacion', 'monto_inicial', 'aporte_periodico',
+                   'frecuencia', 'tea', 'moneda', 'opcion_retiro']
+
+# Columnas opcionales: tea_retiro (por defecto la TEA de acumulación) y
+# años_retiro (vacío = pensión perpetua)
+COLUMNAS_OPCIONALES_PLANES = ['tea_retiro', 'años_retiro']
+
+# ==================== MÓDULO A: CRECIMIENTO ====================
+
+def calcular_saldo_final_aportes(monto_inicial, aporte_periodico, tasa_periodica, total_periodos):
+    """
+    Saldo tras total_periodos con aportes al final de cada periodo
+    S_n = VA × (1 + r)^n + A × [(1 + r)^n - 1] / r  (broadcast sobre todos los argumentos)
+    """
+    tasa_periodica = np.asarray(tasa_periodica, dtype=float)
+    total_periodos = np.asarray(total_periodos, dtype=float)
+    crecimiento = np.expm1(total_periodos * np.log1p(tasa_periodica))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        factor_anualidad = np.where(tasa_periodica != 0, crecimiento / tasa_periodica, total_periodos)
+    return monto_inicial * (1 + crecimiento) + aporte_periodico * factor_anualidad
+
+# ==================== MÓDULO B: IMPUESTOS Y PENSIÓN ====================
+
+def obtener_tasas_impuesto_arreglo(monedas, filas=None):
+    """
+    Tasa de impuesto de cada moneda
+
+    Raises:
+        ValueError: Si alguna moneda no está en IMPUESTOS (no se asume 0%)
+    """
+    nombres, indices = validar_categorias_lote(monedas, IMPUESTOS, 'moneda', filas)
+    return np.array([IMPUESTOS[m] for m in nombres], dtype=float)[indices]
+
+
+def calcular_impuestos_lote(capital_final, total_aportado, tasas_impuesto):
+    """
+    Impuesto sobre la ganancia de cada plan (cero si no hay ganancia)
+
+    Returns:
+        tuple: (impuesto, ganancia) como np.ndarray
+    """
+    ganancia = np.asarray(capital_final, dtype=float) - total_aportado
+    impuesto = np.where(ganancia > 0, ganancia * tasas_impuesto, 0.0)
+    return impuesto, ganancia
+
+
+def calcular_pension_mensual_lote(capital_neto, tea_retiro, años_retiro):
+    """
+    Pensión mensual sostenible de cada plan
+
+    Perpetua (P = C × r) donde años_retiro es NaN o >= AÑOS_RETIRO_PERPETUO;
+    si no, anualidad temporal P = C × r / [1 - (1 + r)^-n] (C / n con r = 0).
+
+    Returns:
+        tuple: (pension_mensual, tasa_mensual) como np.ndarray
+    """
+    capital_neto = np.asarray(capital_neto, dtype=float)
+    tasa_mensual = calcular_tasa_periodica(np.asarray(tea_retiro, dtype=float), 12)
+    años_retiro = np.asarray(años_retiro, dtype=float)
+
+    perpetua = np.isnan(años_retiro) | (años_retiro >= AÑOS_RETIRO_PERPETUO)
+    n_meses = np.where(perpetua, 1, np.trunc(np.nan_to_num(años_retiro) * 12))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        factor = np.where(
+            tasa_mensual > 0,
+            tasa_mensual / -np.expm1(-n_meses * np.log1p(tasa_mensual)),
+            1 / n_meses
+        )
+    pension = np.where(perpetua, capital_neto * tasa_mensual, capital_neto * factor)
+    return pension, tasa_mensual
+
+# ==================== PLANES COMPLETOS ====================
+
+def calcular_planes_jubilacion_lote(planes):
+    """
+    Calcula los Módulos A y B para una cartera de planes de jubilación
+
+    Args:
+        planes (pd.DataFrame | dict): Columnas de COLUMNAS_PLANES y, si se
+            desea, de COLUMNAS_OPCIONALES_PLANES. Un depósito único es un plan
+            con aporte_periodico = 0 y frecuencia "Anual".
+
+    Returns:
+        dict: 'plazo_años', 'total_periodos', 'saldo_final', 'total_aportado',
+        'interes_total', 'ganancia', 'tasa_impuesto', 'impuesto', 'capital_neto',
+        'tasa_mensual_retiro' y 'pension_mensual' (NaN para "Retiro único"),
+        como np.ndarray de largo igual al número de planes
+    """
+    faltantes = [col for col in COLUMNAS_PLANES if col not in planes]
+    if faltantes:
+        raise ValueError(f"Faltan columnas en los planes de jubilación: {', '.join(faltantes)}")
+
+    filas = getattr(planes, 'index', None)
+    opcion_retiro = np.asarray(planes['opcion_retiro'], dtype=str)
+    validar_categorias_lote(opcion_retiro, OPCIONES_RETIRO, 'opcion_retiro', filas)
+
+    monto_inicial = np.asarray(planes['monto_inicial'], dtype=float)
+    aporte_periodico = np.asarray(planes['aporte_periodico'], dtype=float)
+    tea = np.asarray(planes['tea'], dtype=float)
+    plazo_años = np.maximum(
+        np.asarray(planes['edad_jubilacion'], dtype=float) - np.asarray(planes['edad_actual'], dtype=float),
+        0
+    )
+
+    # Módulo A: mismo redondeo de periodos que calcular_crecimiento_aportes_periodicos
+    periodos_por_año = obtener_periodos_por_año_arreglo(planes['frecuencia'], filas)
+    total_periodos = np.trunc(plazo_años * periodos_por_año).astype(int)
+    tasa_periodica = calcular_tasa_periodica(tea, periodos_por_año)
+    saldo_final = calcular_saldo_final_aportes(monto_inicial, aporte_periodico,
+                                               tasa_periodica, total_periodos)
+    total_aportado = monto_inicial + aporte_periodico * total_periodos
+
+    # Módulo B
+    tasa_impuesto = obtener_tasas_impuesto_arreglo(planes['moneda'], filas)
+    impuesto, ganancia = calcular_impuestos_lote(saldo_final, total_aportado, tasa_impuesto)
+    capital_neto = saldo_final - impuesto
+
+    tea_retiro = np.asarray(planes['tea_retiro'], dtype=float) if 'tea_retiro' in planes else tea
+    tea_retiro = np.where(np.isnan(tea_retiro), tea, tea_retiro)
+    años_retiro = (np.asarray(planes['años_retiro'], dtype=float) if 'años_retiro' in planes
+                   else np.full(len(tea), np.nan))
+    pension, tasa_mensual = calcular_pension_mensual_lote(capital_neto, tea_retiro, años_retiro)
+    pension = np.where(opcion_retiro == "Pensión mensual", pension, np.nan)
+
+    return {
+        'plazo_años': plazo_años,
+        'total_periodos': total_periodos,
+        'saldo_final': saldo_final,
+        'total_aportado': total_aportado,
+        'interes_total': saldo_final - total_aportado,
+        'ganancia': ganancia,
+        'tasa_impuesto': tasa_impuesto,
+        'impuesto': impuesto,
+        'capital_neto': capital_neto,
+        'tasa_mensual_retiro': tasa_mensual,
+        'pension_mensual': pension
+    }
@@ -0,0 +1 @@
+"""Utilidades de exportación (PDF con ReportLab) y de lectura/escritura por lotes"""
@@ -0,0 +1,121 @@
+"""
+Lectura y escritura por lotes de archivos CSV/Parquet para las herramientas
+de línea de comandos (valorar_bonos.py, proyectar_jubilacion.py)
+"""
+import os
+import time
+
+import pandas as pd
+
+# Filas leídas, calculadas y escritas por iteración
+TAMANO_LOTE_POR_DEFECTO = 100_000
+
+FORMATOS_ARCHIVO = {'.csv': 'csv', '.parquet': 'parquet', '.pq': 'parquet'}
+
+
+def detectar_formato(ruta):
+    """Retorna 'csv' o 'parquet' según la extensión del archivo"""
+    extension = os.path.splitext(ruta)[1].lower()
+    if extension not in FORMATOS_ARCHIVO:
+        raise ValueError(f"Formato no soportado: {ruta} (use .csv o .parquet)")
+    return FORMATOS_ARCHIVO[extension]
+
+
+def leer_por_lotes(ruta, tamano_lote=TAMANO_LOTE_POR_DEFECTO):
+    """
+    Lee un archivo CSV o Parquet como una secuencia de DataFrames
+
+    Args:
+        ruta (str): Archivo de entrada
+        tamano_lote (int): Filas por DataFrame
+
+    Yields:
+        pd.DataFrame: Lote de filas consecutivas, indexado por la posición de
+        cada fila en el archivo (0 = primera fila de datos)
+    """
+    if detectar_formato(ruta) == 'csv':
+        yield from pd.read_csv(ruta, chunksize=tamano_lote)
+        return
+
+    import pyarrow.parquet as pq
+    archivo = pq.ParquetFile(ruta)
+    inicio = 0
+    for lote in archivo.iter_batches(batch_size=tamano_lote):
+        df = lote.to_pandas()
+        df.index = pd.RangeIndex(inicio, inicio + len(df))
+        inicio += len(df)
+        yield df
+
+
+def escribir_por_lotes(lotes, ruta):
+    """
+    Escribe una secuencia de DataFrames en un único archivo CSV o Parquet
+
+    Cada lote se escribe en cuanto llega, así la memoria usada no depende
+    del tamaño total.
+
+    Args:
+        lotes (iterable[pd.DataFrame]): Lotes con las mismas columnas
+        ruta (str): Archivo de salida (se sobrescribe)
+
+    Yields:
+        pd.DataFrame: Cada lote después de escribirlo (para reportar avance)
+    """
+    formato = detectar_formato(ruta)
+    escritor = None
+    try:
+        for i, lote in enumerate(lotes):
+            if formato == 'csv':
+                lote.to_csv(ruta, mode='w' if i == 0 else 'a', header=(i == 0), index=False)
+            else:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+                tabla = pa.Table.from_pandas(lote, preserve_index=False)
+                if escritor is None:
+                    escritor = pq.ParquetWriter(ruta, tabla.schema)
+                escritor.write_table(tabla.cast(escritor.schema))
+            yield lote
+    finally:
+        if escritor is not None:
+            escritor.close()
+
+
+def procesar_archivo(ruta_entrada, ruta_salida, procesar_lote,
+                     tamano_lote=TAMANO_LOTE_POR_DEFECTO, reportar=None):
+    """
+    Lee, transforma y escribe un archivo lote a lote
+
+    Args:
+        ruta_entrada (str): CSV o Parquet de entrada
+        ruta_salida (str): CSV o Parquet de salida
+        procesar_lote (callable): pd.DataFrame -> pd.DataFrame
+        tamano_lote (int): Filas por lote
+        reportar (callable, opcional): Recibe (filas_acumuladas, segundos) tras cada lote
+
+    Returns:
+        dict: 'filas', 'lotes', 'segundos' y 'filas_por_segundo'
+    """
+    inicio = time.perf_counter()
+    lotes = (procesar_lote(lote) for lote in leer_por_lotes(ruta_entrada, tamano_lote))
+
+    filas = 0
+    num_lotes = 0
+    for lote in escribir_por_lotes(lotes, ruta_salida):
+        filas += len(lote)
+        num_lotes += 1
+        if reportar is not None:
+            reportar(filas, time.perf_counter() - inicio)
+
+    segundos = time.perf_counter() - inicio
+    return {
+        'filas': filas,
+        'lotes': num_lotes,
+        'segundos': segundos,
+        'filas_por_segundo': filas / segundos if segundos > 0 else float('inf')
+    }
+
+
+def formatear_avance(filas, segundos, unidad):
+    """Línea de avance: filas acumuladas y velocidad (ej. unidad='bonos')"""
+    velocidad = filas / segundos if segundos > 0 else float('inf')
+    return f"{filas:,} {unidad} en {segundos:.2f} s ({velocidad:,.0f} {unidad}/s)"
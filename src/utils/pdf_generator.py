@@ -0,0 +1,116 @@
+"""
+Reporte PDF de la página de bonos (bonos_page.py)
+"""
+from io import BytesIO
+from datetime import datetime
+
+import pandas as pd
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import inch
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+
+from config.constants import COLORES_BONOS, MONEDA
+
+# Filas de detalle por tabla (las que caben en una página carta)
+FILAS_POR_TABLA_PDF = 28
+
+ESTILO_TABLA = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(COLORES_BONOS['secundario'])),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
+])
+
+
+def crear_tablas_paginadas(encabezado, filas, estilo, anchos_columnas=None,
+                           filas_por_tabla=FILAS_POR_TABLA_PDF):
+    """
+    Divide una tabla larga en tablas del tamaño de una página, cada una con
+    su encabezado, en lugar de una sola tabla gigante que ReportLab tendría
+    que partir
+
+    Args:
+        encabezado (list): Nombres de las columnas
+        filas (list): Filas ya formateadas como texto
+        estilo (TableStyle): Estilo aplicado a cada tabla
+        anchos_columnas (list): Ancho de cada columna (None = automático)
+        filas_por_tabla (int): Filas de detalle por tabla
+
+    Returns:
+        list: Tablas de ReportLab en orden
+    """
+    tablas = []
+    for inicio in range(0, len(filas), filas_por_tabla):
+        tabla = Table([encabezado] + filas[inicio:inicio + filas_por_tabla],
+                      colWidths=anchos_columnas, repeatRows=1)
+        tabla.setStyle(estilo)
+        tablas.append(tabla)
+    return tablas
+
+
+def crear_pdf_bonos(datos_entrada, resultados, df_flujos):
+    """
+    Genera el reporte PDF de la valoración de un bono
+
+    Args:
+        datos_entrada (dict): valor_nominal, tasa_cupon_pct, frecuencia,
+            plazo_años y tea_descuento_pct tal como se ingresaron
+        resultados (dict): Resultado de calcular_valor_presente_bono
+        df_flujos (pd.DataFrame): Tabla de crear_tabla_flujos
+
+    Returns:
+        BytesIO: PDF listo para descargar
+    """
+    output = BytesIO()
+    doc = SimpleDocTemplate(output, pagesize=letter)
+    styles = getSampleStyleSheet()
+    titulo_style = ParagraphStyle(
+        'TituloBono',
+        parent=styles['Heading1'],
+        textColor=colors.HexColor(COLORES_BONOS['principal']),
+        alignment=1
+    )
+
+    elements = [
+        Paragraph("REPORTE DE VALORACIÓN DE BONO", titulo_style),
+        Paragraph(f"<b>Fecha de generación:</b> {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}",
+                  styles['Normal']),
+        Spacer(1, 0.2 * inch),
+        Paragraph("Datos del Bono", styles['Heading2'])
+    ]
+
+    resumen = [
+        ['Parámetro', 'Valor'],
+        ['Valor Nominal', f"{MONEDA} {datos_entrada['valor_nominal']:,.2f}"],
+        ['Tasa Cupón (TEA)', f"{datos_entrada['tasa_cupon_pct']:.2f}%"],
+        ['Frecuencia de Pago', datos_entrada['frecuencia']],
+        ['Plazo', f"{datos_entrada['plazo_años']} años"],
+        ['Tasa de Retorno Esperada (TEA)', f"{datos_entrada['tea_descuento_pct']:.2f}%"],
+        ['Cupón Periódico', f"{MONEDA} {resultados['cupon_periodico']:,.2f}"],
+        ['Número de Pagos', str(resultados['num_periodos'])],
+        ['Valor Presente del Bono', f"{MONEDA} {resultados['valor_presente_total']:,.2f}"]
+    ]
+    tabla_resumen = Table(resumen, colWidths=[3.2 * inch, 2.5 * inch])
+    tabla_resumen.setStyle(ESTILO_TABLA)
+    elements += [tabla_resumen, Spacer(1, 0.3 * inch),
+                 Paragraph("Detalle de Flujos", styles['Heading2'])]
+
+    # Formato por columna y tablas del tamaño de una página con encabezado
+    df_texto = df_flujos.copy()
+    for columna in df_flujos.columns[1:]:
+        if pd.api.types.is_numeric_dtype(df_flujos[columna]):
+            formato = '{:.6f}' if 'Factor' in columna else '{:,.2f}'
+            df_texto[columna] = df_flujos[columna].map(formato.format)
+    encabezado = df_texto.columns.tolist()
+    filas = df_texto.values.tolist()
+
+    elements += crear_tablas_paginadas(encabezado, filas, ESTILO_TABLA)
+
+    doc.build(elements)
+    output.seek(0)
+    return output
@@ -0,0 +1 @@
+"""Gráficos y tablas de la interfaz (dependen de Plotly y pandas)"""
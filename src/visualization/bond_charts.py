@@ -0,0 +1,92 @@
+"""
+Gráficos y tabla de flujos de la página de bonos (bonos_page.py)
+
+Reciben la lista de flujos de calcular_valor_presente_bono: dicts con
+periodo, flujo, factor_descuento y vp_flujo.
+"""
+import pandas as pd
+import plotly.graph_objects as go
+
+from config.constants import COLORES_BONOS
+
+
+def crear_grafico_flujos_bono(flujos, moneda):
+    """Barras de los flujos nominales; el último (cupón + principal) en rojo"""
+    periodos = [f['periodo'] for f in flujos]
+    montos = [f['flujo'] for f in flujos]
+    colores = [COLORES_BONOS['cupon']] * len(flujos)
+    if colores:
+        colores[-1] = COLORES_BONOS['ultimo_flujo']
+    
+    fig = go.Figure(data=[go.Bar(
+        x=periodos,
+        y=montos,
+        marker_color=colores,
+        hovertemplate=f'Periodo %{{x}}<br>Flujo: {moneda} %{{y:,.2f}}<extra></extra>'
+    )])
+    fig.update_layout(
+        xaxis_title='Periodo',
+        yaxis_title=f'Flujo ({moneda})',
+        plot_bgcolor='white',
+        height=450,
+        showlegend=False,
+        yaxis=dict(tickformat=',')
+    )
+    fig.update_yaxes(gridcolor='lightgray')
+    return fig
+
+
+def crear_grafico_valor_presente(flujos, moneda):
+    """Barras agrupadas: flujo nominal frente a su valor presente"""
+    periodos = [f['periodo'] for f in flujos]
+    
+    fig = go.Figure(data=[
+        go.Bar(
+            name='Flujo Nominal',
+            x=periodos,
+            y=[f['flujo'] for f in flujos],
+            marker_color=COLORES_BONOS['valor_nominal'],
+            hovertemplate=f'Periodo %{{x}}<br>Nominal: {moneda} %{{y:,.2f}}<extra></extra>'
+        ),
+        go.Bar(
+            name='Valor Presente',
+            x=periodos,
+            y=[f['vp_flujo'] for f in flujos],
+            marker_color=COLORES_BONOS['valor_presente'],
+            hovertemplate=f'Periodo %{{x}}<br>VP: {moneda} %{{y:,.2f}}<extra></extra>'
+        )
+    ])
+    fig.update_layout(
+        barmode='group',
+        xaxis_title='Periodo',
+        yaxis_title=f'Monto ({moneda})',
+        plot_bgcolor='white',
+        height=450,
+        yaxis=dict(tickformat=',')
+    )
+    fig.update_yaxes(gridcolor='lightgray')
+    return fig
+
+
+def crear_grafico_composicion_bono(vp_cupones, vp_principal, moneda):
+    """Dona con la parte del valor presente que aportan cupones y principal"""
+    fig = go.Figure(data=[go.Pie(
+        labels=['VP de Cupones', 'VP del Valor Nominal'],
+        values=[vp_cupones, vp_principal],
+        hole=0.4,
+        marker=dict(colors=[COLORES_BONOS['cupon'], COLORES_BONOS['valor_nominal']]),
+        texttemplate=f'%{{label}}<br>%{{percent}}<br>{moneda} %{{value:,.2f}}',
+        hovertemplate=f'<b>%{{label}}</b><br>{moneda} %{{value:,.2f}}<br>%{{percent}}<extra></extra>'
+    )])
+    fig.update_layout(height=450)
+    return fig
+
+
+def crear_tabla_flujos(flujos, moneda):
+    """DataFrame con el detalle numérico de cada flujo (apto para CSV y PDF)"""
+    return pd.DataFrame({
+        'Periodo': [f['periodo'] for f in flujos],
+        f'Flujo ({moneda})': [f['flujo'] for f in flujos],
+        'Factor de Descuento': [f['factor_descuento'] for f in flujos],
+        f'Valor Presente ({moneda})': [f['vp_flujo'] for f in flujos]
+    })
@@ -0,0 +1,129 @@
+"""
+Conversión de tasas compartida por bonos y acciones
+
+Tasas equivalentes: TEP = (1 + TEA)^(1/n) - 1, evaluada como
+expm1(log1p(TEA) / n) para no perder precisión con tasas pequeñas.
+
+- Escalares: la conversión se memoriza por (TEA, periodos por año), de modo
+  que los bucles y reruns de Streamlit no recalculan la potencia fraccionaria.
+- Arreglos: las funciones aceptan np.ndarray y hacen broadcasting entre TEAs
+  y periodos por año, como una ufunc de NumPy.
+"""
+import math
+from functools import lru_cache
+
+import numpy as np
+
+FRECUENCIAS = {
+    "Mensual": 12,
+    "Bimestral": 6,
+    "Trimestral": 4,
+    "Cuatrimestral": 3,
+    "Semestral": 2,
+    "Anual": 1
+}
+
+# Periodos por año cuando la frecuencia no se reconoce (anual); solo para
+# escalares: en los lotes una frecuencia desconocida es un error
+PERIODOS_POR_DEFECTO = 1
+
+# Filas con valores desconocidos que se listan en el mensaje de error
+MAX_FILAS_ERROR = 10
+
+MAX_TASAS_CACHE = 4096
+
+
+def obtener_periodos_por_año(frecuencia):
+    """Retorna el número de periodos por año según la frecuencia"""
+    return FRECUENCIAS.get(frecuencia, PERIODOS_POR_DEFECTO)
+
+
+def validar_categorias_lote(valores, permitidos, columna, filas=None):
+    """
+    Comprueba que cada valor de una columna de un lote sea uno de los permitidos
+
+    Args:
+        valores (array-like): Columna del lote
+        permitidos (dict | list): Valores válidos
+        columna (str): Nombre de la columna (para el mensaje de error)
+        filas (array-like): Etiqueta de cada fila (por defecto su posición)
+
+    Returns:
+        tuple: (nombres distintos, índice de cada fila en nombres), como np.unique
+
+    Raises:
+        ValueError: Con los valores desconocidos y las filas donde aparecen
+    """
+    nombres, indices = np.unique(np.asarray(valores, dtype=str), return_inverse=True)
+    desconocidos = [str(nombre) for nombre in nombres if nombre not in permitidos]
+    if desconocidos:
+        filas = np.arange(len(indices)) if filas is None else np.asarray(filas)
+        filas_invalidas = filas[np.isin(nombres, desconocidos)[indices]]
+        detalle = ', '.join(str(fila) for fila in filas_invalidas[:MAX_FILAS_ERROR])
+        if len(filas_invalidas) > MAX_FILAS_ERROR:
+            detalle += f" y {len(filas_invalidas) - MAX_FILAS_ERROR} más"
+        raise ValueError(
+            f"Valor desconocido en '{columna}': {', '.join(map(repr, desconocidos))} "
+            f"(filas {detalle}); valores válidos: {', '.join(permitidos)}"
+        )
+    return nombres, indices
+
+
+def obtener_periodos_por_año_arreglo(frecuencias, filas=None):
+    """
+    Periodos por año para un arreglo de frecuencias (cada nombre distinto se resuelve una vez)
+
+    Raises:
+        ValueError: Si alguna frecuencia no está en FRECUENCIAS
+    """
+    nombres, indices = validar_categorias_lote(frecuencias, FRECUENCIAS, 'frecuencia', filas)
+    return np.array([FRECUENCIAS[f] for f in nombres], dtype=int)[indices]
+
+
+@lru_cache(maxsize=MAX_TASAS_CACHE)
+def calcular_tasa_periodica_cacheada(tea, periodos_por_año):
+    """Tasa periódica equivalente de una TEA escalar (memorizada)"""
+    return math.expm1(math.log1p(tea) / periodos_por_año)
+
+
+def calcular_tasa_periodica(tea, periodos_por_año):
+    """
+    Tasa periódica equivalente: TEP = (1 + TEA)^(1/n) - 1
+
+    Args:
+        tea (float | np.ndarray): TEA en decimal
+        periodos_por_año (int | np.ndarray): n, compatible con tea por broadcasting
+
+    Returns:
+        float | np.ndarray: Tasa efectiva periódica en decimal
+    """
+    if isinstance(tea, (int, float)) and isinstance(periodos_por_año, int):
+        return calcular_tasa_periodica_cacheada(tea, periodos_por_año)
+    if np.ndim(tea) == 0 and np.ndim(periodos_por_año) == 0:
+        return calcular_tasa_periodica_cacheada(float(tea), int(periodos_por_año))
+    return np.expm1(np.log1p(np.asarray(tea, dtype=float)) / periodos_por_año)
+
+
+def calcular_tea_desde_tasa_periodica(tasa_periodica, periodos_por_año):
+    """
+    TEA equivalente a una tasa periódica: TEA = (1 + TEP)^n - 1
+
+    Returns:
+        float | np.ndarray: TEA en decimal
+    """
+    tasa = np.asarray(tasa_periodica, dtype=float)
+    return np.expm1(np.log1p(tasa) * periodos_por_año)[()]
+
+
+def convertir_tea_a_tasa_periodica(tea, frecuencia):
+    """
+    Convierte una Tasa Efectiva Anual (TEA) a tasa efectiva periódica
+
+    Args:
+        tea (float | np.ndarray): TEA en decimal (ej: 0.10 para 10%)
+        frecuencia (str): Frecuencia de pago o de aportes
+
+    Returns:
+        float | np.ndarray: Tasa efectiva periódica en decimal
+    """
+    return calcular_tasa_periodica(tea, obtener_periodos_por_año(frecuencia))
@@ -0,0 +1,16 @@
+"""
+Pruebas de los recursos estáticos de app.py
+"""
+import app
+
+
+def test_codigo_qr_se_carga_una_vez():
+    """El QR se lee del disco una sola vez y se comparte entre reruns"""
+    app.cargar_codigo_qr.clear()
+    primero = app.cargar_codigo_qr()
+    segundo = app.cargar_codigo_qr()
+    
+    assert primero is segundo
+    with open(app.RUTA_CODIGO_QR, "rb") as archivo:
+        assert primero['bytes'] == archivo.read()
+    assert primero['imagen'].format == "JPEG"
@@ -0,0 +1,48 @@
+"""
+Pruebas de la suite de benchmarks (benchmarks.py)
+
+No miden tiempos: verifican que cada benchmark siga ejecutándose y que la
+comparación con la referencia detecte regresiones.
+"""
+import pytest
+
+from benchmarks import (
+    BENCHMARKS,
+    TOLERANCIAS_BENCHMARK,
+    cargar_referencia,
+    comparar_con_referencia,
+    guardar_referencia,
+    medir
+)
+
+
+@pytest.mark.parametrize("nombre", sorted(BENCHMARKS))
+def test_benchmark_se_ejecuta(nombre):
+    """Cada benchmark prepara sus datos y su función corre sin errores"""
+    BENCHMARKS[nombre]()()
+
+
+def test_referencia_cubre_todos_los_benchmarks():
+    assert set(cargar_referencia()) == set(BENCHMARKS)
+    assert set(TOLERANCIAS_BENCHMARK) <= set(BENCHMARKS)
+
+
+def test_comparacion_detecta_regresiones():
+    """Más lento que referencia × (1 + tolerancia) es regresión; sin referencia no lo es"""
+    referencia = {'a': {'minimo_s': 1.0}, 'b': {'minimo_s': 1.0}}
+    resultados = {'a': {'minimo_s': 1.4}, 'b': {'minimo_s': 1.6}, 'nuevo': {'minimo_s': 9.0}}
+
+    comparacion = comparar_con_referencia(resultados, referencia, tolerancia=0.5)
+
+    assert comparacion['a'] == (pytest.approx(1.4), False)
+    assert comparacion['b'] == (pytest.approx(1.6), True)
+    assert comparacion['nuevo'] == (None, False)
+
+
+def test_guardar_referencia_fusiona(tmp_path):
+    """Guardar un subconjunto conserva las referencias de los demás benchmarks"""
+    ruta = tmp_path / "referencia.json"
+    guardar_referencia({'a': medir(lambda: None, repeticiones=2, tiempo_minimo=0.001)}, ruta)
+    guardar_referencia({'b': {'mediana_s': 2.0, 'minimo_s': 1.0, 'llamadas': 1}}, ruta)
+
+    assert sorted(cargar_referencia(ruta)) == ['a', 'b']
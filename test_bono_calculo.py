@@ -3,26 +3,7 @@ Script de prueba para verificar los cálculos del módulo de bonos
 Compara con las fórmulas teóricas esperadas
 """
 
-def obtener_periodos_por_año(frecuencia):
-    """Retorna el número de periodos por año según la frecuencia"""
-    frecuencias = {
-        "Mensual": 12,
-        "Bimestral": 6,
-        "Trimestral": 4,
-        "Cuatrimestral": 3,
-        "Semestral": 2,
-        "Anual": 1
-    }
-    return frecuencias.get(frecuencia, 1)
-
-def convertir_tea_a_tasa_periodica(tea, frecuencia):
-    """
-    Convierte TEA a tasa efectiva periódica
-    TEP = (1 + TEA)^(1/n) - 1
-    """
-    n = obtener_periodos_por_año(frecuencia)
-    tasa_periodica = (1 + tea) ** (1/n) - 1
-    return tasa_periodica
+from tasas import obtener_periodos_por_año, convertir_tea_a_tasa_periodica
 
 def calcular_cupon_periodico(valor_nominal, tasa_cupon_anual, frecuencia):
     """Calcula el cupón periódico del bono"""
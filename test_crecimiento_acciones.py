@@ -0,0 +1,103 @@
+"""
+Pruebas del motor de crecimiento de cartera (acciones.py)
+"""
+import numpy as np
+
+from acciones import (
+    calcular_crecimiento_aportes_periodicos,
+    calcular_crecimiento_deposito_unico,
+    calcular_matriz_escenarios,
+    convertir_tea_a_tasa_periodica,
+    generar_malla_temporal,
+    obtener_periodos_por_año
+)
+
+
+def crecimiento_aportes_referencia(monto_inicial, aporte_periodico, tea, frecuencia, plazo_años):
+    """Implementación periodo a periodo usada como referencia"""
+    n = int(plazo_años * obtener_periodos_por_año(frecuencia))
+    tasa = convertir_tea_a_tasa_periodica(tea, frecuencia)
+    
+    saldo = monto_inicial
+    saldos, intereses_acum = [monto_inicial], [0.0]
+    total_interes = 0.0
+    for _ in range(n):
+        interes = saldo * tasa
+        saldo = saldo + interes + aporte_periodico
+        total_interes += interes
+        saldos.append(saldo)
+        intereses_acum.append(total_interes)
+    return np.array(saldos), np.array(intereses_acum)
+
+
+def test_aportes_coincide_con_bucle():
+    """La fórmula cerrada reproduce la simulación periodo a periodo"""
+    for frecuencia, tea in [("Mensual", 0.08), ("Trimestral", 0.15), ("Anual", 0.0)]:
+        resultado = calcular_crecimiento_aportes_periodicos(5000, 300, tea, frecuencia, 40)
+        saldos, intereses_acum = crecimiento_aportes_referencia(5000, 300, tea, frecuencia, 40)
+        
+        np.testing.assert_allclose(resultado['saldos_finales'], saldos, rtol=1e-10)
+        np.testing.assert_allclose(resultado['intereses_acumulados'], intereses_acum,
+                                   rtol=1e-9, atol=1e-6)
+        np.testing.assert_allclose(resultado['saldos_iniciales'][1:], saldos[:-1], rtol=1e-10)
+        assert abs(resultado['saldo_final'] - saldos[-1]) < 1e-6 * saldos[-1]
+
+
+def test_aportes_totales_y_claves():
+    """Los totales y el periodo 0 conservan la convención de la tabla"""
+    resultado = calcular_crecimiento_aportes_periodicos(1000, 100, 0.10, "Mensual", 2)
+    
+    assert len(resultado['periodos']) == 25
+    assert resultado['total_aportado'] == 1000 + 24 * 100
+    assert resultado['aportes'][0] == 1000 and resultado['intereses'][0] == 0
+    assert abs(resultado['intereses'].sum() - resultado['interes_total']) < 1e-8
+    assert abs(resultado['saldo_final'] - resultado['total_aportado']
+               - resultado['interes_total']) < 1e-8
+
+
+def test_deposito_unico_anual_por_defecto():
+    """Sin malla se usan los años enteros, como la tabla original"""
+    resultado = calcular_crecimiento_deposito_unico(1000, 0.10, 5)
+    
+    np.testing.assert_array_equal(resultado['periodos'], np.arange(6))
+    np.testing.assert_allclose(resultado['saldos'], [1000 * 1.1 ** t for t in range(6)])
+    assert abs(resultado['interes_total'] - (1000 * 1.1 ** 5 - 1000)) < 1e-9
+
+
+def test_deposito_unico_malla_mensual_y_diaria():
+    """Una malla más fina pasa por los mismos saldos en los años enteros"""
+    anual = calcular_crecimiento_deposito_unico(1000, 0.10, 30)
+    mensual = calcular_crecimiento_deposito_unico(
+        1000, 0.10, 30, tiempos=generar_malla_temporal(30, 12)
+    )
+    diaria = calcular_crecimiento_deposito_unico(
+        1000, 0.10, 30, tiempos=generar_malla_temporal(30, 365)
+    )
+    
+    assert len(mensual['saldos']) == 30 * 12 + 1
+    assert len(diaria['saldos']) == 30 * 365 + 1
+    np.testing.assert_allclose(mensual['saldos'][::12], anual['saldos'], rtol=1e-12)
+    np.testing.assert_allclose(diaria['saldos'][::365], anual['saldos'], rtol=1e-12)
+    assert abs(mensual['saldo_final'] - anual['saldo_final']) < 1e-8
+    assert np.all(np.diff(mensual['saldos']) > 0)
+
+
+def test_matriz_escenarios_coincide_con_motor():
+    """Cada celda de la matriz es el saldo final del motor de aportes periódicos"""
+    edades = np.arange(31, 81)
+    teas = np.linspace(0.0, 0.20, 200)
+    saldos = calcular_matriz_escenarios(5000, 200, "Trimestral", 30, edades, teas)
+    
+    assert saldos.shape == (50, 200)
+    for fila, columna in [(0, 0), (9, 57), (49, 199), (25, 120)]:
+        resultado = calcular_crecimiento_aportes_periodicos(
+            5000, 200, teas[columna], "Trimestral", edades[fila] - 30
+        )
+        assert abs(saldos[fila, columna] / resultado['saldo_final'] - 1) < 1e-10
+
+
+def test_matriz_escenarios_edades_pasadas():
+    """Las edades que no superan la edad actual quedan vacías (NaN)"""
+    saldos = calcular_matriz_escenarios(1000, 0, "Anual", 40, [35, 40, 41], [0.10])
+    assert np.isnan(saldos[0, 0]) and np.isnan(saldos[1, 0])
+    assert abs(saldos[2, 0] - 1100) < 1e-9
@@ -0,0 +1,62 @@
+"""
+Pruebas de la exportación a Excel y PDF del cronograma de pagos (bono.py)
+"""
+import numpy as np
+import pandas as pd
+from openpyxl import load_workbook
+
+from bono import (
+    calcular_anchos_columnas_excel,
+    calcular_valor_presente_bono_completo,
+    crear_tabla_detalle_bono,
+    generar_excel_pagos,
+    generar_pdf_pagos
+)
+from src.utils.pdf_generator import FILAS_POR_TABLA_PDF
+
+
+def test_excel_contiene_resumen_y_detalle():
+    """El libro tiene las hojas de resumen y detalle con todas las filas"""
+    resultado = calcular_valor_presente_bono_completo(20000.0, 0.10, "Mensual", 50, 0.12)
+    df_detalle = crear_tabla_detalle_bono(resultado)
+    
+    archivo = generar_excel_pagos(
+        df_detalle, 20000.0, 0.10, 0.12, resultado['valor_presente_total'], "Mensual"
+    )
+    libro = load_workbook(archivo)
+    
+    assert libro.sheetnames == ['Resumen', 'Detalle de Pagos']
+    hoja = libro['Detalle de Pagos']
+    assert hoja.max_row == 601
+    assert [celda.value for celda in hoja[1]] == list(df_detalle.columns)
+    assert hoja['D601'].value == "Cupón + Principal"
+    assert abs(hoja['C601'].value - resultado['valores_presentes'][-1]) < 1e-9
+
+
+def test_anchos_desde_metadatos():
+    """Los anchos salen del encabezado o del valor más largo de cada columna"""
+    df = pd.DataFrame({
+        'Periodo': np.arange(1, 100001),
+        'Monto': np.array([1.5, -123456.789] + [0.0] * 99998),
+        'Tipo': ["Cupón"] * 99999 + ["Cupón + Principal"]
+    })
+    assert calcular_anchos_columnas_excel(df) == [
+        len('Periodo') + 2,
+        len('-123456.79') + 2,
+        len('Cupón + Principal') + 2
+    ]
+
+
+def test_pdf_divide_detalle_en_paginas():
+    """Un cronograma largo se reparte en varias páginas sin perder filas"""
+    resultado = calcular_valor_presente_bono_completo(20000.0, 0.10, "Mensual", 50, 0.12)
+    df_detalle = crear_tabla_detalle_bono(resultado)
+    
+    archivo = generar_pdf_pagos(
+        df_detalle, 20000.0, 0.10, 0.12, resultado['valor_presente_total'],
+        "Mensual", resultado['cupon_periodico']
+    )
+    contenido = archivo.getvalue()
+    
+    assert contenido.startswith(b'%PDF')
+    assert contenido.count(b'/Type /Page\n') > 600 // FILAS_POR_TABLA_PDF
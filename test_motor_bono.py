@@ -0,0 +1,194 @@
+"""
+Pruebas del motor vectorizado de bonos (bono.py)
+Compara los resultados con la implementación iterativa original
+"""
+import numpy as np
+import pandas as pd
+
+from bono import (
+    calcular_precio_bono,
+    calcular_valor_presente_bono_completo,
+    calcular_valor_presente_bonos_lote,
+    convertir_tea_a_tasa_periodica
+)
+
+
+def calcular_vp_bono_iterativo(valor_nominal, tasa_cupon_anual, frecuencia, plazo_años, tasa_descuento_anual):
+    """Implementación de referencia con bucles (versión original de bono.py)"""
+    from bono import obtener_periodos_por_año
+    num_periodos = int(plazo_años * obtener_periodos_por_año(frecuencia))
+    tasa_descuento = convertir_tea_a_tasa_periodica(tasa_descuento_anual, frecuencia)
+    cupon = valor_nominal * convertir_tea_a_tasa_periodica(tasa_cupon_anual, frecuencia)
+    
+    flujos, valores_presentes, vp_acumulado = [], [], []
+    suma = 0
+    for periodo in range(1, num_periodos + 1):
+        flujo = cupon + valor_nominal if periodo == num_periodos else cupon
+        vp = flujo / ((1 + tasa_descuento) ** periodo)
+        suma += vp
+        flujos.append(flujo)
+        valores_presentes.append(vp)
+        vp_acumulado.append(suma)
+    return flujos, valores_presentes, vp_acumulado
+
+
+def test_motor_coincide_con_bucle():
+    """Flujos, VP y VP acumulado coinciden con la versión iterativa"""
+    casos = [
+        (10000.0, 0.10, "Anual", 10, 0.12),
+        (20000.0, 0.10, "Semestral", 5, 0.12),
+        (10000.0, 0.10, "Semestral", 5, 0.06),
+        (50000.0, 0.07, "Mensual", 50, 0.15),
+        (1000.0, 0.00, "Trimestral", 3, 0.00),
+    ]
+    for caso in casos:
+        resultado = calcular_valor_presente_bono_completo(*caso)
+        flujos, vps, vp_acum = calcular_vp_bono_iterativo(*caso)
+        
+        assert resultado['num_periodos'] == len(flujos)
+        np.testing.assert_allclose(resultado['flujos'], flujos, rtol=1e-13)
+        np.testing.assert_allclose(resultado['valores_presentes'], vps, rtol=1e-13)
+        np.testing.assert_allclose(resultado['vp_acumulado'], vp_acum, rtol=1e-13)
+        assert abs(resultado['valor_presente_total'] - vp_acum[-1]) < 1e-8
+
+
+def test_factores_de_descuento():
+    """VP = flujo × factor de descuento en cada periodo"""
+    resultado = calcular_valor_presente_bono_completo(20000.0, 0.10, "Mensual", 50, 0.12)
+    
+    assert resultado['num_periodos'] == 600
+    np.testing.assert_allclose(
+        resultado['flujos'] * resultado['factores_descuento'],
+        resultado['valores_presentes'],
+        rtol=1e-14
+    )
+    np.testing.assert_array_equal(resultado['periodos'], np.arange(1, 601))
+
+
+def test_bono_a_la_par():
+    """Si la tasa cupón es igual a la TEA, el VP es igual al valor nominal"""
+    resultado = calcular_valor_presente_bono_completo(10000.0, 0.10, "Trimestral", 8, 0.10)
+    assert abs(resultado['valor_presente_total'] - 10000.0) < 1e-6
+
+
+def test_plazo_sin_periodos():
+    """Un plazo menor a un periodo no genera flujos y su VP es cero"""
+    resultado = calcular_valor_presente_bono_completo(10000.0, 0.10, "Anual", 0.5, 0.12)
+    assert resultado['num_periodos'] == 0
+    assert resultado['valor_presente_total'] == 0.0
+    assert len(resultado['flujos']) == 0
+
+
+def test_lote_coincide_con_valoracion_individual():
+    """La valoración por lote coincide bono a bono con la valoración individual"""
+    rng = np.random.default_rng(7)
+    n_bonos = 300
+    cartera = pd.DataFrame({
+        'valor_nominal': rng.uniform(1000, 100000, n_bonos),
+        'tasa_cupon_anual': rng.uniform(0, 0.5, n_bonos),
+        'frecuencia': rng.choice(["Mensual", "Bimestral", "Trimestral", "Semestral", "Anual"], n_bonos),
+        'plazo_años': rng.integers(0, 51, n_bonos),
+        'tasa_descuento_anual': rng.uniform(0, 0.5, n_bonos),
+    })
+    
+    vp_individual = [
+        calcular_valor_presente_bono_completo(*fila)['valor_presente_total']
+        for fila in cartera.itertuples(index=False)
+    ]
+    # Bloques pequeños para forzar varias matrices rellenadas
+    vp_matriz = calcular_valor_presente_bonos_lote(cartera, metodo='matriz', max_celdas_bloque=5000)
+    vp_cerrado = calcular_valor_presente_bonos_lote(cartera)
+    np.testing.assert_allclose(vp_matriz, vp_individual, rtol=1e-12, atol=1e-9)
+    np.testing.assert_allclose(vp_cerrado, vp_individual, rtol=1e-11, atol=1e-9)
+
+
+def test_lote_acepta_columnas_como_diccionario():
+    """La cartera también puede recibirse como diccionario de arreglos"""
+    vp = calcular_valor_presente_bonos_lote({
+        'valor_nominal': [10000.0, 10000.0],
+        'tasa_cupon_anual': [0.10, 0.10],
+        'frecuencia': ["Anual", "Semestral"],
+        'plazo_años': [5, 5],
+        'tasa_descuento_anual': [0.10, 0.10],
+    })
+    np.testing.assert_allclose(vp, [10000.0, 10000.0])
+
+
+def test_formula_cerrada_coincide_con_cronograma():
+    """La vía rápida coincide con el VP del cronograma completo, incluida tasa 0"""
+    casos = [
+        (10000.0, 0.10, "Anual", 10, 0.12),
+        (20000.0, 0.10, "Mensual", 50, 0.0001),
+        (1000.0, 0.05, "Trimestral", 3, 0.0),
+        (10000.0, 0.10, "Anual", 0.5, 0.12),
+    ]
+    for caso in casos:
+        esperado = calcular_valor_presente_bono_completo(*caso)['valor_presente_total']
+        assert abs(calcular_precio_bono(*caso) - esperado) <= 1e-10 * max(1.0, esperado)
+    
+    # Varias tasas de descuento en una sola llamada
+    teas = np.array([0.0, 0.05, 0.12, 0.5])
+    vps = calcular_precio_bono(10000.0, 0.10, "Semestral", 5, teas)
+    esperados = [calcular_valor_presente_bono_completo(10000.0, 0.10, "Semestral", 5, t)['valor_presente_total'] for t in teas]
+    np.testing.assert_allclose(vps, esperados, rtol=1e-12)
+
+
+def test_grafico_sensibilidad_vectorizado():
+    """El barrido de sensibilidad coincide con revalorar el bono tasa por tasa"""
+    from bono import crear_grafico_sensibilidad_tasa
+    fig = crear_grafico_sensibilidad_tasa(20000.0, 0.10, "Mensual", 30, 0.12, num_puntos=5000)
+    
+    tasas = np.asarray(fig.data[0].x) / 100
+    assert len(tasas) == 5000
+    for i in [0, 1234, 4999]:
+        esperado = calcular_valor_presente_bono_completo(20000.0, 0.10, "Mensual", 30, tasas[i])
+        assert abs(fig.data[0].y[i] - esperado['valor_presente_total']) < 1e-8
+    
+    esperado_base = calcular_valor_presente_bono_completo(20000.0, 0.10, "Mensual", 30, 0.12)
+    assert abs(fig.data[1].y[0] - esperado_base['valor_presente_total']) < 1e-8
+
+
+def test_grafico_sensibilidad_con_resultados():
+    """La curva sigue siendo exacta; la aproximación es una traza aparte cerca de la tasa base"""
+    from bono import BANDA_APROXIMACION_SENSIBILIDAD, aproximar_precio_bono, crear_grafico_sensibilidad_tasa
+    # Cupón cero a 30 años: la parábola lejos de la tasa base no es monótona
+    resultado = calcular_valor_presente_bono_completo(20000.0, 0.0, "Anual", 30, 0.10)
+    fig = crear_grafico_sensibilidad_tasa(20000.0, 0.0, "Anual", 30, 0.10, num_puntos=500,
+                                          resultados=resultado)
+    
+    tasas = np.asarray(fig.data[0].x) / 100
+    exactos = calcular_precio_bono(20000.0, 0.0, "Anual", 30, tasas)
+    np.testing.assert_allclose(fig.data[0].y, exactos, rtol=1e-12)
+    assert np.all(np.diff(fig.data[0].y) < 0)
+    assert abs(fig.data[1].y[0] - resultado['valor_presente_total']) < 1e-8
+    
+    tasas_banda = np.asarray(fig.data[2].x) / 100
+    assert len(tasas_banda) > 0
+    assert np.all(np.abs(tasas_banda - 0.10) <= BANDA_APROXIMACION_SENSIBILIDAD + 1e-12)
+    np.testing.assert_allclose(fig.data[2].y, aproximar_precio_bono(resultado, tasas_banda), rtol=1e-12)
+    np.testing.assert_allclose(fig.data[2].y, calcular_precio_bono(20000.0, 0.0, "Anual", 30, tasas_banda),
+                               rtol=0.01)
+
+
+def test_medidas_de_riesgo():
+    """Duración, convexidad y DV01 coinciden con diferencias finitas sobre la TEA"""
+    from bono import aproximar_precio_bono
+    resultado = calcular_valor_presente_bono_completo(10000.0, 0.10, "Semestral", 5, 0.12)
+    precio = lambda tea: calcular_precio_bono(10000.0, 0.10, "Semestral", 5, tea)
+    h = 1e-5
+    
+    p0, p_arriba, p_abajo = precio(0.12), precio(0.12 + h), precio(0.12 - h)
+    assert abs(resultado['duracion_modificada'] - (p_abajo - p_arriba) / (2 * h * p0)) < 1e-6
+    assert abs(resultado['convexidad'] - (p_arriba - 2 * p0 + p_abajo) / (h * h * p0)) < 1e-2
+    assert abs(resultado['duracion_macaulay'] - resultado['duracion_modificada'] * 1.12) < 1e-12
+    assert abs(resultado['dv01'] - (p0 - precio(0.1201))) < 1e-3
+    
+    # Bono cupón cero: la duración de Macaulay es el plazo
+    cero = calcular_valor_presente_bono_completo(10000.0, 0.0, "Anual", 7, 0.08)
+    assert abs(cero['duracion_macaulay'] - 7) < 1e-12
+    
+    # La aproximación de segundo orden mejora a la de primer orden
+    exacto = precio(0.14)
+    error_1 = abs(aproximar_precio_bono(resultado, 0.14, orden=1) - exacto)
+    error_2 = abs(aproximar_precio_bono(resultado, 0.14, orden=2) - exacto)
+    assert error_2 < error_1 / 10
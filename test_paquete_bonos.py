@@ -0,0 +1,63 @@
+"""
+Pruebas del paquete de la página de bonos (config/ y src/)
+"""
+import subprocess
+import sys
+
+from src.calculations.bond_calcs import calcular_precio_bono, calcular_valor_presente_bono
+
+
+def test_nucleo_no_importa_interfaz():
+    """El núcleo numérico se importa sin Streamlit, Plotly, ReportLab ni pandas"""
+    codigo = (
+        "import sys, src.calculations.bond_calcs, rendimiento_bono; "
+        "print(','.join(m for m in ('streamlit', 'plotly', 'reportlab', 'pandas', 'matplotlib') "
+        "if m in sys.modules))"
+    )
+    salida = subprocess.run([sys.executable, "-c", codigo], capture_output=True, text=True,
+                            check=True)
+    assert salida.stdout.strip() == ""
+
+
+def test_valor_presente_bono_de_la_pagina():
+    """La API de la página coincide con la fórmula cerrada y desglosa cada flujo"""
+    resultado = calcular_valor_presente_bono(1000.0, 0.05, 2, 10, 0.06)
+    
+    assert resultado['num_periodos'] == 20
+    assert len(resultado['flujos']) == 20
+    assert abs(resultado['valor_presente_total']
+               - calcular_precio_bono(1000.0, 0.05, "Semestral", 10, 0.06)) < 1e-9
+    assert abs(sum(f['vp_flujo'] for f in resultado['flujos'])
+               - resultado['valor_presente_total']) < 1e-9
+    assert resultado['flujos'][-1]['flujo'] == resultado['cupon_periodico'] + 1000.0
+
+
+def test_graficos_y_pdf_de_la_pagina():
+    """Los módulos de visualización y exportación generan sus salidas"""
+    from src.utils.pdf_generator import crear_pdf_bonos
+    from src.visualization.bond_charts import crear_grafico_flujos_bono, crear_tabla_flujos
+    
+    resultado = calcular_valor_presente_bono(1000.0, 0.05, 12, 30, 0.06)
+    df_flujos = crear_tabla_flujos(resultado['flujos'], "USD")
+    fig = crear_grafico_flujos_bono(resultado['flujos'], "USD")
+    pdf = crear_pdf_bonos(
+        {'valor_nominal': 1000.0, 'tasa_cupon_pct': 5.0, 'frecuencia': "Mensual",
+         'plazo_años': 30, 'tea_descuento_pct': 6.0},
+        resultado, df_flujos
+    )
+    
+    assert len(df_flujos) == 360
+    assert fig.data[0].marker.color[-1] != fig.data[0].marker.color[0]
+    assert pdf.getvalue().startswith(b'%PDF')
+
+
+def test_tablas_paginadas_repiten_encabezado():
+    """El detalle se parte en tablas de FILAS_POR_TABLA_PDF filas con su encabezado"""
+    from src.utils.pdf_generator import ESTILO_TABLA, FILAS_POR_TABLA_PDF, crear_tablas_paginadas
+    
+    filas = [[str(i), f"{i * 1.5:,.2f}"] for i in range(1, 2 * FILAS_POR_TABLA_PDF + 6)]
+    tablas = crear_tablas_paginadas(['Periodo', 'Flujo'], filas, ESTILO_TABLA)
+    
+    assert [len(t._cellvalues) for t in tablas] == [FILAS_POR_TABLA_PDF + 1] * 2 + [6]
+    assert all(t._cellvalues[0] == ['Periodo', 'Flujo'] and t.repeatRows == 1 for t in tablas)
+    assert [fila for t in tablas for fila in t._cellvalues[1:]] == filas
@@ -0,0 +1,115 @@
+"""
+Pruebas de la proyección por lotes de planes de jubilación
+(src/calculations/retirement_calcs.py y proyectar_jubilacion.py)
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from acciones import (
+    calcular_crecimiento_aportes_periodicos,
+    calcular_crecimiento_deposito_unico,
+    calcular_impuestos,
+    calcular_pension_mensual
+)
+from proyectar_jubilacion import main, proyectar_archivo
+from src.calculations.retirement_calcs import calcular_planes_jubilacion_lote
+
+
+def crear_planes(num_planes, semilla=5):
+    rng = np.random.default_rng(semilla)
+    edad_actual = rng.integers(18, 60, num_planes)
+    años_retiro = rng.choice([np.nan, 10.0, 25.0, 100.0], num_planes)
+    return pd.DataFrame({
+        'id_cliente': np.arange(num_planes),
+        'edad_actual': edad_actual,
+        'edad_jubilacion': edad_actual + rng.integers(1, 40, num_planes),
+        'monto_inicial': rng.uniform(0, 50000, num_planes).round(2),
+        'aporte_periodico': rng.uniform(0, 2000, num_planes).round(2),
+        'frecuencia': rng.choice(["Mensual", "Trimestral", "Semestral", "Anual"], num_planes),
+        'tea': rng.choice([0.0, 0.05, 0.12, 0.50], num_planes),
+        'moneda': rng.choice(["PEN", "USD"], num_planes),
+        'opcion_retiro': rng.choice(["Retiro único", "Pensión mensual"], num_planes),
+        'tea_retiro': rng.choice([np.nan, 0.0, 0.08], num_planes),
+        'años_retiro': años_retiro
+    })
+
+
+def proyectar_plan_escalar(plan):
+    """Flujo de la interfaz (Módulos A y B) para un solo plan"""
+    plazo = plan.edad_jubilacion - plan.edad_actual
+    resultados = calcular_crecimiento_aportes_periodicos(
+        plan.monto_inicial, plan.aporte_periodico, plan.tea, plan.frecuencia, plazo
+    )
+    impuesto, _ = calcular_impuestos(resultados['saldo_final'], resultados['total_aportado'], plan.moneda)
+    capital_neto = resultados['saldo_final'] - impuesto
+    tea_retiro = plan.tea if np.isnan(plan.tea_retiro) else plan.tea_retiro
+    años_retiro = None if np.isnan(plan.años_retiro) else plan.años_retiro
+    pension, _ = calcular_pension_mensual(capital_neto, tea_retiro, años_retiro)
+    return resultados['saldo_final'], impuesto, capital_neto, pension
+
+
+def test_lote_coincide_con_flujo_de_la_interfaz():
+    """Saldo, impuesto, capital neto y pensión iguales a las funciones escalares"""
+    planes = crear_planes(300)
+    resultado = calcular_planes_jubilacion_lote(planes)
+
+    for i, plan in enumerate(planes.itertuples()):
+        saldo, impuesto, capital_neto, pension = proyectar_plan_escalar(plan)
+        assert resultado['saldo_final'][i] == pytest.approx(saldo, rel=1e-10)
+        assert resultado['impuesto'][i] == pytest.approx(impuesto, rel=1e-10, abs=1e-6)
+        assert resultado['capital_neto'][i] == pytest.approx(capital_neto, rel=1e-10)
+        if plan.opcion_retiro == "Pensión mensual":
+            assert resultado['pension_mensual'][i] == pytest.approx(pension, rel=1e-9)
+        else:
+            assert np.isnan(resultado['pension_mensual'][i])
+
+
+def test_deposito_unico_es_plan_sin_aportes_anual():
+    """Un depósito único se expresa con aporte 0 y frecuencia anual"""
+    planes = {
+        'edad_actual': [30], 'edad_jubilacion': [65], 'monto_inicial': [3000.0],
+        'aporte_periodico': [0.0], 'frecuencia': ["Anual"], 'tea': [0.12],
+        'moneda': ["PEN"], 'opcion_retiro': ["Retiro único"]
+    }
+    resultado = calcular_planes_jubilacion_lote(planes)
+    esperado = calcular_crecimiento_deposito_unico(3000.0, 0.12, 35)
+
+    assert resultado['saldo_final'][0] == pytest.approx(esperado['saldo_final'], rel=1e-12)
+    assert resultado['total_aportado'][0] == esperado['total_aportado']
+
+
+def test_cli_escribe_por_lotes_con_avance(tmp_path, capsys):
+    """El CSV de salida tiene una fila por plan y se reporta el avance de cada lote"""
+    entrada = tmp_path / "planes.csv"
+    salida = tmp_path / "proyecciones.parquet"
+    crear_planes(250).to_csv(entrada, index=False)
+
+    assert main([str(entrada), str(salida), "--tamano-lote", "100"]) == 0
+    resultado = pd.read_parquet(salida)
+    assert resultado['id_cliente'].tolist() == list(range(250))
+    assert capsys.readouterr().err.count("planes/s") == 3
+
+
+def test_opcion_de_retiro_desconocida():
+    """Una opción de retiro que la interfaz no ofrece se rechaza"""
+    planes = crear_planes(3).assign(opcion_retiro="Renta vitalicia")
+    with pytest.raises(ValueError, match="Renta vitalicia"):
+        calcular_planes_jubilacion_lote(planes)
+
+
+@pytest.mark.parametrize("columna, valor", [("frecuencia", "mensual"), ("moneda", "EUR")])
+def test_frecuencia_o_moneda_desconocida(columna, valor):
+    """Ni frecuencia anual ni impuesto 0% por defecto: el plan se rechaza con su fila"""
+    planes = crear_planes(5)
+    planes.loc[3, columna] = valor
+    with pytest.raises(ValueError, match=rf"'{columna}': '{valor}' \(filas 3\)"):
+        calcular_planes_jubilacion_lote(planes)
+
+
+def test_proyectar_archivo_resumen(tmp_path):
+    """Parquet de entrada a CSV de salida en un solo lote"""
+    entrada = tmp_path / "planes.parquet"
+    crear_planes(10).to_parquet(entrada, index=False)
+    resumen = proyectar_archivo(str(entrada), str(tmp_path / "salida.csv"))
+    assert resumen['planes'] == 10 and resumen['lotes'] == 1
@@ -0,0 +1,49 @@
+"""
+Pruebas del solver Precio → TEA (rendimiento_bono.py)
+"""
+import numpy as np
+
+from bono import calcular_precio_bono, convertir_tea_a_tasa_periodica
+from rendimiento_bono import (
+    calcular_derivada_precio_bono,
+    calcular_tasa_periodica_desde_precio,
+    calcular_tea_desde_precio
+)
+
+
+def test_recupera_la_tea_con_precision_de_maquina():
+    """Precio(TEA) → TEA recupera la tasa original en pocas iteraciones"""
+    teas = np.linspace(0.0, 0.5, 201)
+    for frecuencia, plazo, num_periodos in [("Anual", 10, 10), ("Semestral", 5, 10), ("Mensual", 50, 600)]:
+        precios = calcular_precio_bono(10000.0, 0.10, frecuencia, plazo, teas)
+        
+        teas_calculadas = calcular_tea_desde_precio(precios, 10000.0, 0.10, frecuencia, plazo)
+        np.testing.assert_allclose(teas_calculadas, teas, rtol=0, atol=1e-14)
+        
+        cupon = 10000.0 * convertir_tea_a_tasa_periodica(0.10, frecuencia)
+        _, iteraciones = calcular_tasa_periodica_desde_precio(precios, 10000.0, cupon, num_periodos)
+        assert iteraciones <= 10
+
+
+def test_ejemplo_de_las_imagenes():
+    """El VP de $9,295.74 del ejemplo corresponde a una TEA del 12%"""
+    tea = calcular_tea_desde_precio(9295.74, 10000.0, 0.10, "Semestral", 5)
+    assert abs(tea - 0.12) < 1e-6
+
+
+def test_precios_sin_solucion():
+    """Precios no positivos o bonos sin periodos devuelven NaN"""
+    assert np.isnan(calcular_tea_desde_precio(0.0, 10000.0, 0.10, "Anual", 5))
+    assert np.isnan(calcular_tea_desde_precio(-5.0, 10000.0, 0.10, "Anual", 5))
+    assert np.isnan(calcular_tea_desde_precio(9000.0, 10000.0, 0.10, "Anual", 0.5))
+
+
+def test_derivada_analitica():
+    """La derivada analítica coincide con diferencias finitas"""
+    from bono import calcular_vp_bono_cerrado
+    cupon, h = 488.09, 1e-6
+    for tasa in [0.0, 0.01, 0.05, 0.3]:
+        numerica = (calcular_vp_bono_cerrado(10000.0, cupon, 10, tasa + h)
+                    - calcular_vp_bono_cerrado(10000.0, cupon, 10, tasa - h)) / (2 * h)
+        analitica = calcular_derivada_precio_bono(10000.0, cupon, 10, tasa)
+        assert abs(analitica - numerica) < 1e-4 * abs(analitica)
@@ -0,0 +1,149 @@
+"""
+Pruebas del servicio HTTP local de cálculos (servicio_calculos.py)
+"""
+import asyncio
+import http.client
+import json
+import socket
+import threading
+
+import pytest
+
+from src.calculations.bond_calcs import calcular_precio_bono, calcular_valor_presente_bono_completo
+from src.calculations.retirement_calcs import calcular_planes_jubilacion_lote
+import servicio_calculos
+from servicio_calculos import ejecutar_endpoint, iniciar_servidor
+
+BONO = {'valor_nominal': 20000.0, 'tasa_cupon_anual': 0.10, 'frecuencia': "Semestral",
+        'plazo_años': 10, 'tasa_descuento_anual': 0.12}
+
+PLAN = {'edad_actual': 30, 'edad_jubilacion': 65, 'monto_inicial': 3000.0,
+        'aporte_periodico': 150.0, 'frecuencia': "Mensual", 'tea': 0.12,
+        'moneda': "USD", 'opcion_retiro': "Pensión mensual", 'años_retiro': 25}
+
+
+@pytest.fixture(scope="module")
+def puerto():
+    """Servicio en un hilo con su propio bucle; los lotes de más de 2 KB van al pool"""
+    loop = asyncio.new_event_loop()
+    servidor, pool = loop.run_until_complete(
+        iniciar_servidor('127.0.0.1', 0, num_procesos=1, min_bytes_pool=2048)
+    )
+    hilo = threading.Thread(target=loop.run_forever, daemon=True)
+    hilo.start()
+
+    yield servidor.sockets[0].getsockname()[1]
+
+    async def cerrar():
+        servidor.close()
+        await servidor.wait_closed()
+        pendientes = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        for tarea in pendientes:
+            tarea.cancel()
+        await asyncio.gather(*pendientes, return_exceptions=True)
+
+    asyncio.run_coroutine_threadsafe(cerrar(), loop).result(timeout=10)
+    loop.call_soon_threadsafe(loop.stop)
+    hilo.join(timeout=5)
+    loop.close()
+    pool.shutdown()
+
+
+def solicitar(conexion, metodo, ruta, cuerpo=None):
+    datos = None if cuerpo is None else json.dumps(cuerpo)
+    conexion.request(metodo, ruta, body=datos, headers={'Content-Type': 'application/json'})
+    respuesta = conexion.getresponse()
+    return respuesta.status, json.loads(respuesta.read())
+
+
+def test_valoracion_y_proyeccion_en_conexion_persistente(puerto):
+    """Varias solicitudes viajan por el mismo socket (keep-alive)"""
+    conexion = http.client.HTTPConnection('127.0.0.1', puerto, timeout=10)
+
+    estado, salud = solicitar(conexion, 'GET', '/salud')
+    socket_inicial = conexion.sock
+    assert estado == 200 and salud['estado'] == 'ok'
+
+    estado, bono = solicitar(conexion, 'POST', '/bonos/valoracion', BONO)
+    esperado = calcular_valor_presente_bono_completo(20000.0, 0.10, "Semestral", 10, 0.12)
+    assert estado == 200
+    assert bono['valor_presente'] == pytest.approx(esperado['valor_presente_total'], rel=1e-12)
+    assert bono['duracion_macaulay'] == pytest.approx(esperado['duracion_macaulay'], rel=1e-10)
+    assert bono['dv01'] == pytest.approx(esperado['dv01'], rel=1e-10)
+
+    estado, plan = solicitar(conexion, 'POST', '/jubilacion/proyeccion', PLAN)
+    esperado = calcular_planes_jubilacion_lote({clave: [valor] for clave, valor in PLAN.items()})
+    assert estado == 200
+    assert plan['pension_mensual'] == pytest.approx(esperado['pension_mensual'][0], rel=1e-12)
+
+    assert conexion.sock is socket_inicial
+    conexion.close()
+
+
+def test_rendimiento_por_lote_en_el_pool(puerto):
+    """Un lote grande (calculado en el pool) recupera la TEA usada para el precio"""
+    teas = [0.01 * k for k in range(1, 51)]
+    bonos = [{'precio': float(calcular_precio_bono(1000.0, 0.08, "Trimestral", 7, tea)),
+              'valor_nominal': 1000.0, 'tasa_cupon_anual': 0.08,
+              'frecuencia': "Trimestral", 'plazo_años': 7} for tea in teas]
+    bonos.append({**bonos[0], 'precio': -5.0})
+    assert len(json.dumps(bonos)) > 2048
+
+    conexion = http.client.HTTPConnection('127.0.0.1', puerto, timeout=30)
+    estado, resultados = solicitar(conexion, 'POST', '/bonos/rendimiento', bonos)
+    conexion.close()
+
+    assert estado == 200 and len(resultados) == 51
+    for resultado, tea in zip(resultados, teas):
+        assert resultado['tea'] == pytest.approx(tea, abs=1e-12)
+    assert resultados[-1]['tea'] is None
+
+
+def test_errores_del_cliente(puerto):
+    """Ruta desconocida, método incorrecto y campos faltantes"""
+    conexion = http.client.HTTPConnection('127.0.0.1', puerto, timeout=10)
+
+    assert solicitar(conexion, 'POST', '/acciones', BONO)[0] == 404
+    assert solicitar(conexion, 'GET', '/bonos/valoracion')[0] == 405
+    estado, error = solicitar(conexion, 'POST', '/bonos/valoracion', {'valor_nominal': 1000.0})
+    assert estado == 400 and 'frecuencia' in error['error']
+    conexion.close()
+
+
+def test_content_length_negativo(puerto):
+    """Un Content-Length negativo se rechaza con 400 y se cierra la conexión"""
+    with socket.create_connection(('127.0.0.1', puerto), timeout=10) as conexion:
+        conexion.sendall(b"POST /bonos/valoracion HTTP/1.1\r\nHost: localhost\r\n"
+                         b"Content-Length: -5\r\n\r\n")
+        respuesta = conexion.makefile('rb').read()
+
+    assert respuesta.startswith(b"HTTP/1.1 400 ")
+    assert b"Connection: close" in respuesta
+
+
+def test_ejecutar_endpoint_lote_vacio_y_json_invalido():
+    """Un lote vacío es válido; JSON mal formado o elementos no objeto son 400"""
+    assert ejecutar_endpoint('/bonos/valoracion', b'[]') == (200, b'[]')
+    assert ejecutar_endpoint('/bonos/valoracion', b'{no es json')[0] == 400
+    assert ejecutar_endpoint('/bonos/valoracion', b'[1, 2]')[0] == 400
+
+
+def test_frecuencia_o_moneda_desconocida_es_400():
+    """Los valores que el núcleo no reconoce no se calculan con un valor por defecto"""
+    bono = json.dumps([BONO, {**BONO, 'frecuencia': "mensual"}]).encode()
+    estado, error = ejecutar_endpoint('/bonos/valoracion', bono)
+    assert estado == 400 and "'mensual' (filas 1)" in json.loads(error)['error']
+
+    plan = json.dumps({**PLAN, 'moneda': "EUR"}).encode()
+    estado, error = ejecutar_endpoint('/jubilacion/proyeccion', plan)
+    assert estado == 400 and "'EUR'" in json.loads(error)['error']
+
+
+def test_cuerpo_incompleto_cierra_por_inactividad(puerto, monkeypatch):
+    """Un cliente que anuncia un cuerpo y no lo envía no retiene la conexión"""
+    monkeypatch.setattr(servicio_calculos, 'TIEMPO_INACTIVIDAD_S', 0.2)
+    with socket.create_connection(('127.0.0.1', puerto), timeout=5) as conexion:
+        conexion.sendall(b"POST /bonos/valoracion HTTP/1.1\r\nHost: localhost\r\n"
+                         b"Content-Length: 1000\r\n\r\n{\"valor\"")
+        assert conexion.recv(1024) == b""
+
@@ -0,0 +1,146 @@
+"""
+Pruebas de la simulación Monte Carlo de crecimiento (simulacion_acciones.py)
+"""
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from acciones import calcular_crecimiento_aportes_periodicos, calcular_pension_mensual
+from simulacion_acciones import (
+    dividir_en_bloques,
+    simular_aportes_montecarlo,
+    simular_bloque_aportes,
+    simular_retiro
+)
+
+
+def test_sin_volatilidad_coincide_con_determinista():
+    """Con volatilidad 0 todas las trayectorias siguen la TEA fija"""
+    simulacion = simular_aportes_montecarlo(3000, 150, 0.12, 0.0, "Mensual", 30,
+                                            num_simulaciones=50, semilla=1)
+    determinista = calcular_crecimiento_aportes_periodicos(3000, 150, 0.12, "Mensual", 30)
+    
+    saldos_anuales = determinista['saldos_finales'][::12]
+    for banda in simulacion['bandas'].values():
+        np.testing.assert_allclose(banda, saldos_anuales, rtol=1e-10)
+
+
+def test_bootstrap_con_un_solo_retorno():
+    """Remuestrear un único retorno histórico equivale a esa TEA fija"""
+    simulacion = simular_aportes_montecarlo(1000, 100, None, None, "Trimestral", 10,
+                                            num_simulaciones=20, semilla=3,
+                                            retornos_historicos=[0.08])
+    determinista = calcular_crecimiento_aportes_periodicos(1000, 100, 0.08, "Trimestral", 10)
+    assert abs(simulacion['media_final'] - determinista['saldo_final']) < 1e-6
+
+
+def test_reproducible_y_acotado_por_bloques():
+    """La misma semilla da el mismo resultado; los bloques cubren todas las trayectorias"""
+    parametros = dict(num_simulaciones=5000, objetivo=200_000, semilla=7, max_celdas_bloque=50_000)
+    a = simular_aportes_montecarlo(3000, 150, 0.10, 0.18, "Mensual", 25, **parametros)
+    b = simular_aportes_montecarlo(3000, 150, 0.10, 0.18, "Mensual", 25, **parametros)
+    
+    assert (a['media_final'], a['probabilidad_objetivo']) == (b['media_final'], b['probabilidad_objetivo'])
+    for p in a['bandas']:
+        np.testing.assert_array_equal(a['bandas'][p], b['bandas'][p])
+    assert a['num_simulaciones'] == 5000
+    assert 0 < a['probabilidad_objetivo'] < 1
+    assert np.all(np.diff([a['bandas'][p][-1] for p in (5, 25, 50, 75, 95)]) > 0)
+    
+    tamaños = dividir_en_bloques(5000, 300, 50_000)
+    assert sum(tamaños) == 5000 and max(tamaños) * 300 <= 50_000
+
+
+def test_media_converge_a_la_tea():
+    """La media simulada se aproxima al valor determinista (E[1 + R] = 1 + TEA)"""
+    simulacion = simular_aportes_montecarlo(10_000, 0, 0.10, 0.20, "Anual", 10,
+                                            num_simulaciones=200_000, semilla=11)
+    esperado = 10_000 * 1.10 ** 10
+    assert abs(simulacion['media_final'] / esperado - 1) < 0.01
+
+
+def test_pool_de_procesos_igual_a_serie():
+    """El resultado en un pool es idéntico al serial con la misma semilla"""
+    parametros = dict(num_simulaciones=3000, objetivo=60_000, semilla=5, max_celdas_bloque=30_000)
+    serie = simular_aportes_montecarlo(2000, 100, 0.09, 0.15, "Mensual", 20, **parametros)
+    with ProcessPoolExecutor(max_workers=3) as pool:
+        paralelo = simular_aportes_montecarlo(2000, 100, 0.09, 0.15, "Mensual", 20,
+                                              pool=pool, **parametros)
+    
+    assert serie['media_final'] == paralelo['media_final']
+    assert serie['probabilidad_objetivo'] == paralelo['probabilidad_objetivo']
+    for p in serie['bandas']:
+        np.testing.assert_array_equal(serie['bandas'][p], paralelo['bandas'][p])
+
+
+def test_bandas_por_bloques_aproximan_percentiles_exactos():
+    """Combinar percentiles de bloques se aparta poco de los percentiles de todas las trayectorias"""
+    tamaños = dividir_en_bloques(20_000, 25 * 12, 500_000)
+    simulacion = simular_aportes_montecarlo(3000, 150, 0.10, 0.18, "Mensual", 25, num_simulaciones=20_000,
+                                            objetivo=200_000, semilla=7, max_celdas_bloque=500_000)
+    
+    semillas = np.random.SeedSequence(7).spawn(len(tamaños))
+    saldos = np.vstack([simular_bloque_aportes(s, n, 3000, 150, 0.10, 0.18, "Mensual", 25)
+                        for s, n in zip(semillas, tamaños)])
+    assert len(tamaños) > 1
+    for p, banda in simulacion['bandas'].items():
+        np.testing.assert_allclose(banda, np.percentile(saldos, p, axis=0), rtol=0.01)
+    assert abs(simulacion['media_final'] - saldos[:, -1].mean()) < 1e-6 * saldos[:, -1].mean()
+    assert simulacion['probabilidad_objetivo'] == np.mean(saldos[:, -1] >= 200_000)
+
+
+def test_retiro_pension_temporal_se_agota_al_plazo():
+    """La pensión temporal consume el capital justo al final de los años de retiro"""
+    pension, _ = calcular_pension_mensual(500_000, 0.08, 25)
+    simulacion = simular_retiro(500_000, pension, 0.08, 65)
+    
+    assert abs(simulacion['edad_agotamiento_mediana'] - 90) < 1e-9
+    assert simulacion['probabilidad_agotamiento'] == 1.0
+    assert simulacion['probabilidad_supervivencia'][24] == 1.0
+    assert simulacion['probabilidad_supervivencia'][25] == 0.0
+
+
+def test_retiro_perpetuo_con_y_sin_inflacion():
+    """La pensión perpetua conserva el capital salvo que se indexe a la inflación"""
+    pension, _ = calcular_pension_mensual(500_000, 0.08, None)
+    sin_inflacion = simular_retiro(500_000, pension, 0.08, 65)
+    con_inflacion = simular_retiro(500_000, pension, 0.08, 65, inflacion=0.03)
+    
+    assert sin_inflacion['edad_agotamiento_mediana'] is None
+    np.testing.assert_allclose(sin_inflacion['bandas'][50], 500_000, rtol=1e-9)
+    assert 65 < con_inflacion['edad_agotamiento_mediana'] < 100
+
+
+def test_retiro_coincide_con_bucle_mensual():
+    """Los saldos anuales reproducen la recursión B_m = B_{m-1}(1 + r) - W_m"""
+    simulacion = simular_retiro(300_000, 2_000, 0.06, 60, inflacion=0.02, edad_maxima=80)
+    
+    tasa = 1.06 ** (1 / 12) - 1
+    saldo, saldos_anuales = 300_000.0, [300_000.0]
+    for mes in range(1, 20 * 12 + 1):
+        saldo = saldo * (1 + tasa) - 2_000 * 1.02 ** ((mes - 1) / 12)
+        if mes % 12 == 0:
+            saldos_anuales.append(max(saldo, 0))
+    np.testing.assert_allclose(simulacion['bandas'][50], saldos_anuales, rtol=1e-9, atol=1e-6)
+
+
+def test_retiro_estocastico_curva_supervivencia():
+    """Con volatilidad la supervivencia es decreciente y reproducible"""
+    a = simular_retiro(400_000, 3_000, 0.07, 65, volatilidad=0.15, inflacion=0.02,
+                       num_escenarios=2_000, semilla=9)
+    b = simular_retiro(400_000, 3_000, 0.07, 65, volatilidad=0.15, inflacion=0.02,
+                       num_escenarios=2_000, semilla=9)
+    
+    supervivencia = a['probabilidad_supervivencia']
+    assert supervivencia[0] == 1.0 and np.all(np.diff(supervivencia) <= 0)
+    assert 0 < a['probabilidad_agotamiento'] < 1
+    np.testing.assert_array_equal(a['edades_agotamiento'], b['edades_agotamiento'])
+
+
+def test_retiro_mitad_agotada_sin_mediana():
+    """Si se agota exactamente la mitad de los escenarios, la mediana no es una edad finita"""
+    simulacion = simular_retiro(400_000, 3_000, 0.07, 65, volatilidad=0.15, inflacion=0.02,
+                                num_escenarios=4, semilla=16)
+    
+    assert simulacion['probabilidad_agotamiento'] == 0.5
+    assert simulacion['edad_agotamiento_mediana'] is None
@@ -0,0 +1,56 @@
+"""
+Pruebas de la conversión de tasas compartida (tasas.py)
+"""
+import numpy as np
+import pytest
+
+from tasas import (
+    calcular_tasa_periodica,
+    calcular_tasa_periodica_cacheada,
+    calcular_tea_desde_tasa_periodica,
+    convertir_tea_a_tasa_periodica,
+    obtener_periodos_por_año,
+    obtener_periodos_por_año_arreglo
+)
+
+
+def test_tasa_periodica_coincide_con_formula():
+    """TEP = (1 + TEA)^(1/n) - 1 para escalares y arreglos"""
+    teas = np.linspace(0.0, 0.5, 101)
+    for frecuencia in ["Mensual", "Bimestral", "Trimestral", "Cuatrimestral", "Semestral", "Anual"]:
+        n = obtener_periodos_por_año(frecuencia)
+        esperado = (1 + teas) ** (1 / n) - 1
+        np.testing.assert_allclose(convertir_tea_a_tasa_periodica(teas, frecuencia), esperado,
+                                   rtol=1e-12, atol=1e-17)
+        assert abs(convertir_tea_a_tasa_periodica(0.12, frecuencia)
+                   - ((1.12) ** (1 / n) - 1)) < 1e-15
+
+
+def test_broadcasting_y_regreso_a_tea():
+    """Las TEAs y los periodos se combinan por broadcasting y la conversión es reversible"""
+    teas = np.array([0.05, 0.10, 0.20])[:, None]
+    periodos = np.array([1, 2, 4, 12])[None, :]
+    tasas = calcular_tasa_periodica(teas, periodos)
+    
+    assert tasas.shape == (3, 4)
+    np.testing.assert_allclose(calcular_tea_desde_tasa_periodica(tasas, periodos),
+                               np.broadcast_to(teas, (3, 4)), rtol=1e-14)
+
+
+def test_cache_y_frecuencias():
+    """Los escalares se memorizan; una frecuencia desconocida es anual solo como escalar"""
+    calcular_tasa_periodica_cacheada.cache_clear()
+    for _ in range(100):
+        convertir_tea_a_tasa_periodica(0.1, "Mensual")
+    info = calcular_tasa_periodica_cacheada.cache_info()
+    assert info.misses == 1 and info.hits == 99
+    
+    assert obtener_periodos_por_año("Quincenal") == 1
+    np.testing.assert_array_equal(
+        obtener_periodos_por_año_arreglo(["Mensual", "Anual", "Mensual", "Semestral"]),
+        [12, 1, 12, 2]
+    )
+    
+    with pytest.raises(ValueError, match=r"'Quincenal', 'mensual' \(filas 11, 13, 14\)"):
+        obtener_periodos_por_año_arreglo(["Mensual", "Quincenal", "Anual", "mensual", "Quincenal"],
+                                         filas=[10, 11, 12, 13, 14])
@@ -0,0 +1,57 @@
+"""
+Presupuesto de tiempo de importación de las calculadoras (arranque en frío)
+
+Se mide en un proceso nuevo el costo de importar bono y acciones por encima
+de la base que la app carga siempre (Streamlit, NumPy y Plotly; la portada
+no carga pandas). pandas y las dependencias de exportación (ReportLab,
+openpyxl, matplotlib) no deben cargarse hasta que se usen.
+"""
+import json
+import subprocess
+import sys
+
+# Segundos adicionales permitidos al importar bono y acciones sobre la base
+# (antes de diferir pandas y las exportaciones el costo era ~0.9 s; ahora ~0.04 s)
+PRESUPUESTO_IMPORTACION_S = 0.25
+REPETICIONES = 3
+
+DEPENDENCIAS_DIFERIDAS = ('pandas', 'reportlab', 'openpyxl', 'matplotlib', 'plotly.express')
+
+MEDICION = """
+import json, sys, time
+inicio = time.perf_counter()
+import streamlit, numpy, plotly.graph_objects
+base = time.perf_counter()
+import bono, acciones
+fin = time.perf_counter()
+print(json.dumps({'base': base - inicio, 'calculadoras': fin - base,
+                  'modulos': [m for m in %r if m in sys.modules]}))
+""" % (DEPENDENCIAS_DIFERIDAS,)
+
+
+def medir_importacion():
+    """Importa las calculadoras en un proceso nuevo y retorna los tiempos"""
+    salida = subprocess.run([sys.executable, "-c", MEDICION], capture_output=True,
+                            text=True, check=True)
+    return json.loads(salida.stdout.strip().splitlines()[-1])
+
+
+def test_dependencias_de_exportacion_diferidas():
+    """Importar las calculadoras no carga pandas, ReportLab, openpyxl ni matplotlib"""
+    assert medir_importacion()['modulos'] == []
+
+
+def test_app_no_importa_calculadoras_al_inicio():
+    """La portada no importa bono, acciones ni pandas"""
+    codigo = "import sys, app; print(sorted(m for m in ('bono', 'acciones', 'pandas') if m in sys.modules))"
+    salida = subprocess.run([sys.executable, "-c", codigo], capture_output=True, text=True,
+                            check=True)
+    assert salida.stdout.strip().splitlines()[-1] == "[]"
+
+
+def test_presupuesto_tiempo_importacion():
+    """El costo de importar las calculadoras queda dentro del presupuesto"""
+    mejor = min(medir_importacion()['calculadoras'] for _ in range(REPETICIONES))
+    print(f"Importación de bono + acciones: {mejor * 1000:.1f} ms "
+          f"(presupuesto {PRESUPUESTO_IMPORTACION_S * 1000:.0f} ms)")
+    assert mejor < PRESUPUESTO_IMPORTACION_S
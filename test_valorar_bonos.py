@@ -0,0 +1,75 @@
+"""
+Pruebas de la valoración por lotes desde archivo (valorar_bonos.py)
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.calculations.bond_calcs import calcular_precio_bono
+from valorar_bonos import main, valorar_archivo
+
+
+def crear_cartera(num_bonos, semilla=3):
+    rng = np.random.default_rng(semilla)
+    return pd.DataFrame({
+        'id_bono': np.arange(num_bonos),
+        'valor_nominal': rng.choice([1000.0, 10000.0, 20000.0], num_bonos),
+        'tasa_cupon_anual': rng.uniform(0.0, 0.15, num_bonos),
+        'frecuencia': rng.choice(["Mensual", "Trimestral", "Semestral", "Anual"], num_bonos),
+        'plazo_años': rng.integers(1, 31, num_bonos).astype(float),
+        'tasa_descuento_anual': rng.uniform(0.01, 0.20, num_bonos)
+    })
+
+
+@pytest.mark.parametrize("extension", [".csv", ".parquet"])
+def test_valoracion_por_lotes_coincide_con_motor(tmp_path, extension):
+    """Cada fila de salida conserva su entrada y el VP del motor escalar"""
+    cartera = crear_cartera(250)
+    entrada = tmp_path / f"cartera{extension}"
+    salida = tmp_path / f"valoracion{extension}"
+    if extension == ".csv":
+        cartera.to_csv(entrada, index=False)
+    else:
+        cartera.to_parquet(entrada, index=False)
+
+    avance = []
+    resumen = valorar_archivo(str(entrada), str(salida), tamano_lote=100,
+                              reportar=lambda bonos, segundos: avance.append(bonos))
+
+    assert resumen['bonos'] == 250 and resumen['lotes'] == 3
+    assert avance == [100, 200, 250]
+    resultado = pd.read_csv(salida) if extension == ".csv" else pd.read_parquet(salida)
+    assert resultado['id_bono'].tolist() == list(range(250))
+    for fila in resultado.sample(20, random_state=0).itertuples():
+        esperado = calcular_precio_bono(fila.valor_nominal, fila.tasa_cupon_anual,
+                                        fila.frecuencia, fila.plazo_años, fila.tasa_descuento_anual)
+        assert abs(fila.valor_presente - esperado) < 1e-6 * fila.valor_nominal
+        assert abs(fila.precio_pct - esperado / fila.valor_nominal * 100) < 1e-9
+
+
+def test_cli_reporta_error_de_columnas(tmp_path, capsys):
+    """Una cartera sin las columnas requeridas termina con código 1"""
+    entrada = tmp_path / "cartera.csv"
+    crear_cartera(5).drop(columns='frecuencia').to_csv(entrada, index=False)
+
+    assert main([str(entrada), str(tmp_path / "salida.csv"), "--silencioso"]) == 1
+    assert "frecuencia" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("extension", [".csv", ".parquet"])
+def test_cli_rechaza_frecuencia_desconocida(tmp_path, capsys, extension):
+    """Una frecuencia mal escrita no se valora como anual: se informa con su fila en el archivo"""
+    cartera = crear_cartera(250)
+    cartera.loc[180, 'frecuencia'] = "mensual"
+    entrada = tmp_path / f"cartera{extension}"
+    if extension == ".csv":
+        cartera.to_csv(entrada, index=False)
+    else:
+        cartera.to_parquet(entrada, index=False)
+
+    codigo = main([str(entrada), str(tmp_path / f"salida{extension}"),
+                   "--tamano-lote", "100", "--silencioso"])
+
+    error = capsys.readouterr().err
+    assert codigo == 1
+    assert "'mensual'" in error and "filas 180)" in error
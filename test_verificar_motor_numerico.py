@@ -0,0 +1,47 @@
+"""
+Pruebas del arnés de valores de referencia (verificar_motor_numerico.py)
+"""
+import numpy as np
+
+from rendimiento_bono import calcular_tea_desde_precio
+from verificar_motor_numerico import calcular_error_en_tolerancias, registrar, verificar_motor
+
+
+def test_motor_coincide_con_referencias():
+    """Una corrida pequeña en paralelo: ningún motor se aparta de su referencia con bucles"""
+    resumen = verificar_motor(num_casos=600, num_procesos=2, semilla=7, casos_por_bloque=200)
+
+    assert resumen
+    for motor, estado in resumen.items():
+        assert estado['comparaciones'] > 0, motor
+        assert estado['fallas'] == 0, (motor, estado['peor_caso'])
+
+
+def test_resultado_no_depende_del_numero_de_procesos():
+    """Las semillas son por bloque: 1 o 2 procesos dan el mismo resumen"""
+    secuencial = verificar_motor(num_casos=300, num_procesos=1, semilla=3, casos_por_bloque=100)
+    paralelo = verificar_motor(num_casos=300, num_procesos=2, semilla=3, casos_por_bloque=100)
+
+    assert secuencial == paralelo
+
+
+def test_registrar_detecta_desviaciones():
+    """Un valor perturbado más allá de la tolerancia es falla; NaN contra NaN no"""
+    esperado = np.array([100.0, 2500.0, np.nan])
+    obtenido = np.array([100.0, 2500.0 * (1 + 1e-6), np.nan])
+    resumen = {}
+
+    registrar(resumen, 'prueba', obtenido, esperado, lambda i: {'indice': i})
+
+    assert resumen['prueba']['comparaciones'] == 3
+    assert resumen['prueba']['fallas'] == 1
+    assert resumen['prueba']['peor_caso'] == {'indice': 1}
+    assert calcular_error_en_tolerancias(np.nan, np.nan, 1e-9, 1e-6) == 0.0
+    assert calcular_error_en_tolerancias(1.0, np.nan, 1e-9, 1e-6) == np.inf
+
+
+def test_tea_de_bono_cupon_cero_de_largo_plazo():
+    """Caso hallado por el arnés: sin cupón y muchos periodos, el precio en i = -99% desborda"""
+    precio = 100.0 / (1 + 0.3586) ** 40.5
+
+    assert abs(calcular_tea_desde_precio(precio, 100.0, 0.0, "Mensual", 40.5) - 0.3586) < 1e-9
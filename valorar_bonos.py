@@ -0,0 +1,99 @@
+"""
+Valoración por lotes de carteras de bonos desde la línea de comandos
+
+Lee las especificaciones (CSV o Parquet) por lotes, valora cada lote con
+calcular_valor_presente_bonos_lote y escribe los resultados a medida que se
+calculan, sin cargar la cartera completa en memoria.
+
+Uso:
+    python valorar_bonos.py cartera.csv valoracion.parquet --tamano-lote 200000
+
+Columnas requeridas: valor_nominal, tasa_cupon_anual, frecuencia, plazo_años,
+tasa_descuento_anual (tasas en decimal, frecuencia por nombre: "Semestral", ...).
+"""
+import argparse
+import sys
+
+from src.calculations.bond_calcs import COLUMNAS_LOTE_BONOS, calcular_valor_presente_bonos_lote
+from src.utils.batch_io import TAMANO_LOTE_POR_DEFECTO, formatear_avance, procesar_archivo
+
+# ==================== VALORACIÓN ====================
+
+def valorar_lote(bonos, metodo='cerrado'):
+    """
+    Agrega a un lote de bonos su valor presente y precio porcentual
+
+    Args:
+        bonos (pd.DataFrame): Columnas de COLUMNAS_LOTE_BONOS (puede tener más)
+        metodo (str): 'cerrado' o 'matriz' (ver calcular_valor_presente_bonos_lote)
+
+    Returns:
+        pd.DataFrame: Las columnas de entrada más 'valor_presente' y 'precio_pct'
+    """
+    valor_presente = calcular_valor_presente_bonos_lote(bonos, metodo=metodo)
+    return bonos.assign(
+        valor_presente=valor_presente,
+        precio_pct=valor_presente / bonos['valor_nominal'].to_numpy(dtype=float) * 100
+    )
+
+
+def valorar_archivo(ruta_entrada, ruta_salida, tamano_lote=TAMANO_LOTE_POR_DEFECTO,
+                    metodo='cerrado', reportar=None):
+    """
+    Valora una cartera completa de archivo a archivo
+
+    Args:
+        ruta_entrada (str): CSV o Parquet con las especificaciones
+        ruta_salida (str): CSV o Parquet de resultados
+        tamano_lote (int): Bonos por lote
+        metodo (str): 'cerrado' o 'matriz'
+        reportar (callable, opcional): Recibe (bonos_acumulados, segundos) tras cada lote
+
+    Returns:
+        dict: 'bonos', 'lotes', 'segundos' y 'bonos_por_segundo'
+    """
+    resumen = procesar_archivo(ruta_entrada, ruta_salida, lambda lote: valorar_lote(lote, metodo),
+                               tamano_lote, reportar)
+    return {
+        'bonos': resumen['filas'],
+        'lotes': resumen['lotes'],
+        'segundos': resumen['segundos'],
+        'bonos_por_segundo': resumen['filas_por_segundo']
+    }
+
+
+# ==================== LÍNEA DE COMANDOS ====================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Valoración por lotes de una cartera de bonos (CSV/Parquet)"
+    )
+    parser.add_argument('entrada', help="Especificaciones: " + ", ".join(COLUMNAS_LOTE_BONOS))
+    parser.add_argument('salida', help="Archivo de resultados (.csv o .parquet)")
+    parser.add_argument('--tamano-lote', type=int, default=TAMANO_LOTE_POR_DEFECTO,
+                        help="Bonos por lote (default: %(default)s)")
+    parser.add_argument('--metodo', choices=['cerrado', 'matriz'], default='cerrado',
+                        help="Fórmula cerrada o matriz de flujos (default: %(default)s)")
+    parser.add_argument('--silencioso', action='store_true', help="No reportar avance por lote")
+    args = parser.parse_args(argv)
+
+    if args.tamano_lote < 1:
+        parser.error("--tamano-lote debe ser mayor a 0")
+
+    def reportar(bonos, segundos):
+        print(formatear_avance(bonos, segundos, 'bonos'), file=sys.stderr)
+
+    try:
+        resumen = valorar_archivo(args.entrada, args.salida, args.tamano_lote, args.metodo,
+                                  reportar=None if args.silencioso else reportar)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    print(f"Total: {formatear_avance(resumen['bonos'], resumen['segundos'], 'bonos')} "
+          f"en {resumen['lotes']} lotes -> {args.salida}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
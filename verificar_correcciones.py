@@ -2,8 +2,6 @@
 Script de Verificación - Correcciones Realizadas
 Prueba las correcciones en gráficos e interpretaciones
 """
-import sys
-sys.path.append('c:\\Users\\jeanm\\Documents\\finanzas')
 
 print("\n" + "="*80)
 print("VERIFICACIÓN DE CORRECCIONES - GRÁFICOS E INTERPRETACIONES")
@@ -0,0 +1,412 @@
+"""
+Arnés de valores de referencia (golden values) del motor numérico
+
+Compara los motores vectorizados y de fórmula cerrada de bonos y de
+crecimiento/jubilación contra implementaciones de referencia con bucles
+(transcritas de las versiones originales de bono.py y acciones.py) sobre
+grandes conjuntos de entradas aleatorias: todas las frecuencias, plazos
+fraccionarios y TEAs de 0% hasta el 50% que permite validar_tasa.
+
+Cada comparación es tolerante al redondeo: un valor pasa si
+|obtenido - esperado| <= TOLERANCIA_ABSOLUTA + TOLERANCIA_RELATIVA × |esperado|.
+El "error" reportado es esa diferencia expresada en tolerancias (> 1 = falla).
+
+Los casos se reparten en bloques con semillas independientes
+(SeedSequence.spawn), de modo que el resultado es el mismo con cualquier
+número de procesos.
+
+Uso:
+    python verificar_motor_numerico.py --casos 50000 --procesos 4 --semilla 1
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from tasas import FRECUENCIAS
+
+# ==================== CONFIGURACIÓN ====================
+
+# Límite superior de las TEAs generadas (el máximo de validar_tasa)
+TEA_MAXIMA = 0.50
+
+# Tolerancias de montos (unidades monetarias) y de tasas (decimal)
+TOLERANCIA_RELATIVA = 1e-9
+TOLERANCIA_ABSOLUTA = 1e-6
+TOLERANCIA_TASA = 1e-9
+
+NUM_CASOS = 20_000
+CASOS_POR_BLOQUE = 1_000
+NUM_PROCESOS = os.cpu_count() or 1
+
+MONEDAS = ["PEN", "USD"]
+IMPUESTOS_REFERENCIA = {'USD': 0.295, 'PEN': 0.05}
+
+# ==================== REFERENCIAS CON BUCLES ====================
+
+def ref_tasa_periodica(tea, frecuencia):
+    """TEP = (1 + TEA)^(1/n) - 1, evaluada de forma directa"""
+    n = FRECUENCIAS.get(frecuencia, 1)
+    return (1 + tea) ** (1 / n) - 1
+
+
+def ref_valor_presente_bono(valor_nominal, tasa_cupon_anual, frecuencia, plazo_años, tasa_descuento_anual):
+    """Valoración flujo por flujo y medidas de riesgo por sumas explícitas"""
+    periodos_por_año = FRECUENCIAS.get(frecuencia, 1)
+    num_periodos = int(plazo_años * periodos_por_año)
+    tasa_descuento_periodica = ref_tasa_periodica(tasa_descuento_anual, frecuencia)
+    cupon_periodico = valor_nominal * ref_tasa_periodica(tasa_cupon_anual, frecuencia)
+
+    valores_presentes = []
+    vp_acumulado = []
+    suma = 0
+    for periodo in range(1, num_periodos + 1):
+        flujo = cupon_periodico + (valor_nominal if periodo == num_periodos else 0)
+        vp = flujo / ((1 + tasa_descuento_periodica) ** periodo)
+        valores_presentes.append(vp)
+        suma += vp
+        vp_acumulado.append(suma)
+
+    suma_tiempos = 0
+    suma_convexidad = 0
+    for periodo, vp in enumerate(valores_presentes, start=1):
+        t = periodo / periodos_por_año
+        suma_tiempos += t * vp
+        suma_convexidad += t * (t + 1) * vp
+
+    duracion = suma_tiempos / suma if suma else 0.0
+    return {
+        'num_periodos': num_periodos,
+        'cupon_periodico': cupon_periodico,
+        'valor_presente_total': suma,
+        'valores_presentes': valores_presentes,
+        'vp_acumulado': vp_acumulado,
+        'duracion_macaulay': duracion,
+        'duracion_modificada': duracion / (1 + tasa_descuento_anual),
+        'convexidad': suma_convexidad / (suma * (1 + tasa_descuento_anual) ** 2) if suma else 0.0
+    }
+
+
+def ref_crecimiento_aportes(monto_inicial, aporte_periodico, tea, frecuencia, plazo_años):
+    """Capitalización periodo a periodo con aporte al final de cada periodo"""
+    tasa_periodica = ref_tasa_periodica(tea, frecuencia)
+    total_periodos = int(plazo_años * FRECUENCIAS.get(frecuencia, 1))
+
+    saldos_finales = [monto_inicial]
+    intereses = [0]
+    aportes_acumulados = [monto_inicial]
+    intereses_acumulados = [0]
+    saldo = monto_inicial
+    total_aportado = monto_inicial
+    total_interes = 0
+    for _ in range(total_periodos):
+        interes = saldo * tasa_periodica
+        saldo = saldo + interes + aporte_periodico
+        total_aportado += aporte_periodico
+        total_interes += interes
+        saldos_finales.append(saldo)
+        intereses.append(interes)
+        aportes_acumulados.append(total_aportado)
+        intereses_acumulados.append(total_interes)
+
+    return {
+        'saldos_finales': saldos_finales,
+        'intereses': intereses,
+        'aportes_acumulados': aportes_acumulados,
+        'intereses_acumulados': intereses_acumulados,
+        'saldo_final': saldo,
+        'total_aportado': total_aportado
+    }
+
+
+def ref_crecimiento_deposito_unico(monto_inicial, tea, plazo_años):
+    return [monto_inicial * ((1 + tea) ** año) for año in range(int(plazo_años) + 1)]
+
+
+def ref_impuesto(capital_final, total_aportado, moneda):
+    ganancia = capital_final - total_aportado
+    if ganancia <= 0:
+        return 0
+    return ganancia * IMPUESTOS_REFERENCIA.get(moneda, 0)
+
+
+def ref_pension_mensual(capital_neto, tea_retiro, años_retiro=None):
+    tasa_mensual = ref_tasa_periodica(tea_retiro, "Mensual")
+    if años_retiro is None or años_retiro >= 100:
+        return capital_neto * tasa_mensual
+    n_meses = int(años_retiro * 12)
+    if tasa_mensual > 0:
+        return capital_neto * (tasa_mensual * (1 + tasa_mensual) ** n_meses) / \
+               ((1 + tasa_mensual) ** n_meses - 1)
+    return capital_neto / n_meses
+
+# ==================== CASOS ALEATORIOS ====================
+
+def generar_teas(rng, num_casos):
+    """TEAs uniformes en [0, TEA_MAXIMA] con los extremos (0% y 50%) siempre presentes"""
+    teas = rng.uniform(0, TEA_MAXIMA, num_casos)
+    extremos = rng.random(num_casos)
+    teas[extremos < 0.05] = 0.0
+    teas[extremos > 0.95] = TEA_MAXIMA
+    return teas
+
+
+def generar_casos_bonos(rng, num_casos):
+    """Bonos aleatorios: plazos de 0.25 a 50 años en cuartos de año (algunos sin periodos)"""
+    return {
+        'valor_nominal': rng.choice([100.0, 1000.0, 20000.0, 1e6], num_casos),
+        'tasa_cupon_anual': generar_teas(rng, num_casos),
+        'frecuencia': rng.choice(list(FRECUENCIAS), num_casos),
+        'plazo_años': rng.integers(1, 201, num_casos) / 4,
+        'tasa_descuento_anual': generar_teas(rng, num_casos)
+    }
+
+
+def generar_casos_planes(rng, num_casos):
+    """Planes de jubilación aleatorios con las opciones de la interfaz"""
+    edad_actual = rng.integers(18, 70, num_casos)
+    return {
+        'edad_actual': edad_actual,
+        'edad_jubilacion': np.minimum(edad_actual + rng.integers(1, 50, num_casos), 100),
+        'monto_inicial': rng.uniform(0, 100_000, num_casos).round(2),
+        'aporte_periodico': rng.uniform(0, 5_000, num_casos).round(2),
+        'frecuencia': rng.choice(["Mensual", "Trimestral", "Semestral", "Anual"], num_casos),
+        'tea': generar_teas(rng, num_casos),
+        'moneda': rng.choice(MONEDAS, num_casos),
+        'opcion_retiro': np.full(num_casos, "Pensión mensual"),
+        'tea_retiro': generar_teas(rng, num_casos),
+        'años_retiro': rng.choice([np.nan, 1.0, 10.0, 25.0, 50.0, 100.0], num_casos)
+    }
+
+
+def extraer_caso(casos, i):
+    """Entradas del caso i como dict de escalares de Python (para reportar)"""
+    return {clave: valores[i].item() for clave, valores in casos.items()}
+
+# ==================== COMPARACIÓN CON TOLERANCIA ====================
+
+def calcular_error_en_tolerancias(obtenido, esperado, tolerancia_relativa, tolerancia_absoluta):
+    """
+    Diferencia expresada en tolerancias: > 1 significa fuera de tolerancia
+
+    NaN contra NaN (e infinito contra el mismo infinito) cuenta como igual.
+    """
+    obtenido = np.asarray(obtenido, dtype=float)
+    esperado = np.asarray(esperado, dtype=float)
+    if obtenido.shape != esperado.shape:
+        return np.full(max(obtenido.size, esperado.size, 1), np.inf)
+
+    iguales = (obtenido == esperado) | (np.isnan(obtenido) & np.isnan(esperado))
+    with np.errstate(invalid='ignore'):
+        error = np.abs(obtenido - esperado) / (tolerancia_absoluta + tolerancia_relativa * np.abs(esperado))
+    return np.where(iguales, 0.0, np.nan_to_num(error, nan=np.inf))
+
+
+def registrar(resumen, motor, obtenido, esperado, caso, tolerancia_relativa=TOLERANCIA_RELATIVA,
+              tolerancia_absoluta=TOLERANCIA_ABSOLUTA):
+    """
+    Acumula en resumen[motor] las comparaciones, fallas y el peor caso
+
+    Args:
+        resumen (dict): motor → {'comparaciones', 'fallas', 'peor_error', 'peor_caso'}
+        motor (str): Nombre del motor y la magnitud comparada
+        obtenido, esperado: Escalares o arreglos del mismo largo
+        caso (dict | callable): Entradas del caso, o función índice → entradas
+            cuando se compara un lote
+    """
+    error = np.atleast_1d(calcular_error_en_tolerancias(obtenido, esperado,
+                                                         tolerancia_relativa, tolerancia_absoluta))
+    estado = resumen.setdefault(motor, {'comparaciones': 0, 'fallas': 0, 'peor_error': 0.0, 'peor_caso': None})
+    estado['comparaciones'] += error.size
+    estado['fallas'] += int(np.count_nonzero(error > 1))
+    if error.size == 0:
+        return
+
+    peor = int(np.argmax(error))
+    if error[peor] > estado['peor_error']:
+        estado['peor_error'] = float(error[peor])
+        estado['peor_caso'] = caso(peor) if callable(caso) else caso
+
+
+def combinar_resumenes(resumenes):
+    """Suma los resúmenes de varios bloques conservando el peor caso global"""
+    total = {}
+    for resumen in resumenes:
+        for motor, estado in resumen.items():
+            acumulado = total.setdefault(motor, {'comparaciones': 0, 'fallas': 0,
+                                                 'peor_error': 0.0, 'peor_caso': None})
+            acumulado['comparaciones'] += estado['comparaciones']
+            acumulado['fallas'] += estado['fallas']
+            if estado['peor_error'] > acumulado['peor_error']:
+                acumulado['peor_error'] = estado['peor_error']
+                acumulado['peor_caso'] = estado['peor_caso']
+    return dict(sorted(total.items()))
+
+# ==================== VERIFICACIÓN POR BLOQUE ====================
+
+def verificar_bonos(rng, num_casos, resumen):
+    """Motor escalar, fórmula cerrada, lotes, medidas de riesgo y rendimiento de bonos"""
+    from src.calculations.bond_calcs import (
+        calcular_valor_presente_bono_completo,
+        calcular_precio_bono,
+        calcular_valor_presente_bonos_lote,
+        calcular_medidas_riesgo_bonos_lote
+    )
+    from rendimiento_bono import calcular_tea_desde_precio_lote
+
+    casos = generar_casos_bonos(rng, num_casos)
+    referencias = []
+    for i in range(num_casos):
+        caso = extraer_caso(casos, i)
+        argumentos = (caso['valor_nominal'], caso['tasa_cupon_anual'], caso['frecuencia'],
+                      caso['plazo_años'], caso['tasa_descuento_anual'])
+        esperado = ref_valor_presente_bono(*argumentos)
+        referencias.append(esperado)
+
+        completo = calcular_valor_presente_bono_completo(*argumentos)
+        for clave in ('valor_presente_total', 'cupon_periodico', 'valores_presentes', 'vp_acumulado'):
+            registrar(resumen, f"bono_completo.{clave}", completo[clave], esperado[clave], caso)
+        for clave in ('duracion_macaulay', 'duracion_modificada', 'convexidad'):
+            registrar(resumen, f"bono_completo.{clave}", completo[clave], esperado[clave], caso)
+        registrar(resumen, "precio_bono_cerrado", calcular_precio_bono(*argumentos),
+                  esperado['valor_presente_total'], caso)
+
+    def caso_lote(i):
+        return extraer_caso(casos, i)
+
+    valor_presente = np.array([r['valor_presente_total'] for r in referencias])
+    for metodo in ('cerrado', 'matriz'):
+        registrar(resumen, f"bonos_lote.{metodo}", calcular_valor_presente_bonos_lote(casos, metodo=metodo),
+                  valor_presente, caso_lote)
+
+    medidas = calcular_medidas_riesgo_bonos_lote(casos)
+    for clave in ('duracion_macaulay', 'duracion_modificada'):
+        registrar(resumen, f"medidas_riesgo_lote.{clave}", medidas[clave],
+                  [r[clave] for r in referencias], caso_lote)
+
+    # Ida y vuelta precio → TEA en los bonos con al menos un periodo
+    con_periodos = np.array([r['num_periodos'] > 0 for r in referencias])
+    subconjunto = {clave: valores[con_periodos] for clave, valores in casos.items()}
+    subconjunto['precio'] = valor_presente[con_periodos]
+    indices = np.flatnonzero(con_periodos)
+    registrar(resumen, "tea_desde_precio_lote", calcular_tea_desde_precio_lote(subconjunto),
+              subconjunto['tasa_descuento_anual'], lambda i: extraer_caso(casos, indices[i]),
+              tolerancia_relativa=0.0, tolerancia_absoluta=TOLERANCIA_TASA)
+
+
+def verificar_planes(rng, num_casos, resumen):
+    """Crecimiento con aportes, depósito único, escenarios y planes completos (Módulos A y B)"""
+    from acciones import (
+        calcular_crecimiento_aportes_periodicos,
+        calcular_crecimiento_deposito_unico,
+        calcular_matriz_escenarios
+    )
+    from src.calculations.retirement_calcs import calcular_planes_jubilacion_lote
+
+    casos = generar_casos_planes(rng, num_casos)
+    saldos, impuestos, pensiones = [], [], []
+    for i in range(num_casos):
+        caso = extraer_caso(casos, i)
+        plazo = caso['edad_jubilacion'] - caso['edad_actual']
+        argumentos = (caso['monto_inicial'], caso['aporte_periodico'], caso['tea'], caso['frecuencia'], plazo)
+        esperado = ref_crecimiento_aportes(*argumentos)
+
+        obtenido = calcular_crecimiento_aportes_periodicos(*argumentos)
+        for clave in ('saldos_finales', 'intereses', 'aportes_acumulados',
+                      'intereses_acumulados', 'saldo_final', 'total_aportado'):
+            registrar(resumen, f"aportes_periodicos.{clave}", obtenido[clave], esperado[clave], caso)
+
+        deposito = calcular_crecimiento_deposito_unico(caso['monto_inicial'], caso['tea'], plazo)
+        registrar(resumen, "deposito_unico.saldos", deposito['saldos'],
+                  ref_crecimiento_deposito_unico(caso['monto_inicial'], caso['tea'], plazo), caso)
+
+        escenario = calcular_matriz_escenarios(
+            caso['monto_inicial'], caso['aporte_periodico'], caso['frecuencia'],
+            caso['edad_actual'], [caso['edad_jubilacion']], [caso['tea']]
+        )
+        registrar(resumen, "matriz_escenarios", escenario[0, 0], esperado['saldo_final'], caso)
+
+        impuesto = ref_impuesto(esperado['saldo_final'], esperado['total_aportado'], caso['moneda'])
+        años_retiro = None if np.isnan(caso['años_retiro']) else caso['años_retiro']
+        saldos.append(esperado['saldo_final'])
+        impuestos.append(impuesto)
+        pensiones.append(ref_pension_mensual(esperado['saldo_final'] - impuesto, caso['tea_retiro'], años_retiro))
+
+    def caso_lote(i):
+        return extraer_caso(casos, i)
+
+    planes = calcular_planes_jubilacion_lote(casos)
+    registrar(resumen, "planes_lote.saldo_final", planes['saldo_final'], saldos, caso_lote)
+    registrar(resumen, "planes_lote.impuesto", planes['impuesto'], impuestos, caso_lote)
+    registrar(resumen, "planes_lote.pension_mensual", planes['pension_mensual'], pensiones, caso_lote)
+
+
+def verificar_bloque(semilla, num_casos):
+    """
+    Verifica un bloque de casos de bonos y de planes generados con su propia semilla
+
+    Args:
+        semilla (np.random.SeedSequence): Semilla del bloque
+        num_casos (int): Casos de cada tipo
+
+    Returns:
+        dict: Resumen por motor (ver registrar)
+    """
+    semilla_bonos, semilla_planes = semilla.spawn(2)
+    resumen = {}
+    verificar_bonos(np.random.default_rng(semilla_bonos), num_casos, resumen)
+    verificar_planes(np.random.default_rng(semilla_planes), num_casos, resumen)
+    return resumen
+
+
+def verificar_motor(num_casos=NUM_CASOS, num_procesos=1, semilla=0, casos_por_bloque=CASOS_POR_BLOQUE):
+    """
+    Ejecuta el arnés completo, en paralelo por bloques si num_procesos > 1
+
+    Returns:
+        dict: Resumen combinado por motor
+    """
+    num_bloques = max(1, -(-num_casos // casos_por_bloque))
+    tamaños = [num_casos // num_bloques + (i < num_casos % num_bloques) for i in range(num_bloques)]
+    semillas = np.random.SeedSequence(semilla).spawn(num_bloques)
+
+    if num_procesos > 1 and num_bloques > 1:
+        with ProcessPoolExecutor(max_workers=min(num_procesos, num_bloques)) as pool:
+            resumenes = list(pool.map(verificar_bloque, semillas, tamaños))
+    else:
+        resumenes = [verificar_bloque(s, n) for s, n in zip(semillas, tamaños)]
+    return combinar_resumenes(resumenes)
+
+# ==================== LÍNEA DE COMANDOS ====================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compara el motor numérico con referencias con bucles")
+    parser.add_argument('--casos', type=int, default=NUM_CASOS,
+                        help="Casos de bonos y de planes (default: %(default)s)")
+    parser.add_argument('--procesos', type=int, default=NUM_PROCESOS,
+                        help="Procesos en paralelo (default: %(default)s)")
+    parser.add_argument('--semilla', type=int, default=0, help="Semilla (default: %(default)s)")
+    parser.add_argument('--casos-por-bloque', type=int, default=CASOS_POR_BLOQUE,
+                        help="Casos por bloque (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    inicio = time.perf_counter()
+    resumen = verificar_motor(args.casos, args.procesos, args.semilla, args.casos_por_bloque)
+    segundos = time.perf_counter() - inicio
+
+    print(f"{'Motor':<42} {'Comparaciones':>14} {'Fallas':>8} {'Peor error (tol.)':>18}")
+    for motor, estado in resumen.items():
+        print(f"{motor:<42} {estado['comparaciones']:>14,} {estado['fallas']:>8,} {estado['peor_error']:>18.3g}")
+
+    fallidos = {motor: estado for motor, estado in resumen.items() if estado['fallas']}
+    for motor, estado in fallidos.items():
+        print(f"\n❌ {motor}: peor caso {estado['peor_caso']}")
+    print(f"\n{args.casos:,} casos (semilla {args.semilla}) en {segundos:.1f} s")
+    return 1 if fallidos else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())